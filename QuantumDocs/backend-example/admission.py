@@ -0,0 +1,157 @@
+"""
+Control de admisión de simulaciones según la memoria estimada.
+Antes de ejecutar se estima la memoria del método y la precisión pedidos;
+si no cabe en el presupuesto se prueba precisión simple y después MPS, y si
+aun así no cabe la petición se rechaza. Las peticiones que caben pero no hay
+memoria libre en ese momento esperan en cola hasta un tiempo máximo.
+"""
+
+import os
+import threading
+
+from simulators import is_clifford, select_method
+
+# Presupuesto total de memoria para simulaciones simultáneas
+MEMORY_BUDGET_MB = float(os.environ.get('QSIM_MEMORY_BUDGET_MB', 2048))
+
+# Segundos que una petición puede esperar memoria libre (0 = rechazar sin esperar)
+QUEUE_TIMEOUT = float(os.environ.get('QSIM_QUEUE_TIMEOUT', 30))
+
+# Dimensión de enlace con la que se acota la memoria al pasar a MPS automáticamente
+DEFAULT_MPS_BOND_DIMENSION = int(os.environ.get('QSIM_MPS_BOND_DIMENSION', 64))
+
+# Bytes por amplitud compleja
+BYTES_PER_AMPLITUDE = {'double': 16, 'single': 8}
+
+# Memoria fija del proceso de simulación (estructuras de Aer, transpilación)
+BASE_OVERHEAD_MB = 16
+
+
+class AdmissionError(Exception):
+    """Petición que no se puede simular dentro del presupuesto"""
+
+    def __init__(self, message, status_code=413, estimate_mb=None):
+        super().__init__(message)
+        self.status_code = status_code
+        self.estimate_mb = estimate_mb
+
+
+def estimate_memory_mb(num_qubits, method, precision='double', max_bond_dimension=None):
+    """
+    Memoria aproximada (MB) de una simulación:
+    - statevector: 2ⁿ amplitudes; density_matrix y unitary: 4ⁿ
+    - stabilizer: tabla de 2n x 2n bits
+    - matrix_product_state: n tensores de 2·χ² amplitudes (χ = dimensión de enlace)
+    """
+    amplitude = BYTES_PER_AMPLITUDE[precision]
+    if method == 'statevector':
+        size = amplitude * 2.0**num_qubits
+    elif method in ('density_matrix', 'unitary'):
+        size = amplitude * 4.0**num_qubits
+    elif method == 'stabilizer':
+        size = (2 * num_qubits) * (2 * num_qubits + 1) / 8
+    elif method == 'matrix_product_state':
+        chi = max_bond_dimension or DEFAULT_MPS_BOND_DIMENSION
+        chi = min(chi, 2.0**(num_qubits // 2))
+        size = amplitude * num_qubits * 2 * chi**2
+    else:
+        raise AdmissionError(f"Método sin estimación de memoria: {method}", status_code=400)
+    return BASE_OVERHEAD_MB + size / 2**20
+
+
+def plan_simulation(circuit, method=None, precision=None, max_bond_dimension=None,
+                    budget_mb=None):
+    """
+    Elige método y precisión que quepan en el presupuesto.
+    Devuelve un diccionario con method, precision, max_bond_dimension,
+    memory_mb y downgrades (cambios aplicados respecto a lo pedido).
+    """
+    budget_mb = MEMORY_BUDGET_MB if budget_mb is None else budget_mb
+    method = method or select_method(circuit)
+    if method == 'stabilizer' and not is_clifford(circuit):
+        raise AdmissionError("El método stabilizer solo admite circuitos de Clifford", status_code=400)
+    precision = precision or 'double'
+    capped = []
+    if method == 'matrix_product_state' and max_bond_dimension is None:
+        # Sin límite la memoria de MPS no está acotada: se aplica el límite por defecto
+        # (y se avisa, porque el resultado puede quedar truncado)
+        max_bond_dimension = DEFAULT_MPS_BOND_DIMENSION
+        capped = [f'max_bond_dimension={max_bond_dimension}']
+    if precision not in BYTES_PER_AMPLITUDE:
+        raise AdmissionError(f"Precisión desconocida: {precision}", status_code=400)
+    n = circuit.num_qubits
+
+    candidates = [(method, precision, max_bond_dimension, capped)]
+    if precision == 'double' and method != 'stabilizer':
+        candidates.append((method, 'single', max_bond_dimension, capped + ['precision: single']))
+    if method in ('statevector', 'density_matrix'):
+        # MPS con dimensión de enlace acotada: memoria lineal en n, con truncamiento
+        bond = max_bond_dimension or DEFAULT_MPS_BOND_DIMENSION
+        candidates.append(('matrix_product_state', precision, bond,
+                           [f'method: matrix_product_state (χ ≤ {bond})']))
+        candidates.append(('matrix_product_state', 'single', bond,
+                           ['precision: single', f'method: matrix_product_state (χ ≤ {bond})']))
+
+    for candidate_method, candidate_precision, bond, downgrades in candidates:
+        memory = estimate_memory_mb(n, candidate_method, candidate_precision, bond)
+        if memory <= budget_mb:
+            return {
+                'method': candidate_method,
+                'precision': candidate_precision,
+                'max_bond_dimension': bond,
+                'memory_mb': round(memory, 2),
+                'downgrades': downgrades,
+            }
+
+    requested = estimate_memory_mb(n, method, precision, max_bond_dimension)
+    raise AdmissionError(f"La simulación de {n} qubits necesita ~{requested:.0f} MB "
+                         f"y el presupuesto es {budget_mb:.0f} MB", estimate_mb=requested)
+
+
+class MemoryBudget:
+    """Reserva de memoria compartida por las peticiones en curso (con cola de espera)"""
+
+    def __init__(self, budget_mb=MEMORY_BUDGET_MB, timeout=QUEUE_TIMEOUT):
+        self.budget_mb = budget_mb
+        self.timeout = timeout
+        self.in_use_mb = 0.0
+        self._condition = threading.Condition()
+
+    def reserve(self, memory_mb, timeout=None):
+        """
+        Context manager: espera a que haya memoria libre (hasta timeout segundos;
+        por defecto el de la cola, 0 = sin esperar) y la libera al salir
+        """
+        return _Reservation(self, memory_mb, self.timeout if timeout is None else timeout)
+
+    def _acquire(self, memory_mb, timeout):
+        if memory_mb > self.budget_mb:
+            raise AdmissionError(f"La simulación necesita ~{memory_mb:.0f} MB y el presupuesto "
+                                 f"es {self.budget_mb:.0f} MB", estimate_mb=memory_mb)
+        with self._condition:
+            fits = self._condition.wait_for(
+                lambda: self.in_use_mb + memory_mb <= self.budget_mb, timeout=timeout)
+            if not fits:
+                raise AdmissionError("Servidor ocupado: no hay memoria libre para la simulación",
+                                     status_code=503, estimate_mb=memory_mb)
+            self.in_use_mb += memory_mb
+
+    def _release(self, memory_mb):
+        with self._condition:
+            self.in_use_mb -= memory_mb
+            self._condition.notify_all()
+
+
+class _Reservation:
+    def __init__(self, budget, memory_mb, timeout):
+        self.budget = budget
+        self.memory_mb = memory_mb
+        self.timeout = timeout
+
+    def __enter__(self):
+        self.budget._acquire(self.memory_mb, self.timeout)
+        return self
+
+    def __exit__(self, *exc):
+        self.budget._release(self.memory_mb)
+        return False
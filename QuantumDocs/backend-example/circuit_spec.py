@@ -0,0 +1,276 @@
+"""
+Descripción declarativa de circuitos para /api/simulate (sin exec).
+Acepta una lista de puertas en JSON o texto OpenQASM 2/3 y lo convierte
+directamente en un QuantumCircuit. Cada circuito tiene una huella estructural
+con la que se cachean el análisis y los resultados antes de simular.
+"""
+
+import ast
+import hashlib
+import json
+import operator
+import os
+import re
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+
+import numpy as np
+from qiskit import ClassicalRegister, QuantumCircuit, qasm2, qasm3
+from qiskit.circuit import Clbit, Parameter
+from qiskit.circuit.library import get_standard_gate_name_mapping
+from qiskit.exceptions import MissingOptionalLibraryError
+
+# Puertas admitidas: todas las estándar de Qiskit (h, cx, rz, u, ccx, swap...)
+STANDARD_GATES = get_standard_gate_name_mapping()
+
+# Instrucciones que no son puertas unitarias
+DIRECTIVES = {'measure', 'barrier', 'reset'}
+
+# Anchura máxima aceptada (se comprueba antes de construir el circuito, es decir,
+# antes del control de admisión: el propio QuantumCircuit ocupa memoria por bit)
+MAX_QUBITS = int(os.environ.get('QSIM_MAX_QUBITS', 1024))
+MAX_CLBITS = int(os.environ.get('QSIM_MAX_CLBITS', 1024))
+
+# Declaraciones de registros en OpenQASM 2 (qreg q[5];) y 3 (qubit[5] q; bit c;)
+_QASM_REGISTERS = re.compile(r'\b(?:(qreg|creg)\s+\w+\s*\[\s*(\d+)\s*\]'
+                             r'|(qubit|bit)\s*(?:\[\s*(\d+)\s*\])?\s+[A-Za-z_])')
+
+# Resultados guardados (por huella del circuito y opciones de simulación)
+RESULT_CACHE_SIZE = int(os.environ.get('QSIM_RESULT_CACHE_SIZE', 256))
+
+# Operaciones permitidas en los parámetros escritos como texto ("pi/2", "-3*pi/4")
+_OPERATORS = {ast.Add: operator.add, ast.Sub: operator.sub, ast.Mult: operator.mul,
+              ast.Div: operator.truediv, ast.USub: operator.neg, ast.UAdd: operator.pos}
+
+# Exponente máximo en los parámetros ("pi**2"): todo se evalúa en float, así que una
+# potencia enorme da OverflowError en vez de calcular enteros sin límite
+MAX_PARAMETER_EXPONENT = 64
+_CONSTANTS = {'pi': np.pi, 'π': np.pi, 'tau': 2 * np.pi, 'e': np.e}
+
+
+class CircuitSpecError(ValueError):
+    """Descripción de circuito inválida (se responde con 400)"""
+
+
+def parse_parameter(value, symbols=None):
+    """
+    Número o expresión aritmética con pi, evaluada sin eval.
+    Con symbols (diccionario nombre -> Parameter) los nombres desconocidos
+    se convierten en parámetros libres ("theta", "2*phi + pi/2").
+    """
+    if isinstance(value, bool):
+        raise CircuitSpecError(f"Parámetro inválido: {value!r}")
+    if isinstance(value, (int, float)):
+        return float(value)
+    if not isinstance(value, str):
+        raise CircuitSpecError(f"Parámetro inválido: {value!r}")
+
+    def power(base, exponent):
+        if not isinstance(exponent, float) or abs(exponent) > MAX_PARAMETER_EXPONENT:
+            raise CircuitSpecError(f"Exponente no admitido en el parámetro: {value!r}")
+        return base ** exponent
+
+    def evaluate(node):
+        if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)) \
+                and not isinstance(node.value, bool):
+            return float(node.value)
+        if isinstance(node, ast.BinOp) and isinstance(node.op, ast.Pow):
+            return power(evaluate(node.left), evaluate(node.right))
+        if isinstance(node, ast.Name) and node.id in _CONSTANTS:
+            return _CONSTANTS[node.id]
+        if isinstance(node, ast.Name) and symbols is not None:
+            return symbols.setdefault(node.id, Parameter(node.id))
+        if isinstance(node, ast.BinOp) and type(node.op) in _OPERATORS:
+            return _OPERATORS[type(node.op)](evaluate(node.left), evaluate(node.right))
+        if isinstance(node, ast.UnaryOp) and type(node.op) in _OPERATORS:
+            return _OPERATORS[type(node.op)](evaluate(node.operand))
+        raise CircuitSpecError(f"Expresión no admitida en el parámetro: {value!r}")
+
+    try:
+        result = evaluate(ast.parse(value, mode='eval').body)
+    except (SyntaxError, ArithmeticError):
+        raise CircuitSpecError(f"Expresión no admitida en el parámetro: {value!r}")
+    if isinstance(result, complex) or (isinstance(result, float) and not np.isfinite(result)):
+        raise CircuitSpecError(f"El parámetro no es un número real finito: {value!r}")
+    return result
+
+
+def standard_gate(name, params=(), num_qubits=None, symbols=None):
+    """Puerta estándar de Qiskit por nombre, comprobando qubits y parámetros"""
+    if name not in STANDARD_GATES or name in DIRECTIVES:
+        raise CircuitSpecError(f"Puerta desconocida: {name!r}")
+    template = STANDARD_GATES[name]
+    params = [parse_parameter(p, symbols) for p in params]
+    if len(params) != len(template.params) or (num_qubits is not None
+                                                and num_qubits != template.num_qubits):
+        raise CircuitSpecError(f"{name} necesita {template.num_qubits} qubits y "
+                               f"{len(template.params)} parámetros")
+    return template.base_class(*params)
+
+
+def circuit_from_json(spec):
+    """
+    Construye el circuito desde una lista de puertas:
+    {"num_qubits": 2, "num_clbits": 2,
+     "gates": [{"name": "h", "qubits": [0]},
+               {"name": "rz", "qubits": [1], "params": ["pi/4"]},
+               {"name": "cx", "qubits": [0, 1]},
+               {"name": "measure", "qubits": [0, 1], "clbits": [0, 1]}]}
+    Los parámetros con nombres libres ("theta") quedan como Parameter del circuito.
+    """
+    if not isinstance(spec, dict):
+        raise CircuitSpecError('"circuit" debe ser un objeto')
+    num_qubits = spec.get('num_qubits')
+    num_clbits = spec.get('num_clbits', 0)
+    if not isinstance(num_qubits, int) or num_qubits < 1:
+        raise CircuitSpecError('"num_qubits" debe ser un entero positivo')
+    if not isinstance(num_clbits, int) or num_clbits < 0:
+        raise CircuitSpecError('"num_clbits" debe ser un entero no negativo')
+    check_width(num_qubits, num_clbits)
+
+    qc = QuantumCircuit(num_qubits, num_clbits)
+    symbols = {}
+    for position, gate in enumerate(spec.get('gates', [])):
+        if not isinstance(gate, dict):
+            raise CircuitSpecError(f"Puerta {position}: debe ser un objeto")
+        name = str(gate.get('name', '')).lower()
+        qubits = gate.get('qubits', [])
+        clbits = gate.get('clbits', [])
+        try:
+            if name == 'measure':
+                if len(qubits) != len(clbits):
+                    raise CircuitSpecError("measure necesita tantos clbits como qubits")
+                qc.measure(qubits, clbits)
+            elif name == 'barrier':
+                qc.barrier(*(qubits or range(num_qubits)))
+            elif name == 'reset':
+                qc.reset(qubits)
+            else:
+                qc.append(standard_gate(name, gate.get('params', []), len(qubits), symbols), qubits)
+        except CircuitSpecError as e:
+            raise CircuitSpecError(f"Puerta {position}: {e}")
+        except Exception as e:
+            # Índices fuera de rango, qubits repetidos...
+            raise CircuitSpecError(f"Puerta {position} ({name}): {e}")
+    return qc
+
+
+def check_width(num_qubits, num_clbits):
+    """Rechaza circuitos más anchos que MAX_QUBITS / MAX_CLBITS"""
+    if num_qubits > MAX_QUBITS:
+        raise CircuitSpecError(f"El circuito tiene {num_qubits} qubits; el máximo es {MAX_QUBITS}")
+    if num_clbits > MAX_CLBITS:
+        raise CircuitSpecError(f"El circuito tiene {num_clbits} clbits; el máximo es {MAX_CLBITS}")
+
+
+def _qasm_width(text):
+    """(qubits, clbits) declarados en el texto OpenQASM, sin llegar a parsearlo"""
+    width = {'quantum': 0, 'classical': 0}
+    for old_kind, old_size, new_kind, new_size in _QASM_REGISTERS.findall(text):
+        kind = old_kind or new_kind
+        size = old_size or new_size or '1'
+        # Tamaños absurdamente largos cuentan como "demasiado grandes" sin convertir a int
+        size = int(size) if len(size) <= 9 else 10**9
+        width['quantum' if kind in ('qreg', 'qubit') else 'classical'] += size
+    return width['quantum'], width['classical']
+
+
+def circuit_from_qasm(text):
+    """Circuito desde OpenQASM 2 u OpenQASM 3 (este necesita qiskit-qasm3-import)"""
+    check_width(*_qasm_width(text))
+    try:
+        if text.lstrip().startswith('OPENQASM 2'):
+            return qasm2.loads(text)
+        return qasm3.loads(text)
+    except MissingOptionalLibraryError:
+        raise CircuitSpecError("OpenQASM 3 necesita el paquete qiskit-qasm3-import")
+    except Exception as e:
+        raise CircuitSpecError(f"OpenQASM inválido: {e}")
+
+
+@lru_cache(maxsize=1024)
+def _parse_cached(kind, text):
+    if kind == 'qasm':
+        return circuit_from_qasm(text)
+    return circuit_from_json(json.loads(text))
+
+
+def parse_circuit(data):
+    """
+    Circuito declarado en el body ("circuit" o "qasm"), o None si no hay ninguno.
+    El análisis se cachea por texto; se devuelve siempre una copia.
+    """
+    if data.get('circuit') is not None:
+        circuit = _parse_cached('json', json.dumps(data['circuit'], sort_keys=True))
+    elif data.get('qasm') is not None:
+        circuit = _parse_cached('qasm', str(data['qasm']))
+    else:
+        return None
+    return circuit.copy()
+
+
+def structural_hash(circuit):
+    """
+    Huella del contenido del circuito: registros (nombre y tamaño, que fijan el
+    formato de las cuentas) y, por instrucción, nombre, qubits, clbits,
+    parámetros y condición clásica. Dos descripciones equivalentes (JSON o QASM,
+    con distinto formato) producen la misma huella.
+    """
+    registers = ([('q', r.name, r.size) for r in circuit.qregs] +
+                 [('c', r.name, r.size) for r in circuit.cregs])
+    digest = hashlib.sha1(repr((circuit.num_qubits, circuit.num_clbits, registers)).encode())
+    for instruction in circuit.data:
+        operation = instruction.operation
+        qubits = tuple(circuit.find_bit(q).index for q in instruction.qubits)
+        clbits = tuple(circuit.find_bit(c).index for c in instruction.clbits)
+        params = tuple(_hash_parameter(p) for p in operation.params)
+        condition = _hash_condition(circuit, getattr(operation, 'condition', None))
+        digest.update(repr((operation.name, qubits, clbits, params, condition)).encode())
+    return digest.hexdigest()
+
+
+def _hash_parameter(parameter):
+    if isinstance(parameter, (int, float, np.number)):
+        return round(float(parameter), 12)
+    if isinstance(parameter, QuantumCircuit):
+        # Bloques de if/else y bucles
+        return structural_hash(parameter)
+    return str(parameter)
+
+
+def _hash_condition(circuit, condition):
+    """Condición c_if / if_else con los bits resueltos a índices del circuito"""
+    if condition is None:
+        return None
+    target, value = condition
+    if isinstance(target, ClassicalRegister):
+        return ('creg', target.name, target.size, value)
+    if isinstance(target, Clbit):
+        return ('clbit', circuit.find_bit(target).index, value)
+    return ('expr', str(target), value)
+
+
+class ResultCache:
+    """Caché LRU de respuestas de simulación"""
+
+    def __init__(self, size=RESULT_CACHE_SIZE):
+        self.size = size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            if key not in self._entries:
+                return None
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def put(self, key, value):
+        if self.size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.size:
+                self._entries.popitem(last=False)
@@ -0,0 +1,131 @@
+"""
+Statevector incremental para el diseñador de circuitos (WebSocket).
+Cada sesión guarda el estado actual y aplica solo la puerta añadida (O(2ⁿ)
+por puerta). Cada CHECKPOINT_INTERVAL puertas se guarda una copia del estado
+para deshacer: se vuelve a la copia anterior y se reaplican las puertas que
+faltan. Al cliente solo se envían las probabilidades que han cambiado.
+"""
+
+import os
+
+import numpy as np
+
+from circuit_spec import CircuitSpecError, standard_gate
+
+# Qubits máximos de una sesión incremental (el estado vive en memoria del servidor)
+MAX_QUBITS = int(os.environ.get('QSIM_INCREMENTAL_MAX_QUBITS', 20))
+
+# Puertas entre copias del estado para deshacer
+CHECKPOINT_INTERVAL = int(os.environ.get('QSIM_CHECKPOINT_INTERVAL', 16))
+
+# Cambio mínimo de probabilidad que se envía al cliente
+PROBABILITY_TOLERANCE = 1e-12
+
+# Instrucciones que no modifican las probabilidades (se guardan para poder deshacerlas)
+PASSIVE_INSTRUCTIONS = {'barrier', 'measure'}
+
+
+def apply_gate(state, matrix, qubits, num_qubits):
+    """
+    Aplica una matriz de k qubits al statevector (orden little-endian de Qiskit).
+    Con el estado como tensor (2,)*n, el eje j corresponde al qubit n-1-j.
+    """
+    k = len(qubits)
+    tensor = state.reshape((2,) * num_qubits)
+    gate = matrix.reshape((2,) * (2 * k))
+    # Ejes de la matriz: salida y entrada de q_{k-1}..q_0
+    axes = [num_qubits - 1 - q for q in reversed(qubits)]
+    result = np.tensordot(gate, tensor, axes=(list(range(k, 2 * k)), axes))
+    return np.moveaxis(result, list(range(k)), axes).reshape(-1)
+
+
+class IncrementalState:
+    """Estado de un circuito que se construye puerta a puerta"""
+
+    def __init__(self, num_qubits, checkpoint_interval=CHECKPOINT_INTERVAL):
+        if not isinstance(num_qubits, int) or not 1 <= num_qubits <= MAX_QUBITS:
+            raise CircuitSpecError(f"num_qubits debe estar entre 1 y {MAX_QUBITS}")
+        self.num_qubits = num_qubits
+        self.checkpoint_interval = checkpoint_interval
+        self.gates = []
+        self.state = np.zeros(2**num_qubits, dtype=complex)
+        self.state[0] = 1
+        # checkpoints[i] = estado tras i·checkpoint_interval puertas
+        self.checkpoints = [self.state.copy()]
+        self.probabilities = np.abs(self.state)**2
+
+    def _compile(self, gate):
+        """(nombre, qubits, matriz) de una puerta en JSON; la matriz es None si es pasiva"""
+        name = str(gate.get('name', '')).lower()
+        qubits = list(gate.get('qubits', []))
+        if any(not isinstance(q, int) or not 0 <= q < self.num_qubits for q in qubits) \
+                or len(set(qubits)) != len(qubits):
+            raise CircuitSpecError(f"Qubits inválidos para {name}: {qubits}")
+        if name in PASSIVE_INSTRUCTIONS:
+            return name, qubits, None
+        operation = standard_gate(name, gate.get('params', []), len(qubits))
+        return name, qubits, operation.to_matrix()
+
+    def _apply(self, compiled):
+        _, qubits, matrix = compiled
+        if matrix is not None:
+            self.state = apply_gate(self.state, matrix, qubits, self.num_qubits)
+
+    def append(self, gate):
+        """Aplica una puerta nueva; devuelve las probabilidades que cambian"""
+        compiled = self._compile(gate)
+        self._apply(compiled)
+        self.gates.append(compiled)
+        if len(self.gates) % self.checkpoint_interval == 0:
+            self.checkpoints.append(self.state.copy())
+        return self.changed_probabilities()
+
+    def undo(self, count=1):
+        """Quita las últimas puertas volviendo al checkpoint anterior y reaplicando"""
+        count = min(max(int(count), 0), len(self.gates))
+        if count == 0:
+            return {}
+        del self.gates[len(self.gates) - count:]
+        index = len(self.gates) // self.checkpoint_interval
+        del self.checkpoints[index + 1:]
+        self.state = self.checkpoints[index].copy()
+        for compiled in self.gates[index * self.checkpoint_interval:]:
+            self._apply(compiled)
+        return self.changed_probabilities()
+
+    def changed_probabilities(self):
+        """{bitstring: probabilidad} de los estados cuya probabilidad ha cambiado"""
+        probabilities = np.abs(self.state)**2
+        changed = np.flatnonzero(np.abs(probabilities - self.probabilities) > PROBABILITY_TOLERANCE)
+        self.probabilities = probabilities
+        return {format(int(i), f'0{self.num_qubits}b'): float(probabilities[i]) for i in changed}
+
+    def all_probabilities(self):
+        """Probabilidades no nulas (estado completo, para la primera respuesta)"""
+        nonzero = np.flatnonzero(self.probabilities > PROBABILITY_TOLERANCE)
+        return {format(int(i), f'0{self.num_qubits}b'): float(self.probabilities[i]) for i in nonzero}
+
+
+def handle_message(session, message):
+    """
+    Procesa un mensaje del diseñador y devuelve (sesión, respuesta):
+    {"type": "init", "num_qubits": 3, "gates": [...]}     (gates opcional)
+    {"type": "append", "gate": {"name": "h", "qubits": [0]}}
+    {"type": "undo", "count": 1}
+    """
+    kind = message.get('type')
+    if kind == 'init':
+        session = IncrementalState(message.get('num_qubits'))
+        for gate in message.get('gates', []):
+            session.append(gate)
+        return session, {'type': 'state', 'depth': len(session.gates),
+                         'probabilities': session.all_probabilities()}
+    if session is None:
+        raise CircuitSpecError('Primero hay que enviar un mensaje "init"')
+    if kind == 'append':
+        changed = session.append(message.get('gate') or {})
+    elif kind == 'undo':
+        changed = session.undo(message.get('count', 1))
+    else:
+        raise CircuitSpecError(f"Tipo de mensaje desconocido: {kind!r}")
+    return session, {'type': 'update', 'depth': len(session.gates), 'changed': changed}
@@ -0,0 +1,53 @@
+"""
+Resúmenes pequeños de un statevector para los componentes de visualización:
+vectores de Bloch reducidos de cada qubit y distribuciones marginales.
+Se calculan sobre el array de amplitudes con reshape y sumas de numpy, sin
+construir matrices densidad ni enviar el statevector completo.
+"""
+
+import numpy as np
+
+
+def _qubit_axis(qubit, num_qubits):
+    """Eje del tensor (2,)*n que corresponde al qubit (orden little-endian de Qiskit)"""
+    return num_qubits - 1 - qubit
+
+
+def bloch_vectors(state, num_qubits):
+    """
+    Vector de Bloch (x, y, z) del estado reducido de cada qubit, como array (n, 3).
+    Con a₀, a₁ las amplitudes con el qubit a 0 y a 1:
+    ρ₀₁ = Σ a₀·conj(a₁), x = 2·Re ρ₀₁, y = -2·Im ρ₀₁, z = Σ|a₀|² - Σ|a₁|².
+    """
+    tensor = np.asarray(state).reshape((2,) * num_qubits)
+    vectors = np.empty((num_qubits, 3))
+    for qubit in range(num_qubits):
+        pair = np.moveaxis(tensor, _qubit_axis(qubit, num_qubits), 0).reshape(2, -1)
+        coherence = np.vdot(pair[1], pair[0])
+        populations = np.einsum('ij,ij->i', pair, pair.conj()).real
+        vectors[qubit] = 2 * coherence.real, -2 * coherence.imag, populations[0] - populations[1]
+    return vectors
+
+
+def marginal_probabilities(probabilities, num_qubits, qubits):
+    """
+    Distribución marginal de los qubits pedidos, como array de 2ᵏ entradas
+    (qubits[0] es el bit menos significativo, igual que en get_counts).
+    """
+    qubits = list(qubits)
+    if len(set(qubits)) != len(qubits) or any(not 0 <= q < num_qubits for q in qubits):
+        raise ValueError(f"Qubits inválidos para la marginal: {qubits}")
+    tensor = np.asarray(probabilities).reshape((2,) * num_qubits)
+    kept = [_qubit_axis(q, num_qubits) for q in qubits]
+    summed = tuple(axis for axis in range(num_qubits) if axis not in kept)
+    marginal = tensor.sum(axis=summed)
+    # Tras sumar quedan los ejes en orden creciente; se reordenan a q_{k-1}..q_0
+    remaining = sorted(kept)
+    order = [remaining.index(axis) for axis in reversed(kept)]
+    return marginal.transpose(order).reshape(-1)
+
+
+def probabilities_dict(values, num_bits, tolerance=1e-12):
+    """{bitstring: probabilidad} de las entradas no nulas"""
+    nonzero = np.flatnonzero(values > tolerance)
+    return {format(int(i), f'0{num_bits}b'): float(values[i]) for i in nonzero}
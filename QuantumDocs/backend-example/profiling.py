@@ -0,0 +1,139 @@
+"""
+Perfilado por petición (?profile=1) para saber dónde se va el tiempo de un
+circuito lento: exec del código, transpile, Aer, statevector o JSON.
+Un hilo muestrea la pila del hilo de la petición cada PROFILE_INTERVAL
+segundos (sys._current_frames, sin dependencias) y el resultado se devuelve
+como pilas colapsadas (flamegraph.pl, speedscope) o JSON de speedscope.
+"""
+
+import functools
+import os
+import sys
+import threading
+import time
+from collections import Counter
+
+from flask import jsonify, make_response, request
+
+# El perfilado solo se activa si el servidor lo permite (expone rutas y tiempos internos)
+PROFILING_ENABLED = os.environ.get('QSIM_ENABLE_PROFILING', '0').lower() in ('1', 'true', 'yes')
+
+# Segundos entre muestras
+PROFILE_INTERVAL = float(os.environ.get('QSIM_PROFILE_INTERVAL', 0.001))
+
+SPEEDSCOPE_SCHEMA = 'https://www.speedscope.app/file-format-schema.json'
+
+
+class SamplingProfiler:
+    """Muestrea la pila de un hilo mientras dura el bloque with"""
+
+    def __init__(self, interval=PROFILE_INTERVAL):
+        self.interval = interval
+        self.samples = Counter()
+        self.duration = 0.0
+        self._stop = threading.Event()
+
+    def __enter__(self):
+        self._target = threading.get_ident()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+        self._start = time.perf_counter()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self.duration = time.perf_counter() - self._start
+        return False
+
+    def _sample(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._target)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append((code.co_name, code.co_filename, code.co_firstlineno))
+                frame = frame.f_back
+            if stack:
+                self.samples[tuple(reversed(stack))] += 1
+
+    @staticmethod
+    def _label(frame):
+        name, filename, line = frame
+        return f"{name} ({os.path.basename(filename)}:{line})"
+
+    def collapsed(self):
+        """Formato de pilas colapsadas: 'raíz;...;hoja muestras' por línea"""
+        return '\n'.join(f"{';'.join(self._label(f) for f in stack)} {count}"
+                         for stack, count in self.samples.most_common())
+
+    def speedscope(self, name='request'):
+        """
+        Perfil muestreado en el formato JSON de speedscope (pesos en segundos).
+        Con el GIL el intervalo real entre muestras es mayor que el pedido, así
+        que cada muestra pesa la duración total repartida entre las muestras.
+        """
+        frames, index = [], {}
+        weight = self.duration / max(1, sum(self.samples.values()))
+        samples, weights = [], []
+        for stack, count in self.samples.most_common():
+            for frame in stack:
+                if frame not in index:
+                    index[frame] = len(frames)
+                    frames.append({'name': frame[0], 'file': frame[1], 'line': frame[2]})
+            samples.append([index[frame] for frame in stack])
+            weights.append(count * weight)
+        return {
+            '$schema': SPEEDSCOPE_SCHEMA,
+            'shared': {'frames': frames},
+            'profiles': [{
+                'type': 'sampled',
+                'name': name,
+                'unit': 'seconds',
+                'startValue': 0,
+                'endValue': sum(weights),
+                'samples': samples,
+                'weights': weights,
+            }],
+            'activeProfileIndex': 0,
+            'exporter': 'quantum-backend',
+        }
+
+
+def profiled(view):
+    """
+    Decorador de endpoints JSON: con ?profile=1 ejecuta la vista bajo el
+    profiler y añade "profile" a la respuesta (?profile_format=speedscope
+    para JSON de speedscope; por defecto pilas colapsadas).
+    """
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        if request.args.get('profile', '0').lower() not in ('1', 'true', 'yes'):
+            return view(*args, **kwargs)
+        if not PROFILING_ENABLED:
+            return jsonify({
+                'success': False,
+                'error': 'Perfilado desactivado en el servidor (QSIM_ENABLE_PROFILING=1)'
+            }), 403
+
+        with SamplingProfiler() as profiler:
+            response = make_response(view(*args, **kwargs))
+        if not response.is_json:
+            return response
+        payload = response.get_json()
+        profile_format = 'speedscope' if request.args.get('profile_format') == 'speedscope' else 'collapsed'
+        if profile_format == 'speedscope':
+            profile = profiler.speedscope(request.path)
+        else:
+            profile = profiler.collapsed()
+        payload['profile'] = {
+            'format': profile_format,
+            'duration': round(profiler.duration, 6),
+            'interval': profiler.interval,
+            'samples': sum(profiler.samples.values()),
+            'data': profile,
+        }
+        response.set_data(jsonify(payload).get_data())
+        return response
+
+    return wrapper
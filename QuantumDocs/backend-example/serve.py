@@ -0,0 +1,75 @@
+"""
+Modo producción del servidor: gunicorn con workers pre-forkeados y pre-calentados.
+El proceso padre importa qiskit/Aer, compila los algoritmos y ejecuta un
+circuito por método antes de hacer fork; los workers comparten esa memoria
+(copy-on-write) y el primer request no paga el arranque en frío.
+
+Uso:
+    python serve.py                       # QSIM_WORKERS workers en 0.0.0.0:5000
+    QSIM_WORKERS=8 QSIM_BIND=127.0.0.1:8000 python serve.py
+"""
+
+import os
+
+from gunicorn.app.base import BaseApplication
+
+CPU_COUNT = os.cpu_count() or 1
+
+# Procesos que atienden peticiones
+WORKERS = int(os.environ.get('QSIM_WORKERS', CPU_COUNT))
+
+# Hilos por worker (WebSocket y peticiones en espera de memoria no bloquean el proceso)
+WORKER_THREADS = int(os.environ.get('QSIM_WORKER_THREADS', 4))
+
+# Reinicio ordenado de cada worker tras N peticiones (0 = nunca), con jitter para no reiniciar todos a la vez
+MAX_REQUESTS = int(os.environ.get('QSIM_MAX_REQUESTS', 1000))
+MAX_REQUESTS_JITTER = int(os.environ.get('QSIM_MAX_REQUESTS_JITTER', 100))
+
+# Segundos para terminar las peticiones en curso al reiniciar, y límite por petición
+GRACEFUL_TIMEOUT = int(os.environ.get('QSIM_GRACEFUL_TIMEOUT', 30))
+REQUEST_TIMEOUT = int(os.environ.get('QSIM_REQUEST_TIMEOUT', 120))
+
+BIND = os.environ.get('QSIM_BIND', '0.0.0.0:5000')
+
+# Los hilos de Aer se reparten entre los workers para no sobresuscribir la CPU;
+# debe fijarse antes de importar server, que crea el simulador compartido
+os.environ.setdefault('QSIM_MAX_PARALLEL_THREADS', str(max(1, CPU_COUNT // WORKERS)))
+
+from server import app, warm_up  # noqa: E402
+
+
+class QuantumServer(BaseApplication):
+    """Aplicación de gunicorn configurada desde Python (sin archivo de configuración)"""
+
+    def __init__(self, application, options):
+        self.application = application
+        self.options = options
+        super().__init__()
+
+    def load_config(self):
+        for key, value in self.options.items():
+            self.cfg.set(key, value)
+
+    def load(self):
+        return self.application
+
+
+def main():
+    warm_up()
+    options = {
+        'bind': BIND,
+        'workers': WORKERS,
+        'worker_class': 'gthread',
+        'threads': WORKER_THREADS,
+        'preload_app': True,
+        'max_requests': MAX_REQUESTS,
+        'max_requests_jitter': MAX_REQUESTS_JITTER,
+        'graceful_timeout': GRACEFUL_TIMEOUT,
+        'timeout': REQUEST_TIMEOUT,
+    }
+    print(f'🚀 Quantum Backend Server (producción) en http://{BIND} con {WORKERS} workers')
+    QuantumServer(app, options).run()
+
+
+if __name__ == '__main__':
+    main()
@@ -8,20 +8,116 @@ from flask_cors import CORS
 import sys
 import os
 import json
+import time
 from qiskit import QuantumCircuit, transpile
+from qiskit.circuit import Parameter
 from qiskit_aer import AerSimulator
 from qiskit.visualization import circuit_drawer
 import matplotlib
 matplotlib.use('Agg')  # Backend sin GUI
 import matplotlib.pyplot as plt
+import numpy as np
 import base64
 from io import BytesIO
 
+# Módulos compartidos con los ejemplos (raíz del repositorio)
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from counts import CountsArray
+from simulators import get_simulator, mps_truncation_report, run_circuit
+from admission import AdmissionError, MemoryBudget, estimate_memory_mb, plan_simulation
+from circuit_spec import CircuitSpecError, ResultCache, parse_circuit, structural_hash
+from sessions import CircuitSession, SessionNotFound, SessionStore
+from incremental import handle_message
+from observables import bloch_vectors, marginal_probabilities, probabilities_dict
+from profiling import profiled
+
+try:
+    from flask_sock import Sock  # WebSocket opcional (pip install flask-sock)
+except ImportError:
+    Sock = None
+
 app = Flask(__name__)
 CORS(app)  # Permitir peticiones desde Angular
 
-# Configurar el simulador
-simulator = AerSimulator()
+# Configurar el simulador (método elegido por Aer para el código de usuario)
+simulator = get_simulator()
+
+# Memoria reservada por las simulaciones en curso (QSIM_MEMORY_BUDGET_MB)
+memory_budget = MemoryBudget()
+
+# Respuestas de circuitos declarativos ("circuit" / "qasm") ya simulados
+result_cache = ResultCache()
+
+# Circuitos parametrizados ya transpilados (/api/sessions)
+sessions = SessionStore()
+
+# WebSocket del diseñador de circuitos (solo si flask-sock está instalado)
+sock = Sock(app) if Sock is not None else None
+
+
+# Mapeo de algoritmos a archivos Python (en la raíz del repositorio)
+ALGORITHM_FILES = {
+    'qubit_basico': '../../ejemplo_01_qubit_basico.py',
+    'puertas_basicas': '../../ejemplo_02_puertas_basicas.py',
+    'entrelazamiento': '../../ejemplo_03_entrelazamiento.py',
+    'deutsch_jozsa': '../../ejemplo_04_deutsch_jozsa.py',
+    'grover': '../../ejemplo_05_grover.py'
+}
+
+# Código compilado de cada algoritmo (se lee una vez por proceso)
+_algorithm_code = {}
+
+
+def algorithm_code(algorithm_name):
+    """Lee y compila el archivo del algoritmo la primera vez que se pide"""
+    if algorithm_name not in _algorithm_code:
+        file_path = os.path.join(os.path.dirname(__file__), ALGORITHM_FILES[algorithm_name])
+        with open(file_path, 'r', encoding='utf-8') as f:
+            _algorithm_code[algorithm_name] = compile(f.read(), file_path, 'exec')
+    return _algorithm_code[algorithm_name]
+
+
+def warm_up():
+    """
+    Carga todo lo que el primer request pagaría: los algoritmos compilados,
+    el transpilador y un simulador por método (stabilizer, statevector, MPS).
+    Los circuitos son pequeños para que Aer no arranque hilos OpenMP antes de un fork.
+    """
+    for algorithm_name in ALGORITHM_FILES:
+        algorithm_code(algorithm_name)
+    qc = QuantumCircuit(2, 2)
+    qc.h(0)
+    qc.cx(0, 1)
+    qc.measure([0, 1], [0, 1])
+    for method in ('stabilizer', 'statevector', 'matrix_product_state'):
+        run_circuit(qc, shots=1, method=method).result()
+    qc.remove_final_measurements()
+    qc.save_statevector()
+    run_circuit(qc, shots=1, method='statevector').result()
+
+
+def build_circuit(data):
+    """Circuito del body: "circuit" o "qasm" (declarativos) o "code" (se ejecuta con exec)"""
+    qc = parse_circuit(data)
+    if qc is not None:
+        return qc
+    
+    # Crear un namespace para ejecutar el código
+    namespace = {
+        'QuantumCircuit': QuantumCircuit,
+        'Parameter': Parameter,
+        'transpile': transpile,
+        'simulator': simulator
+    }
+    
+    # Ejecutar el código Qiskit
+    exec(data.get('code', ''), namespace)
+    
+    # Obtener el circuito creado
+    qc = namespace.get('qc')
+    if qc is None:
+        raise CircuitSpecError('No se encontró un circuito llamado "qc"')
+    return qc
 
 @app.route('/api/health', methods=['GET'])
 def health_check():
@@ -32,6 +128,7 @@ def health_check():
     })
 
 @app.route('/api/simulate', methods=['POST'])
+@profiled
 def simulate_circuit():
     """
     Simula un circuito cuántico desde código Qiskit
@@ -39,63 +136,285 @@ def simulate_circuit():
     Body:
     {
         "code": "qc = QuantumCircuit(2, 2)\nqc.h(0)\nqc.cx(0, 1)\nqc.measure_all()",
-        "shots": 1000
+        "shots": 1000,
+        "method": "matrix_product_state",                           (opcional)
+        "precision": "single",                                      (opcional)
+        "mps": {"max_bond_dimension": 32, "truncation_threshold": 1e-10}  (opcional)
     }
+
+    En lugar de "code" se puede enviar "circuit" (lista de puertas en JSON) o
+    "qasm" (OpenQASM 2/3): se analizan sin exec y el resultado se cachea por la
+    huella estructural del circuito ("cache": false para volver a muestrear).
+
+    Antes de simular se estima la memoria: si no cabe en el presupuesto se
+    pasa a precisión simple o a MPS, y si aun así no cabe se rechaza (413).
+    Si no hay memoria libre en ese momento la petición espera en cola (503 al agotar la espera).
     """
     try:
         data = request.json
-        code = data.get('code', '')
         shots = data.get('shots', 1000)
+        mps = data.get('mps') or {}
         
-        # Crear un namespace para ejecutar el código
-        namespace = {
-            'QuantumCircuit': QuantumCircuit,
-            'transpile': transpile,
-            'simulator': simulator
-        }
+        # Circuito declarativo (JSON o OpenQASM): sin exec y cacheable
+        qc = parse_circuit(data)
+        cache_key = None
+        if qc is not None and data.get('cache', True):
+            cache_key = (structural_hash(qc), shots, data.get('method'), data.get('precision'),
+                         json.dumps(mps, sort_keys=True))
+            cached = result_cache.get(cache_key)
+            if cached is not None:
+                return jsonify(dict(cached, cached=True))
         
-        # Ejecutar el código Qiskit
-        exec(code, namespace)
-        
-        # Obtener el circuito creado
-        qc = namespace.get('qc')
         if qc is None:
-            return jsonify({'error': 'No se encontró un circuito llamado "qc"'}), 400
+            qc = build_circuit(data)
+        if qc.parameters:
+            raise CircuitSpecError("El circuito tiene parámetros libres: usa /api/sessions")
         
-        # Simular el circuito
-        job = simulator.run(transpile(qc, simulator), shots=shots)
-        result = job.result()
-        counts = result.get_counts(qc)
+        # Elegir método y precisión que quepan en memoria (stabilizer, statevector o MPS);
+        # las opciones de "mps" activan el modo MPS con dimensión de enlace limitada
+        method = data.get('method') or ('matrix_product_state' if mps else None)
+        plan = plan_simulation(qc, method=method, precision=data.get('precision'),
+                               max_bond_dimension=mps.get('max_bond_dimension'))
+        
+        with memory_budget.reserve(plan['memory_mb']):
+            job = run_circuit(qc, shots=shots, method=plan['method'],
+                              max_bond_dimension=plan['max_bond_dimension'],
+                              truncation_threshold=mps.get('truncation_threshold'),
+                              precision=plan['precision'])
+            result = job.result()
+        method = result.results[0].metadata.get('method')
+        # Histograma en arrays; los dicts de bitstrings solo se construyen para el JSON
+        counts_array = CountsArray.from_result(result)
+        counts = counts_array.to_dict()
         
         # Calcular probabilidades
-        probabilities = {state: count / shots for state, count in counts.items()}
+        probabilities = counts_array.probabilities_dict(shots)
         
-        # Obtener el statevector si es posible
+        # Obtener el statevector si es posible: es opcional, así que si no hay
+        # memoria libre en este momento se omite en vez de esperar en la cola
         statevector = None
         try:
-            sv_simulator = AerSimulator(method='statevector')
-            sv_job = sv_simulator.run(transpile(qc, sv_simulator))
-            sv_result = sv_job.result()
+            with memory_budget.reserve(estimate_memory_mb(qc.num_qubits, 'statevector'), timeout=0):
+                sv_simulator = get_simulator('statevector')
+                sv_job = sv_simulator.run(transpile(qc, sv_simulator))
+                sv_result = sv_job.result()
             sv = sv_result.get_statevector(qc)
             statevector = [{'real': float(amp.real), 'imaginary': float(amp.imag)} 
                           for amp in sv]
-        except:
+        except Exception:
             pass
         
-        return jsonify({
+        response = {
             'success': True,
             'counts': counts,
             'probabilities': probabilities,
             'statevector': statevector,
-            'shots': shots
+            'shots': shots,
+            'method': method,
+            'truncation': mps_truncation_report(result),
+            'admission': plan
+        }
+        if cache_key is not None:
+            result_cache.put(cache_key, response)
+        return jsonify(response)
+        
+    except CircuitSpecError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+    except AdmissionError as e:
+        return jsonify({
+            'success': False,
+            'error': str(e),
+            'estimated_memory_mb': e.estimate_mb
+        }), e.status_code
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/api/sessions', methods=['POST'])
+@profiled
+def create_session():
+    """
+    Registra un circuito parametrizado y lo deja transpilado en el servidor
+    
+    Body: como /api/simulate ("code", "circuit" o "qasm", y "method", "precision",
+    "mps" opcionales), con parámetros libres:
+    {
+        "circuit": {"num_qubits": 1, "num_clbits": 1,
+                    "gates": [{"name": "ry", "qubits": [0], "params": ["theta"]},
+                              {"name": "measure", "qubits": [0], "clbits": [0]}]}
+    }
+    """
+    try:
+        data = request.json
+        mps = data.get('mps') or {}
+        qc = build_circuit(data)
+        
+        method = data.get('method') or ('matrix_product_state' if mps else None)
+        plan = plan_simulation(qc, method=method, precision=data.get('precision'),
+                               max_bond_dimension=mps.get('max_bond_dimension'))
+        session = sessions.add(CircuitSession(qc, plan, mps.get('truncation_threshold')))
+        
+        return jsonify({
+            'success': True,
+            'session_id': session.id,
+            'parameters': session.parameters,
+            'method': plan['method'],
+            'admission': plan
+        }), 201
+        
+    except (CircuitSpecError, AdmissionError) as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), getattr(e, 'status_code', 400)
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+@app.route('/api/sessions/<session_id>/run', methods=['POST'])
+@profiled
+def run_session(session_id):
+    """
+    Ejecuta la sesión con nuevos valores de los parámetros
+    
+    Body:
+    {
+        "values": {"theta": 1.57},      (o {"theta": [0, "pi/4", "pi/2"]} para un barrido)
+        "shots": 1000
+    }
+    """
+    try:
+        data = request.json or {}
+        shots = data.get('shots', 1000)
+        session = sessions.get(session_id)
+        
+        start = time.perf_counter()
+        with memory_budget.reserve(session.plan['memory_mb']):
+            all_counts, batch = session.run(data.get('values'), shots)
+        counts = [counts_array.to_dict() for counts_array in all_counts]
+        probabilities = [counts_array.probabilities_dict(shots) for counts_array in all_counts]
+        
+        return jsonify({
+            'success': True,
+            'counts': counts if batch else counts[0],
+            'probabilities': probabilities if batch else probabilities[0],
+            'shots': shots,
+            'elapsed_ms': round((time.perf_counter() - start) * 1000, 2)
         })
         
+    except SessionNotFound:
+        return jsonify({
+            'success': False,
+            'error': 'Sesión no encontrada o caducada'
+        }), 404
+    except (CircuitSpecError, AdmissionError) as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), getattr(e, 'status_code', 400)
     except Exception as e:
         return jsonify({
             'success': False,
             'error': str(e)
         }), 500
 
+@app.route('/api/sessions/<session_id>', methods=['DELETE'])
+def delete_session(session_id):
+    """Cierra la sesión y libera el circuito transpilado"""
+    try:
+        sessions.remove(session_id)
+    except SessionNotFound:
+        return jsonify({
+            'success': False,
+            'error': 'Sesión no encontrada o caducada'
+        }), 404
+    return jsonify({'success': True})
+
+@app.route('/api/bloch', methods=['POST'])
+@profiled
+def bloch_summary():
+    """
+    Vectores de Bloch de cada qubit y marginales pedidas, sin enviar el statevector
+    
+    Body: como /api/simulate ("code", "circuit" o "qasm"), más:
+    {
+        "marginals": [[0], [0, 1]],    (opcional, listas de qubits)
+        "precision": "single"          (opcional)
+    }
+    Las medidas finales se ignoran: se usa el estado justo antes de medir.
+    """
+    try:
+        data = request.json
+        qc = build_circuit(data)
+        if qc.parameters:
+            raise CircuitSpecError("El circuito tiene parámetros libres: usa /api/sessions")
+        qc = qc.remove_final_measurements(inplace=False)
+        n = qc.num_qubits
+        
+        plan = plan_simulation(qc, method='statevector', precision=data.get('precision'))
+        if plan['method'] != 'statevector':
+            raise AdmissionError(f"El statevector de {n} qubits no cabe en el presupuesto de memoria")
+        qc.save_statevector()
+        with memory_budget.reserve(plan['memory_mb']):
+            result = run_circuit(qc, shots=1, method='statevector',
+                                 precision=plan['precision']).result()
+        state = np.asarray(result.get_statevector())
+        
+        probabilities = np.abs(state)**2
+        marginals = []
+        for qubits in data.get('marginals') or []:
+            try:
+                values = marginal_probabilities(probabilities, n, qubits)
+            except (TypeError, ValueError) as e:
+                raise CircuitSpecError(str(e))
+            marginals.append({'qubits': qubits, 'probabilities': probabilities_dict(values, len(qubits))})
+        
+        return jsonify({
+            'success': True,
+            'num_qubits': n,
+            'bloch_vectors': (np.round(bloch_vectors(state, n), 12) + 0.0).tolist(),
+            'marginals': marginals
+        })
+        
+    except (CircuitSpecError, AdmissionError) as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), getattr(e, 'status_code', 400)
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
+def statevector_socket(ws):
+    """
+    Statevector incremental del diseñador de circuitos (ws://.../ws/statevector)
+    
+    Mensajes: {"type": "init", "num_qubits": 3}, {"type": "append", "gate": {...}}
+    y {"type": "undo"}; cada respuesta solo lleva las probabilidades que cambian.
+    """
+    session = None
+    while True:
+        message = ws.receive()
+        if message is None:
+            break
+        try:
+            session, response = handle_message(session, json.loads(message))
+        except Exception as e:
+            response = {'type': 'error', 'error': str(e)}
+        ws.send(json.dumps(response))
+
+if sock is not None:
+    sock.route('/ws/statevector')(statevector_socket)
+
 @app.route('/api/visualize', methods=['POST'])
 def visualize_circuit():
     """
@@ -152,25 +471,13 @@ def execute_algorithm(algorithm_name):
     try:
         data = request.json or {}
         
-        # Mapeo de algoritmos a archivos Python
-        algorithm_files = {
-            'qubit_basico': '../ejemplo_01_qubit_basico.py',
-            'puertas_basicas': '../ejemplo_02_puertas_basicas.py',
-            'entrelazamiento': '../ejemplo_03_entrelazamiento.py',
-            'deutsch_jozsa': '../ejemplo_04_deutsch_jozsa.py',
-            'grover': '../ejemplo_05_grover.py'
-        }
-        
-        if algorithm_name not in algorithm_files:
+        if algorithm_name not in ALGORITHM_FILES:
             return jsonify({
                 'error': f'Algoritmo "{algorithm_name}" no encontrado'
             }), 404
         
-        # Leer y ejecutar el archivo Python
-        file_path = os.path.join(os.path.dirname(__file__), algorithm_files[algorithm_name])
-        
-        with open(file_path, 'r', encoding='utf-8') as f:
-            code = f.read()
+        # Código del algoritmo ya leído y compilado
+        code = algorithm_code(algorithm_name)
         
         # Capturar la salida
         from io import StringIO
@@ -282,8 +589,13 @@ if __name__ == '__main__':
     print('📡 Endpoints disponibles:')
     print('   GET  /api/health')
     print('   POST /api/simulate')
+    print('   POST /api/bloch')
+    print('   POST /api/sessions, /api/sessions/<id>/run  DELETE /api/sessions/<id>')
     print('   POST /api/visualize')
     print('   POST /api/execute/<algorithm_name>')
     print('   POST /api/validate')
     print('   GET  /api/algorithms')
+    if sock is not None:
+        print('   WS   /ws/statevector')
+    print('   (modo producción: python serve.py)')
     app.run(debug=True, port=5000)
@@ -0,0 +1,114 @@
+"""
+Sesiones de circuitos parametrizados (sliders de la vista de lecciones).
+El circuito se registra y transpila una sola vez; cada ejecución solo envía
+los valores de los parámetros, que Aer asigna al lanzar el job
+(parameter_binds), sin volver a ejecutar código ni a transpilar.
+"""
+
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+from counts import CountsArray
+from simulators import prepare_circuit, run_compiled
+from circuit_spec import CircuitSpecError, parse_parameter
+
+# Segundos sin uso tras los que una sesión se descarta
+SESSION_TTL = float(os.environ.get('QSIM_SESSION_TTL', 1800))
+
+# Sesiones abiertas como máximo (se descarta la usada hace más tiempo)
+MAX_SESSIONS = int(os.environ.get('QSIM_MAX_SESSIONS', 128))
+
+
+class SessionNotFound(KeyError):
+    """Sesión inexistente o caducada (se responde con 404)"""
+
+
+class CircuitSession:
+    """Circuito parametrizado ya transpilado, listo para ejecutar con otros valores"""
+
+    def __init__(self, circuit, plan, truncation_threshold=None):
+        self.id = uuid.uuid4().hex
+        self.plan = plan
+        self.parameters = sorted(p.name for p in circuit.parameters)
+        self.simulator, self.compiled, self.run_options = prepare_circuit(
+            circuit, plan['method'], plan['max_bond_dimension'], truncation_threshold,
+            precision=plan['precision'])
+        # La transpilación puede eliminar parámetros sin efecto: solo se asignan los que quedan
+        self._compiled_parameters = {p.name: p for p in self.compiled.parameters}
+        self.last_used = time.monotonic()
+
+    def bind(self, values):
+        """
+        parameter_binds de Aer a partir de {nombre: valor} o {nombre: [valores]}.
+        Con listas se ejecuta un experimento por posición (barrido de un slider).
+        Devuelve (binds, si era un barrido, número de experimentos).
+        """
+        values = values or {}
+        missing = [name for name in self.parameters if name not in values]
+        unknown = [name for name in values if name not in self.parameters]
+        if missing or unknown:
+            raise CircuitSpecError(f"Parámetros que faltan: {missing}; desconocidos: {unknown}")
+
+        batch = any(isinstance(v, list) for v in values.values())
+        columns = {name: [parse_parameter(x) for x in (v if isinstance(v, list) else [v])]
+                   for name, v in values.items()}
+        lengths = {len(column) for column in columns.values()}
+        if batch and len(lengths) > 1:
+            raise CircuitSpecError("Todas las listas de valores deben tener la misma longitud")
+        binds = {self._compiled_parameters[name]: column
+                 for name, column in columns.items() if name in self._compiled_parameters}
+        return binds, batch, lengths.pop() if batch else 1
+
+    def run(self, values, shots):
+        """Asigna los valores y ejecuta; devuelve (CountsArray por experimento, si era un barrido)"""
+        binds, batch, experiments = self.bind(values)
+        self.last_used = time.monotonic()
+        options = dict(self.run_options, shots=shots)
+        circuits = self.compiled
+        if binds:
+            options['parameter_binds'] = [binds]
+        elif experiments > 1:
+            # La transpilación eliminó todos los parámetros: se repite el circuito
+            # para devolver igualmente un resultado por posición del barrido
+            circuits = [self.compiled] * experiments
+        result = run_compiled(self.simulator, circuits, **options).result()
+        return [CountsArray.from_result(result, i) for i in range(len(result.results))], batch
+
+
+class SessionStore:
+    """Sesiones abiertas, con caducidad por inactividad y número máximo"""
+
+    def __init__(self, ttl=SESSION_TTL, max_sessions=MAX_SESSIONS):
+        self.ttl = ttl
+        self.max_sessions = max_sessions
+        self._sessions = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _expire(self):
+        now = time.monotonic()
+        for session_id in [s.id for s in self._sessions.values() if now - s.last_used > self.ttl]:
+            del self._sessions[session_id]
+
+    def add(self, session):
+        with self._lock:
+            self._expire()
+            self._sessions[session.id] = session
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+        return session
+
+    def get(self, session_id):
+        with self._lock:
+            self._expire()
+            if session_id not in self._sessions:
+                raise SessionNotFound(session_id)
+            self._sessions.move_to_end(session_id)
+            return self._sessions[session_id]
+
+    def remove(self, session_id):
+        with self._lock:
+            if self._sessions.pop(session_id, None) is None:
+                raise SessionNotFound(session_id)
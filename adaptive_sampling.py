@@ -0,0 +1,93 @@
+# Muestreo adaptativo: shots en lotes crecientes hasta alcanzar la precisión pedida
+import math
+from collections import namedtuple
+
+import numpy as np
+from scipy import stats
+
+from counts import CountsArray
+from simulators import prepare_circuit, run_compiled
+
+AdaptiveResult = namedtuple('AdaptiveResult',
+                            ['counts', 'shots', 'batches', 'estimates', 'intervals', 'converged'])
+
+
+def wilson_interval(successes, trials, confidence=0.95):
+    """Intervalo de Wilson para una proporción (vectorizado); devuelve (inferior, superior)"""
+    successes = np.asarray(successes, dtype=float)
+    trials = np.asarray(trials, dtype=float)
+    z = stats.norm.ppf(0.5 + confidence / 2)
+    p = successes / trials
+    denominator = 1 + z**2 / trials
+    center = (p + z**2 / (2 * trials)) / denominator
+    half_width = z * np.sqrt(p * (1 - p) / trials + z**2 / (4 * trials**2)) / denominator
+    # Con 0 o n éxitos el extremo es exactamente 0 o 1 (se evita el redondeo)
+    lower = np.where(successes == 0, 0.0, np.clip(center - half_width, 0, 1))
+    upper = np.where(successes == trials, 1.0, np.clip(center + half_width, 0, 1))
+    return lower, upper
+
+
+def clopper_pearson_interval(successes, trials, confidence=0.95):
+    """Intervalo exacto de Clopper-Pearson (cuantiles de la distribución beta)"""
+    successes = np.asarray(successes, dtype=float)
+    trials = np.asarray(trials, dtype=float)
+    alpha = 1 - confidence
+    with np.errstate(invalid='ignore'):
+        lower = np.where(successes > 0, stats.beta.ppf(alpha / 2, successes, trials - successes + 1), 0.0)
+        upper = np.where(successes < trials, stats.beta.ppf(1 - alpha / 2, successes + 1, trials - successes), 1.0)
+    return lower, upper
+
+
+INTERVALS = {'wilson': wilson_interval, 'clopper-pearson': clopper_pearson_interval}
+
+
+def _event(outcome):
+    """Función CountsArray -> éxitos: bitstring, lista de bitstrings o callable"""
+    if callable(outcome):
+        return outcome
+    if isinstance(outcome, str):
+        return lambda counts: counts[outcome]
+    return lambda counts: sum(counts[bitstring] for bitstring in outcome)
+
+
+def adaptive_sample(circuit, outcomes, precision=0.01, confidence=0.95, interval='wilson',
+                    initial_shots=100, max_shots=100_000, threshold=None, method=None):
+    """
+    Ejecuta el circuito en lotes hasta que el intervalo de confianza de la
+    probabilidad de cada evento tenga semianchura <= precision (o, con
+    threshold, hasta que cada intervalo quede entero a un lado del umbral).
+    outcomes: lista de eventos (bitstring, lista de bitstrings o callable que
+    recibe el CountsArray acumulado y devuelve los éxitos, por ejemplo
+    lambda counts: counts.marginal([2])['0']). El siguiente lote se dimensiona con la varianza
+    estimada, z²·p(1-p)/precision², sin más que duplicar los shots acumulados.
+    """
+    if interval not in INTERVALS:
+        raise ValueError(f"Intervalo desconocido: {interval} (opciones: {list(INTERVALS)})")
+    events = [_event(outcome) for outcome in outcomes]
+    z = stats.norm.ppf(0.5 + confidence / 2)
+    simulator, compiled, run_options = prepare_circuit(circuit, method)
+
+    counts = None
+    shots = batches = 0
+    batch = initial_shots
+    while True:
+        batch_counts = CountsArray.from_result(run_compiled(simulator, compiled, shots=batch, **run_options).result())
+        counts = batch_counts if counts is None else counts + batch_counts
+        shots += batch
+        batches += 1
+
+        successes = np.array([event(counts) for event in events])
+        lower, upper = INTERVALS[interval](successes, shots, confidence)
+        converged = bool(np.all((upper - lower) / 2 <= precision))
+        if threshold is not None:
+            converged |= bool(np.all((lower > threshold) | (upper < threshold)))
+        if converged or shots >= max_shots:
+            break
+
+        # Estimación de Agresti-Coull (nunca 0 ni 1) para calcular los shots necesarios
+        p = (successes + 2) / (shots + 4)
+        needed = math.ceil(float(np.max(z**2 * p * (1 - p))) / precision**2)
+        batch = min(max_shots, max(shots + initial_shots, min(2 * shots, needed))) - shots
+
+    return AdaptiveResult(counts, shots, batches, successes / shots,
+                          np.stack([lower, upper], axis=-1), converged)
@@ -0,0 +1,195 @@
+# Simulación vectorizada de statevectors para lotes de parámetros
+from collections import namedtuple
+
+import numpy as np
+import sympy
+from qiskit import transpile
+from qiskit.circuit import Parameter, ParameterExpression
+
+# Puertas que se aplican con una matriz por fila del lote
+PARAMETRIC_GATES = ['rx', 'ry', 'rz', 'p', 'u', 'rzz', 'rxx', 'ryy']
+
+# Puertas fijas: su matriz se calcula una sola vez al compilar
+FIXED_GATES = ['id', 'x', 'y', 'z', 'h', 's', 'sdg', 't', 'tdg', 'sx', 'sxdg',
+               'cx', 'cy', 'cz', 'swap', 'ccx']
+
+CompiledCircuit = namedtuple('CompiledCircuit',
+                             ['num_qubits', 'parameters', 'operations', 'global_phase'])
+
+
+def _rx(theta):
+    c, s = np.cos(theta / 2), np.sin(theta / 2)
+    return np.stack([np.stack([c, -1j * s], -1),
+                     np.stack([-1j * s, c], -1)], -2)
+
+
+def _ry(theta):
+    c, s = np.cos(theta / 2), np.sin(theta / 2)
+    return np.stack([np.stack([c, -s], -1),
+                     np.stack([s, c], -1)], -2).astype(complex)
+
+
+def _rz(theta):
+    zero = np.zeros_like(theta, dtype=complex)
+    return np.stack([np.stack([np.exp(-0.5j * theta), zero], -1),
+                     np.stack([zero, np.exp(0.5j * theta)], -1)], -2)
+
+
+def _p(lam):
+    zero = np.zeros_like(lam, dtype=complex)
+    return np.stack([np.stack([zero + 1, zero], -1),
+                     np.stack([zero, np.exp(1j * lam)], -1)], -2)
+
+
+def _u(theta, phi, lam):
+    c, s = np.cos(theta / 2), np.sin(theta / 2)
+    return np.stack([np.stack([c + 0j, -np.exp(1j * lam) * s], -1),
+                     np.stack([np.exp(1j * phi) * s, np.exp(1j * (phi + lam)) * c], -1)], -2)
+
+
+def _rxx(theta):
+    c, s = np.cos(theta / 2), np.sin(theta / 2)
+    mat = np.zeros(np.shape(theta) + (4, 4), dtype=complex)
+    for i in range(4):
+        mat[..., i, i] = c
+        mat[..., i, 3 - i] = -1j * s
+    return mat
+
+
+def _ryy(theta):
+    c, s = np.cos(theta / 2), np.sin(theta / 2)
+    mat = np.zeros(np.shape(theta) + (4, 4), dtype=complex)
+    for i in range(4):
+        mat[..., i, i] = c
+        # Las esquinas llevan +i·sen, la antidiagonal interior -i·sen
+        mat[..., i, 3 - i] = 1j * s if i in (0, 3) else -1j * s
+    return mat
+
+
+def _rzz(theta):
+    minus, plus = np.exp(-0.5j * theta), np.exp(0.5j * theta)
+    mat = np.zeros(np.shape(theta) + (4, 4), dtype=complex)
+    mat[..., 0, 0] = minus
+    mat[..., 1, 1] = plus
+    mat[..., 2, 2] = plus
+    mat[..., 3, 3] = minus
+    return mat
+
+
+_MATRIX_BUILDERS = {
+    'rx': _rx, 'ry': _ry, 'rz': _rz, 'p': _p, 'u': _u,
+    'rxx': _rxx, 'ryy': _ryy, 'rzz': _rzz,
+}
+
+
+def _param_evaluator(param, parameters):
+    """Devuelve una función que evalúa un parámetro de puerta para todo el lote"""
+    if isinstance(param, Parameter):
+        column = parameters.index(param)
+        return lambda values: values[:, column]
+    if isinstance(param, ParameterExpression):
+        expr_params = list(param.parameters)
+        columns = [parameters.index(p) for p in expr_params]
+        symbols = [sympy.Symbol(p.name) for p in expr_params]
+        func = sympy.lambdify(symbols, param.sympify(), modules='numpy', dummify=True)
+        return lambda values: np.real(func(*(values[:, c] for c in columns))) * np.ones(len(values))
+    constant = float(param)
+    return lambda values: np.full(len(values), constant)
+
+
+def compile_circuit(circuit):
+    """
+    Compila un circuito (posiblemente parametrizado) una sola vez.
+    Las puertas fijas quedan como matrices y las parametrizadas como
+    funciones vectorizadas sobre el lote de parámetros.
+    """
+    if isinstance(circuit, CompiledCircuit):
+        return circuit
+
+    unrolled = transpile(circuit.remove_final_measurements(inplace=False),
+                         basis_gates=PARAMETRIC_GATES + FIXED_GATES,
+                         optimization_level=0)
+    parameters = list(circuit.parameters)
+    operations = []
+
+    for instruction in unrolled.data:
+        op = instruction.operation
+        if op.name == 'barrier':
+            continue
+        qubits = [unrolled.find_bit(q).index for q in instruction.qubits]
+        if op.name in _MATRIX_BUILDERS and op.is_parameterized():
+            evaluators = [_param_evaluator(p, parameters) for p in op.params]
+            operations.append((qubits, _MATRIX_BUILDERS[op.name], evaluators))
+        else:
+            operations.append((qubits, op.to_matrix(), None))
+
+    # Fase global fija (float) o dependiente de los parámetros (función del lote, como los ángulos)
+    phase = unrolled.global_phase
+    if isinstance(phase, ParameterExpression) and phase.parameters:
+        global_phase = _param_evaluator(phase, parameters)
+    else:
+        global_phase = float(phase)
+    return CompiledCircuit(circuit.num_qubits, parameters, operations, global_phase)
+
+
+def _apply_matrix(states, matrix, qubits, num_qubits):
+    """
+    Aplica una matriz (compartida o una por fila) a los qubits indicados.
+    states tiene forma (lote,) + (2,)*n con el qubit q en el eje n - q.
+    """
+    batch = states.shape[0]
+    k = len(qubits)
+    # Convención de Qiskit: qargs[0] es el bit menos significativo de la matriz
+    axes = [num_qubits - q for q in reversed(qubits)]
+    moved = np.moveaxis(states, axes, range(1, k + 1)).reshape(batch, 2**k, -1)
+    if matrix.ndim == 2:
+        moved = np.einsum('ij,bjr->bir', matrix, moved)
+    else:
+        moved = np.einsum('bij,bjr->bir', matrix, moved)
+    moved = moved.reshape((batch,) + (2,) * num_qubits)
+    return np.moveaxis(moved, range(1, k + 1), axes)
+
+
+def simulate_batch(circuit, parameter_values=None, initial_state=None):
+    """
+    Calcula los statevectors de un circuito para muchos conjuntos de parámetros.
+    parameter_values: array (lote, num_parámetros) en el orden de circuit.parameters
+    Devuelve un array complejo de forma (lote, 2**n).
+    """
+    compiled = compile_circuit(circuit)
+    n = compiled.num_qubits
+
+    if parameter_values is None:
+        parameter_values = np.zeros((1, 0))
+    parameter_values = np.atleast_2d(np.asarray(parameter_values, dtype=float))
+    if parameter_values.shape[1] != len(compiled.parameters):
+        raise ValueError(f"Se esperaban {len(compiled.parameters)} parámetros, "
+                         f"se recibieron {parameter_values.shape[1]}")
+    batch = parameter_values.shape[0]
+
+    if initial_state is None:
+        states = np.zeros((batch, 2**n), dtype=complex)
+        states[:, 0] = 1.0
+    else:
+        states = np.broadcast_to(np.asarray(initial_state, dtype=complex),
+                                 (batch, 2**n)).copy()
+    states = states.reshape((batch,) + (2,) * n)
+
+    for qubits, matrix, evaluators in compiled.operations:
+        if evaluators is not None:
+            matrix = matrix(*(evaluate(parameter_values) for evaluate in evaluators))
+        states = _apply_matrix(states, matrix, qubits, n)
+
+    states = states.reshape(batch, 2**n)
+    if callable(compiled.global_phase):
+        states = states * np.exp(1j * compiled.global_phase(parameter_values))[:, None]
+    elif compiled.global_phase:
+        states = states * np.exp(1j * compiled.global_phase)
+    return states
+
+
+def expectation_values(states, operator):
+    """Calcula <ψ|H|ψ> para cada statevector del lote (H como SparsePauliOp)"""
+    matrix = operator.to_matrix(sparse=True)
+    h_states = (matrix @ states.T).T
+    return np.real(np.einsum('bi,bi->b', states.conj(), h_states))
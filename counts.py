@@ -0,0 +1,132 @@
+# Histograma de cuentas respaldado por arrays (índices enteros y cuentas) en lugar de dicts de bitstrings
+import numpy as np
+
+
+def _index_dtype(num_bits):
+    """int64 mientras quepa; para registros más anchos (MPS de 80 qubits) enteros de Python"""
+    return np.int64 if num_bits < 63 else object
+
+
+class CountsArray:
+    """
+    Cuentas de un experimento como dos arrays paralelos: índices de los
+    resultados (bit i del índice = clbit i, orden little-endian de Qiskit) y
+    número de veces que salió cada uno. Marginales, probabilidades y top-k
+    son operaciones vectorizadas; el dict de bitstrings de get_counts() solo
+    se construye si se pide (to_dict) y se guarda.
+    """
+
+    def __init__(self, indices, counts, num_bits, register_sizes=None):
+        indices = np.asarray(indices, dtype=_index_dtype(num_bits))
+        counts = np.asarray(counts, dtype=np.int64)
+        # Índices únicos y ordenados (se suman los repetidos)
+        self.indices, inverse = np.unique(indices, return_inverse=True)
+        self.counts = np.bincount(inverse.reshape(-1), weights=counts,
+                                  minlength=len(self.indices)).astype(np.int64)
+        self.num_bits = num_bits
+        # Tamaños de los registros clásicos (el primero es el menos significativo)
+        self.register_sizes = list(register_sizes) if register_sizes else [num_bits]
+        self._dict = None
+
+    @classmethod
+    def from_result(cls, result, experiment=0):
+        """Desde un Result de Aer, leyendo las claves hexadecimales sin pasar por get_counts()"""
+        data = result.data(experiment).get('counts', {})
+        header = result.results[experiment].header
+        register_sizes = [size for _, size in getattr(header, 'creg_sizes', None) or []]
+        num_bits = getattr(header, 'memory_slots', None) or sum(register_sizes)
+        indices = np.fromiter((int(key, 16) for key in data), dtype=_index_dtype(num_bits), count=len(data))
+        return cls(indices, list(data.values()), num_bits, register_sizes)
+
+    @classmethod
+    def from_dict(cls, counts, num_bits=None):
+        """Desde un dict de bitstrings (get_counts()), con espacios entre registros o sin ellos"""
+        keys = list(counts)
+        if num_bits is None:
+            num_bits = len(keys[0].replace(' ', '')) if keys else 0
+        register_sizes = [len(part) for part in reversed(keys[0].split(' '))] if keys else None
+        indices = np.fromiter((int(key.replace(' ', ''), 2) for key in keys),
+                              dtype=_index_dtype(num_bits), count=len(keys))
+        return cls(indices, list(counts.values()), num_bits, register_sizes)
+
+    @property
+    def shots(self):
+        return int(self.counts.sum())
+
+    def __len__(self):
+        return len(self.indices)
+
+    def __add__(self, other):
+        """Suma de dos histogramas del mismo circuito (por ejemplo, lotes de shots)"""
+        return CountsArray(np.concatenate([self.indices, other.indices]),
+                           np.concatenate([self.counts, other.counts]),
+                           self.num_bits, self.register_sizes)
+
+    def _lookup(self, key):
+        if isinstance(key, str):
+            key = int(key.replace(' ', ''), 2)
+        position = np.searchsorted(self.indices, key)
+        if position < len(self.indices) and self.indices[position] == key:
+            return int(self.counts[position])
+        return 0
+
+    def __getitem__(self, key):
+        return self._lookup(key)
+
+    def get(self, key, default=0):
+        """Cuenta de un resultado (bitstring o índice entero), como dict.get"""
+        count = self._lookup(key)
+        return count if count else default
+
+    def bit(self, position):
+        """Valor (0/1) del clbit en cada entrada del histograma"""
+        return ((self.indices >> position) & 1).astype(np.int64)
+
+    def marginal(self, bits):
+        """Histograma de los clbits pedidos (bits[0] pasa a ser el bit menos significativo)"""
+        bits = list(bits)
+        indices = np.zeros(len(self.indices), dtype=_index_dtype(len(bits)))
+        for j, position in enumerate(bits):
+            indices |= self.bit(position).astype(indices.dtype) << j
+        return CountsArray(indices, self.counts, len(bits))
+
+    def slice(self, start, stop=None):
+        """Marginal de un rango contiguo de clbits [start, stop)"""
+        if stop is None:
+            start, stop = 0, start
+        return self.marginal(range(start, stop))
+
+    def probabilities(self):
+        """Probabilidad de cada entrada (mismo orden que indices)"""
+        return self.counts / max(self.shots, 1)
+
+    def top_k(self, k):
+        """Los k resultados más frecuentes como [(bitstring, cuenta)], de mayor a menor"""
+        k = min(k, len(self.counts))
+        if k == 0:
+            return []
+        best = np.argpartition(-self.counts, k - 1)[:k]
+        best = best[np.argsort(-self.counts[best], kind='stable')]
+        return [(self.bitstring(self.indices[i]), int(self.counts[i])) for i in best]
+
+    def bitstring(self, index):
+        """Bitstring con el formato de get_counts() (registros separados por espacios)"""
+        bits = format(int(index), f'0{self.num_bits}b')
+        if len(self.register_sizes) <= 1:
+            return bits
+        parts, end = [], len(bits)
+        for size in self.register_sizes:
+            parts.append(bits[end - size:end])
+            end -= size
+        return ' '.join(reversed(parts))
+
+    def to_dict(self):
+        """Dict {bitstring: cuenta} como get_counts() (se construye una vez)"""
+        if self._dict is None:
+            self._dict = {self.bitstring(i): int(c) for i, c in zip(self.indices, self.counts)}
+        return self._dict
+
+    def probabilities_dict(self, shots=None):
+        """Dict {bitstring: probabilidad}; con shots se normaliza por ese total"""
+        total = shots or max(self.shots, 1)
+        return dict(zip(self.to_dict(), (self.counts / total).tolist()))
@@ -1,6 +1,6 @@
 # Ejemplo 1: Qubit Básico - Estados |0⟩ y |1⟩
 from qiskit import QuantumCircuit, transpile
-from qiskit_aer import AerSimulator
+from simulators import get_simulator
 from qiskit.visualization import plot_histogram
 import matplotlib.pyplot as plt
 
@@ -12,7 +12,7 @@ print("\n--- Estado |0⟩ ---")
 qc_0 = QuantumCircuit(1, 1)
 qc_0.measure(0, 0)
 
-simulator = AerSimulator()
+simulator = get_simulator()
 job_0 = simulator.run(transpile(qc_0, simulator), shots=1000)
 result_0 = job_0.result()
 counts_0 = result_0.get_counts(qc_0)
@@ -1,11 +1,11 @@
 # Ejemplo 2: Puertas Cuánticas Básicas
 from qiskit import QuantumCircuit, transpile
-from qiskit_aer import AerSimulator
+from simulators import get_simulator
 import numpy as np
 
 print("=== EJEMPLO 2: PUERTAS CUÁNTICAS BÁSICAS ===")
 
-simulator = AerSimulator()
+simulator = get_simulator()
 
 # 1. Puerta X (NOT cuántico)
 print("\n--- Puerta X (NOT) ---")
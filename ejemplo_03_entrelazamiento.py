@@ -1,12 +1,12 @@
 # Ejemplo 3: Entrelazamiento Cuántico
-from qiskit import QuantumCircuit, transpile
-from qiskit_aer import AerSimulator
+from qiskit import QuantumCircuit
+import numpy as np
+
+from simulators import mps_truncation_report, run_circuit
 
 print("=== EJEMPLO 3: ENTRELAZAMIENTO CUÁNTICO ===")
 print("Creando pares de qubits entrelazados")
 
-simulator = AerSimulator()
-
 # 1. Estado de Bell |Φ+⟩ = (|00⟩ + |11⟩)/√2
 print("\n--- Estado de Bell |Φ+⟩ ---")
 qc_bell = QuantumCircuit(2, 2)
@@ -14,7 +14,7 @@ qc_bell.h(0)        # Superposición en qubit 0
 qc_bell.cx(0, 1)    # CNOT: entrelaza qubit 0 con qubit 1
 qc_bell.measure([0, 1], [0, 1])
 
-job = simulator.run(transpile(qc_bell, simulator), shots=1000)
+job = run_circuit(qc_bell, shots=1000)
 counts = job.result().get_counts(qc_bell)
 print(f"Resultados: {counts}")
 print("Solo obtenemos |00⟩ y |11⟩ - ¡Los qubits están entrelazados!")
@@ -28,7 +28,7 @@ qc_bell_minus.z(0)      # Fase negativa
 qc_bell_minus.cx(0, 1)
 qc_bell_minus.measure([0, 1], [0, 1])
 
-job = simulator.run(transpile(qc_bell_minus, simulator), shots=1000)
+job = run_circuit(qc_bell_minus, shots=1000)
 counts = job.result().get_counts(qc_bell_minus)
 print(f"Resultados: {counts}")
 print(qc_bell_minus.draw())
@@ -41,7 +41,7 @@ qc_psi_plus.cx(0, 1)
 qc_psi_plus.x(1)        # Flip del segundo qubit
 qc_psi_plus.measure([0, 1], [0, 1])
 
-job = simulator.run(transpile(qc_psi_plus, simulator), shots=1000)
+job = run_circuit(qc_psi_plus, shots=1000)
 counts = job.result().get_counts(qc_psi_plus)
 print(f"Resultados: {counts}")
 print("Solo obtenemos |01⟩ y |10⟩ - Estados anti-correlacionados")
@@ -62,8 +62,28 @@ qc_ghz.cx(0, 1)
 qc_ghz.cx(1, 2)
 qc_ghz.measure([0, 1, 2], [0, 1, 2])
 
-job = simulator.run(transpile(qc_ghz, simulator), shots=1000)
+job = run_circuit(qc_ghz, shots=1000)
 counts = job.result().get_counts(qc_ghz)
 print(f"Resultados: {counts}")
 print("Estado GHZ: (|000⟩ + |111⟩)/√2")
 print(qc_ghz.draw())
+
+# 6. Cadena GHZ ancha con MPS (Matrix Product State)
+print("\n--- Cadena tipo GHZ de 80 qubits (MPS) ---")
+# cos(θ/2)|00...0⟩ + sin(θ/2)|11...1⟩: con RY no es Clifford y el statevector
+# necesitaría 2^80 amplitudes, pero el entrelazamiento entre vecinos es pequeño
+n_wide = 80
+qc_wide = QuantumCircuit(n_wide)
+qc_wide.ry(np.pi / 3, 0)
+for i in range(n_wide - 1):
+    qc_wide.cx(i, i + 1)
+qc_wide.measure_all()
+
+job = run_circuit(qc_wide, shots=1000, max_bond_dimension=16)
+result = job.result()
+counts = result.get_counts()
+print(f"Resultados: { {state[:4] + '...' + state[-4:]: count for state, count in counts.items()} }")
+print("Esperado: 75% |00...0⟩ y 25% |11...1⟩")
+report = mps_truncation_report(result)
+print(f"Dimensión de enlace máxima: {report['max_bond_dimension']}, "
+      f"peso descartado: {report['discarded_weight']:.2e}")
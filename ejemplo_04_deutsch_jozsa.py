@@ -1,30 +1,32 @@
 # Ejemplo 4: Algoritmo de Deutsch-Jozsa
-from qiskit import QuantumCircuit, transpile
-from qiskit_aer import AerSimulator
+from qiskit import QuantumCircuit
+import numpy as np
+
+from oracle_compiler import compile_oracle
+from simulators import run_circuit
 
 print("=== EJEMPLO 4: ALGORITMO DE DEUTSCH-JOZSA ===")
 print("Determina si una función es constante o balanceada en una sola consulta")
 
-simulator = AerSimulator()
-
 def deutsch_jozsa_oracle(function_type, n_qubits):
     """
     Crea un oráculo para el algoritmo de Deutsch-Jozsa
-    function_type: 'constant_0', 'constant_1', 'balanced'
+    function_type: 'constant_0', 'constant_1', 'balanced' o una tabla de verdad
+    (array de 2^n valores 0/1, máscara de bits o función f(x))
     """
-    oracle = QuantumCircuit(n_qubits + 1)
-    
-    if function_type == 'constant_0':
+    named_functions = {
         # f(x) = 0 para todos los x (no hacer nada)
-        pass
-    elif function_type == 'constant_1':
-        # f(x) = 1 para todos los x
-        oracle.x(n_qubits)  # Flip del qubit auxiliar
-    elif function_type == 'balanced':
+        'constant_0': 0,
+        # f(x) = 1 para todos los x (máscara con los 2^n bits a 1)
+        'constant_1': 2**(2**n_qubits) - 1,
         # f(x) = x₀ (función balanceada simple)
-        oracle.cx(0, n_qubits)  # CNOT del primer qubit al auxiliar
-    
-    return oracle
+        'balanced': lambda x: x & 1,
+    }
+    if isinstance(function_type, str):
+        function_type = named_functions[function_type]
+
+    # El compilador sintetiza |x⟩|y⟩ → |x⟩|y ⊕ f(x)⟩ con el menor número de puertas
+    return compile_oracle(function_type, n_qubits)
 
 def deutsch_jozsa_algorithm(oracle, n_qubits):
     """Implementa el algoritmo de Deutsch-Jozsa"""
@@ -59,7 +61,7 @@ print("\n--- Función Constante f(x) = 0 ---")
 oracle_const_0 = deutsch_jozsa_oracle('constant_0', n_qubits)
 qc_const_0 = deutsch_jozsa_algorithm(oracle_const_0, n_qubits)
 
-job = simulator.run(transpile(qc_const_0, simulator), shots=1000)
+job = run_circuit(qc_const_0, shots=1000)
 counts = job.result().get_counts(qc_const_0)
 print(f"Resultados: {counts}")
 print("Resultado: 00 → Función CONSTANTE")
@@ -70,7 +72,7 @@ print("\n--- Función Constante f(x) = 1 ---")
 oracle_const_1 = deutsch_jozsa_oracle('constant_1', n_qubits)
 qc_const_1 = deutsch_jozsa_algorithm(oracle_const_1, n_qubits)
 
-job = simulator.run(transpile(qc_const_1, simulator), shots=1000)
+job = run_circuit(qc_const_1, shots=1000)
 counts = job.result().get_counts(qc_const_1)
 print(f"Resultados: {counts}")
 print("Resultado: 00 → Función CONSTANTE")
@@ -80,12 +82,27 @@ print("\n--- Función Balanceada f(x) = x₀ ---")
 oracle_balanced = deutsch_jozsa_oracle('balanced', n_qubits)
 qc_balanced = deutsch_jozsa_algorithm(oracle_balanced, n_qubits)
 
-job = simulator.run(transpile(qc_balanced, simulator), shots=1000)
+job = run_circuit(qc_balanced, shots=1000)
 counts = job.result().get_counts(qc_balanced)
 print(f"Resultados: {counts}")
 print("Resultado: ≠ 00 → Función BALANCEADA")
 print(qc_balanced.draw())
 
+# 4. Función balanceada arbitraria dada por su tabla de verdad
+print("\n--- Función Balanceada Aleatoria (tabla de verdad, 3 qubits) ---")
+rng = np.random.default_rng(7)
+random_table = np.zeros(2**3, dtype=int)
+random_table[rng.permutation(2**3)[:2**2]] = 1
+print(f"f(x) para x = 0..7: {random_table.tolist()}")
+oracle_random = deutsch_jozsa_oracle(random_table, 3)
+print(f"Puertas del oráculo: {dict(oracle_random.count_ops())}")
+qc_random = deutsch_jozsa_algorithm(oracle_random, 3)
+
+job = run_circuit(qc_random, shots=1000)
+counts = job.result().get_counts(qc_random)
+print(f"Resultados: {counts}")
+print("Resultado: ≠ 000 → Función BALANCEADA")
+
 print("\n--- Ventaja Cuántica ---")
 print("Clásicamente: necesitarías 2^(n-1) + 1 consultas en el peor caso")
 print("Cuánticamente: ¡Solo 1 consulta!")
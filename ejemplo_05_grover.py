@@ -1,48 +1,33 @@
 # Ejemplo 5: Algoritmo de Grover (Búsqueda Cuántica)
+import time
+
 from qiskit import QuantumCircuit, transpile
-from qiskit_aer import AerSimulator
 import numpy as np
 
+from adaptive_sampling import adaptive_sample
+from oracle_compiler import ancillas_required, append_mcz, compile_oracle, marked_items_table
+from simulators import get_simulator
+
 print("=== EJEMPLO 5: ALGORITMO DE GROVER ===")
 print("Búsqueda cuántica en base de datos no ordenada")
 
-simulator = AerSimulator()
+simulator = get_simulator()
 
-def grover_oracle(marked_items, n_qubits):
+def grover_oracle(marked_items, n_qubits, strategy='noancilla'):
     """
     Crea un oráculo que marca los elementos buscados
-    marked_items: lista de elementos a marcar (en binario)
+    marked_items: lista de elementos a marcar (enteros; el bit i es el qubit i)
+    strategy: descomposición de las Z multicontroladas ('noancilla', 'v-chain', 'dirty')
     """
-    oracle = QuantumCircuit(n_qubits)
-    
-    for item in marked_items:
-        # Convertir el item a binario y aplicar Z a los qubits correspondientes
-        binary = format(item, f'0{n_qubits}b')
-        
-        # Aplicar X a los qubits que deben ser 0
-        for i, bit in enumerate(binary):
-            if bit == '0':
-                oracle.x(i)
-        
-        # Aplicar Z controlado múltiple
-        if n_qubits == 1:
-            oracle.z(0)
-        elif n_qubits == 2:
-            oracle.cz(0, 1)
-        else:
-            # Para más qubits, usar Z controlado múltiple
-            oracle.mcp(np.pi, list(range(n_qubits-1)), n_qubits-1)
-        
-        # Deshacer las X
-        for i, bit in enumerate(binary):
-            if bit == '0':
-                oracle.x(i)
-    
-    return oracle
-
-def grover_diffuser(n_qubits):
-    """Operador de difusión de Grover"""
-    diffuser = QuantumCircuit(n_qubits)
+    # Oráculo de fase (-1)^f(x) sintetizado desde la tabla de verdad: varios
+    # elementos marcados comparten términos en lugar de un X/mcp/X por elemento
+    return compile_oracle(marked_items_table(marked_items, n_qubits), n_qubits,
+                          mode='phase', strategy=strategy)
+
+def grover_diffuser(n_qubits, strategy='noancilla'):
+    """Operador de difusión de Grover (las ancillas, si hacen falta, van tras los n qubits)"""
+    ancillas = list(range(n_qubits, n_qubits + ancillas_required(n_qubits - 1, strategy)))
+    diffuser = QuantumCircuit(n_qubits + len(ancillas))
     
     # Aplicar H a todos los qubits
     for i in range(n_qubits):
@@ -53,12 +38,7 @@ def grover_diffuser(n_qubits):
         diffuser.x(i)
     
     # Z controlado múltiple
-    if n_qubits == 1:
-        diffuser.z(0)
-    elif n_qubits == 2:
-        diffuser.cz(0, 1)
-    else:
-        diffuser.mcp(np.pi, list(range(n_qubits-1)), n_qubits-1)
+    append_mcz(diffuser, list(range(n_qubits)), strategy, ancillas)
     
     # Deshacer las X
     for i in range(n_qubits):
@@ -70,27 +50,29 @@ def grover_diffuser(n_qubits):
     
     return diffuser
 
-def grover_algorithm(marked_items, n_qubits):
+def grover_algorithm(marked_items, n_qubits, strategy='noancilla'):
     """Implementa el algoritmo de Grover"""
     # Número óptimo de iteraciones
     N = 2**n_qubits
     iterations = int(np.pi/4 * np.sqrt(N))
     
-    qc = QuantumCircuit(n_qubits, n_qubits)
+    # Ancillas para la mayor puerta multicontrolada (n-1 controles)
+    num_ancillas = ancillas_required(n_qubits - 1, strategy)
+    qc = QuantumCircuit(n_qubits + num_ancillas, n_qubits)
     
     # 1. Inicialización: superposición uniforme
     for i in range(n_qubits):
         qc.h(i)
     
     # 2. Iteraciones de Grover
-    oracle = grover_oracle(marked_items, n_qubits)
-    diffuser = grover_diffuser(n_qubits)
+    oracle = grover_oracle(marked_items, n_qubits, strategy)
+    diffuser = grover_diffuser(n_qubits, strategy)
     
     for _ in range(iterations):
         # Aplicar oráculo
-        qc = qc.compose(oracle)
+        qc = qc.compose(oracle, qubits=range(oracle.num_qubits))
         # Aplicar difusor
-        qc = qc.compose(diffuser)
+        qc = qc.compose(diffuser, qubits=range(diffuser.num_qubits))
     
     # 3. Medición
     qc.measure(range(n_qubits), range(n_qubits))
@@ -111,11 +93,11 @@ print(f"Elemento buscado: {marked_items[0]} (binario: {format(marked_items[0], f
 print(f"Iteraciones de Grover: {iterations}")
 print(f"Resultados: {counts}")
 
-# Calcular probabilidad de éxito
-total_shots = sum(counts.values())
-success_count = counts.get(format(marked_items[0], f'0{n_qubits}b'), 0)
-success_probability = success_count / total_shots
-print(f"Probabilidad de éxito: {success_probability:.2%}")
+# Calcular probabilidad de éxito con muestreo adaptativo (IC 95% de semianchura 1%)
+success = adaptive_sample(qc_grover, [format(marked_items[0], f'0{n_qubits}b')], precision=0.01)
+lower, upper = success.intervals[0]
+print(f"Probabilidad de éxito: {success.estimates[0]:.2%} "
+      f"(IC 95%: [{lower:.2%}, {upper:.2%}], {success.shots} shots)")
 
 print(qc_grover.draw())
 
@@ -141,3 +123,24 @@ print(f"Base de datos de {N} elementos:")
 print(f"Búsqueda clásica promedio: {classical_average} consultas")
 print(f"Búsqueda cuántica: {quantum_iterations} iteraciones")
 print(f"Aceleración: ~{classical_average/quantum_iterations:.1f}x")
+
+# Comparación de descomposiciones de las puertas multicontroladas (benchmark de ~15 s):
+# solo al ejecutar el script, no cuando el servidor hace exec del ejemplo
+if __name__ == '__main__':
+    print("\n--- Descomposición de Z multicontroladas ---")
+    print("noancilla: sin qubits extra | v-chain: n-3 ancillas limpias | dirty: n-3 ancillas en cualquier estado")
+    print(f"{'n':>3} {'estrategia':>10} {'qubits':>7} {'profundidad':>12} {'CX':>6} {'P(éxito)':>9} {'± IC 95%':>9} {'shots':>6} {'tiempo':>8}")
+    for n_bench in [5, 7, 9]:
+        target = 2**n_bench - 3
+        for strategy in ['noancilla', 'v-chain', 'dirty']:
+            qc_bench, _ = grover_algorithm([target], n_bench, strategy)
+            compiled = transpile(qc_bench, basis_gates=['cx', 'u'], optimization_level=1)
+            start = time.perf_counter()
+            success = adaptive_sample(qc_bench, [format(target, f'0{n_bench}b')], precision=0.01)
+            elapsed = time.perf_counter() - start
+            lower, upper = success.intervals[0]
+            print(f"{n_bench:>3} {strategy:>10} {qc_bench.num_qubits:>7} {compiled.depth():>12} "
+                  f"{compiled.count_ops().get('cx', 0):>6} {success.estimates[0]:>9.1%} "
+                  f"{(upper - lower) / 2:>9.1%} {success.shots:>6} {elapsed:>7.2f}s")
+    print("Las ancillas reducen la profundidad y los CX del circuito descompuesto; Aer aplica las")
+    print("puertas multicontroladas de forma nativa, así que en simulación cada ancilla duplica el statevector")
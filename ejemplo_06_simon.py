@@ -1,13 +1,13 @@
 # Ejemplo 6: Algoritmo de Simon
-from qiskit import QuantumCircuit, transpile
-from qiskit_aer import AerSimulator
+from qiskit import QuantumCircuit
 import numpy as np
 
+from oracle_compiler import compile_oracle
+from simulators import run_circuit
+
 print("=== EJEMPLO 6: ALGORITMO DE SIMON ===")
 print("Encuentra el período oculto de una función")
 
-simulator = AerSimulator()
-
 def simon_oracle(secret_string):
     """
     Crea un oráculo para el algoritmo de Simon
@@ -15,27 +15,17 @@ def simon_oracle(secret_string):
     La función satisface f(x) = f(x ⊕ s) para s ≠ 0
     """
     n = len(secret_string)
-    oracle = QuantumCircuit(2 * n)
-    
-    # Convertir string secreto a lista de bits
-    s = [int(bit) for bit in secret_string]
-    
-    # Implementar f(x) = f(x ⊕ s)
-    # Para simplicidad, usamos f(x) = x si x < s, sino f(x) = x ⊕ s
-    
-    # Copiar x a la salida
-    for i in range(n):
-        oracle.cx(i, n + i)
-    
-    # Si s ≠ 0, aplicar la propiedad f(x) = f(x ⊕ s)
-    if any(s):
-        # Para cada bit del string secreto
-        for i in range(n):
-            if s[i] == 1:
-                # Aplicar XOR condicional
-                oracle.cx(i, n + i)
-    
-    return oracle
+
+    # Orden de Qiskit: el último carácter de s corresponde al qubit 0
+    s = int(secret_string, 2)
+
+    # f(x) = min(x, x ⊕ s): dos entradas por salida si s ≠ 0 (uno a uno si s = 0)
+    x = np.arange(2**n)
+    fx = np.minimum(x, x ^ s)
+    table = (fx[:, None] >> np.arange(n)) & 1
+
+    # Oráculo |x⟩|y⟩ → |x⟩|y ⊕ f(x)⟩ con una salida por qubit n + j
+    return compile_oracle(table, n)
 
 def simon_algorithm(secret_string):
     """Implementa el algoritmo de Simon"""
@@ -63,7 +53,7 @@ def simon_algorithm(secret_string):
         qc.measure(range(n), range(n))
         
         # Ejecutar el circuito
-        job = simulator.run(transpile(qc, simulator), shots=1)
+        job = run_circuit(qc, shots=1)
         result = job.result().get_counts(qc)
         
         # Obtener el resultado (solo uno debido a shots=1)
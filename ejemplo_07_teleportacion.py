@@ -1,12 +1,16 @@
 # Ejemplo 7: Teleportación Cuántica
 from qiskit import QuantumCircuit, transpile
-from qiskit_aer import AerSimulator
+from qiskit.circuit import Parameter
 import numpy as np
 
+from adaptive_sampling import adaptive_sample
+from batched_statevector import simulate_batch
+from simulators import get_simulator
+
 print("=== EJEMPLO 7: TELEPORTACIÓN CUÁNTICA ===")
 print("Transferir el estado de un qubit usando entrelazamiento")
 
-simulator = AerSimulator()
+simulator = get_simulator()
 
 def create_bell_pair():
     """Crea un par de Bell entrelazado"""
@@ -135,30 +139,91 @@ print("5. Bob aplica correcciones según los bits recibidos")
 print("6. ¡El qubit de Bob ahora está en el estado |ψ⟩ original!")
 print("\n¡Importante! El estado original de Alice se destruye (no-cloning theorem)")
 
-# Verificación estadística
-def verify_teleportation(counts, expected_prob_0):
-    """Verifica si la teleportación fue exitosa estadísticamente"""
-    total = sum(counts.values())
-    
-    # Contar cuántas veces Bob obtuvo 0 (último bit = 0)
-    bob_0_count = sum(count for state, count in counts.items() if state[-1] == '0')
-    bob_1_count = total - bob_0_count
-    
-    actual_prob_0 = bob_0_count / total
-    actual_prob_1 = bob_1_count / total
+# Verificación estadística con muestreo adaptativo
+def verify_teleportation(circuit, expected_prob_0, tolerance=0.05):
+    """
+    Verifica si la teleportación fue exitosa estadísticamente: se lanzan shots
+    en lotes hasta que el intervalo de confianza del 95% (Wilson) de P(Bob = 0)
+    tiene semianchura tolerance/3, y es exitosa si todo el intervalo queda a
+    menos de tolerance de la probabilidad esperada. Los estados deterministas
+    necesitan unos cientos de shots y los equiprobables unos miles.
+    """
+    # Bob es el clbit 2: marginal vectorizada sobre el histograma, sin recorrer bitstrings
+    result = adaptive_sample(circuit, [lambda counts: counts.marginal([2])['0']], precision=tolerance / 3)
+    actual_prob_0 = result.estimates[0]
+    lower, upper = result.intervals[0]
     
     print(f"\nVerificación estadística:")
     print(f"Probabilidad esperada |0⟩: {expected_prob_0:.2%}")
-    print(f"Probabilidad medida |0⟩: {actual_prob_0:.2%}")
-    print(f"Probabilidad medida |1⟩: {actual_prob_1:.2%}")
+    print(f"Probabilidad medida |0⟩: {actual_prob_0:.2%} (IC 95%: [{lower:.2%}, {upper:.2%}])")
+    print(f"Probabilidad medida |1⟩: {1 - actual_prob_0:.2%}")
+    print(f"Shots usados: {result.shots} en {result.batches} lotes")
     
-    error = abs(actual_prob_0 - expected_prob_0)
-    if error < 0.05:  # 5% de tolerancia
+    error = max(abs(lower - expected_prob_0), abs(upper - expected_prob_0))
+    if error < tolerance:
         print("✓ Teleportación exitosa!")
     else:
         print("✗ Error en la teleportación")
 
 # Verificar algunos casos
 print("\n=== VERIFICACIONES ===")
-verify_teleportation(counts_0, 1.0)  # |0⟩ debería dar 100% |0⟩
-verify_teleportation(counts_plus, 0.5)  # |+⟩ debería dar 50% |0⟩
+verify_teleportation(qc_0, 1.0)  # |0⟩ debería dar 100% |0⟩
+verify_teleportation(qc_plus, 0.5)  # |+⟩ debería dar 50% |0⟩
+
+# Verificación exacta: fidelidad del estado de Bob sin muestreo
+def teleportation_fidelity_circuit():
+    """
+    Protocolo sin mediciones para un estado de entrada parametrizado
+    |ψ(θ, φ)⟩ = RZ(φ)·RY(θ)|0⟩. Las correcciones de Bob se aplican de forma
+    coherente (cx y cz controlados por los qubits de Alice), lo que por el
+    principio de medición diferida deja a Bob en el mismo estado.
+    """
+    theta, phi = Parameter('theta'), Parameter('phi')
+    qc = QuantumCircuit(3)
+    qc.ry(theta, 0)
+    qc.rz(phi, 0)
+    qc.h(1)
+    qc.cx(1, 2)
+    qc.cx(0, 1)
+    qc.h(0)
+    qc.cx(1, 2)
+    qc.cz(0, 2)
+    return qc, theta, phi
+
+def bloch_sphere_points(num_states):
+    """Ángulos (θ, φ) casi uniformes sobre la esfera de Bloch (espiral de Fibonacci)"""
+    k = np.arange(num_states) + 0.5
+    theta = np.arccos(1 - 2 * k / num_states)
+    phi = (np.pi * (1 + np.sqrt(5)) * k) % (2 * np.pi)
+    return theta, phi
+
+def verify_teleportation_exact(num_states=2000, tolerance=1e-9):
+    """
+    Calcula la fidelidad exacta F = ⟨ψ|ρ_Bob|ψ⟩ para muchos estados de entrada
+    en una sola simulación por lotes. ρ_Bob es la traza parcial sobre los
+    qubits de Alice del statevector final.
+    """
+    qc, theta, phi = teleportation_fidelity_circuit()
+    thetas, phis = bloch_sphere_points(num_states)
+    angles = {theta: thetas, phi: phis}
+    values = np.stack([angles[p] for p in qc.parameters], axis=1)
+
+    # Ejes (lote, q2, q1, q0): Bob es el qubit 2, el más significativo
+    states = simulate_batch(qc, values).reshape(num_states, 2, 2, 2)
+    rho_bob = np.einsum('bijk,bljk->bil', states, states.conj())
+
+    # Estado de entrada con la misma fase relativa que RZ(φ)·RY(θ)|0⟩
+    psi = np.stack([np.exp(-0.5j * phis) * np.cos(thetas / 2),
+                    np.exp(0.5j * phis) * np.sin(thetas / 2)], axis=1)
+    fidelities = np.einsum('bi,bij,bj->b', psi.conj(), rho_bob, psi).real
+
+    print(f"\nVerificación exacta ({num_states} estados sobre la esfera de Bloch):")
+    print(f"Fidelidad mínima: {fidelities.min():.12f}")
+    print(f"Fidelidad media:  {fidelities.mean():.12f}")
+    if np.all(fidelities > 1 - tolerance):
+        print("✓ Teleportación exitosa para todos los estados!")
+    else:
+        print(f"✗ {np.sum(fidelities <= 1 - tolerance)} estados con fidelidad baja")
+    return fidelities
+
+verify_teleportation_exact()
@@ -1,12 +1,12 @@
 # Ejemplo 8: Transformada Cuántica de Fourier (QFT)
 from qiskit import QuantumCircuit, transpile
-from qiskit_aer import AerSimulator
+from simulators import get_simulator
 import numpy as np
 
 print("=== EJEMPLO 8: TRANSFORMADA CUÁNTICA DE FOURIER (QFT) ===")
 print("Versión cuántica de la Transformada Discreta de Fourier")
 
-simulator = AerSimulator()
+simulator = get_simulator()
 
 def qft_rotations(circuit, n):
     """Aplica las rotaciones de la QFT"""
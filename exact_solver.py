@@ -0,0 +1,83 @@
+# Diagonalización exacta dispersa de Hamiltonianos como referencia para VQE/QAOA
+import hashlib
+import os
+
+import numpy as np
+from scipy.sparse.linalg import eigsh
+
+# Directorio de caché en disco (un .npz por Hamiltoniano y número de autovalores)
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'exact')
+
+# Por debajo de este número de qubits la diagonalización densa es más rápida que eigsh
+DENSE_LIMIT = 10
+
+
+def hamiltonian_hash(hamiltonian):
+    """Huella estable de un SparsePauliOp (independiente del orden de los términos)"""
+    simplified = hamiltonian.simplify()
+    terms = sorted(zip(simplified.paulis.to_labels(),
+                       np.round(simplified.coeffs, 12).tolist()))
+    digest = hashlib.sha256(f"{hamiltonian.num_qubits}|{terms}".encode())
+    return digest.hexdigest()[:24]
+
+
+def _diagonalize(hamiltonian, k, return_vectors):
+    """Calcula los k autovalores más bajos (y opcionalmente sus autovectores)"""
+    n = hamiltonian.num_qubits
+    dim = 2**n
+
+    # Hamiltonianos solo con Z e I (Ising, Max-Cut): la matriz ya es diagonal
+    if not hamiltonian.paulis.x.any():
+        diagonal = np.real(hamiltonian.to_matrix(sparse=True).diagonal())
+        indices = np.argpartition(diagonal, k - 1)[:k] if k < dim else np.arange(dim)
+        indices = indices[np.argsort(diagonal[indices])]
+        vectors = None
+        if return_vectors:
+            vectors = np.zeros((dim, k), dtype=complex)
+            vectors[indices, np.arange(k)] = 1.0
+        return diagonal[indices], vectors
+
+    matrix = hamiltonian.to_matrix(sparse=True)
+    if n <= DENSE_LIMIT or k >= dim - 1:
+        values, vectors = np.linalg.eigh(matrix.toarray())
+        values, vectors = values[:k], vectors[:, :k]
+    else:
+        values, vectors = eigsh(matrix, k=k, which='SA')
+        order = np.argsort(values)
+        values, vectors = values[order], vectors[:, order]
+
+    return np.real(values), (vectors if return_vectors else None)
+
+
+def exact_eigenpairs(hamiltonian, k=1, return_vectors=False, cache=True, cache_dir=CACHE_DIR):
+    """
+    Obtiene los k estados de menor energía de un SparsePauliOp.
+    Los resultados se guardan en disco indexados por la huella del Hamiltoniano,
+    así que repetir la referencia de un mismo problema no vuelve a diagonalizar.
+    Devuelve (autovalores, autovectores) con autovectores=None si no se piden.
+    """
+    path = os.path.join(cache_dir, f"{hamiltonian_hash(hamiltonian)}_k{k}.npz")
+
+    if cache and os.path.exists(path):
+        with np.load(path) as data:
+            if not return_vectors:
+                return data['values'], None
+            if 'vectors' in data:
+                return data['values'], data['vectors']
+
+    values, vectors = _diagonalize(hamiltonian, k, return_vectors)
+
+    if cache:
+        os.makedirs(cache_dir, exist_ok=True)
+        if return_vectors:
+            np.savez(path, values=values, vectors=vectors)
+        else:
+            np.savez(path, values=values)
+
+    return values, vectors
+
+
+def exact_ground_energy(hamiltonian, **kwargs):
+    """Energía exacta del estado fundamental"""
+    values, _ = exact_eigenpairs(hamiltonian, k=1, **kwargs)
+    return float(values[0])
@@ -0,0 +1,75 @@
+# Constructores escalables de Hamiltonianos (Ising y Max-Cut) sin cadenas de Pauli
+import numpy as np
+from qiskit.quantum_info import PauliList, SparsePauliOp
+
+
+def _pauli_operator(num_qubits, zz_pairs, zz_coeffs, x_qubits=None, x_coeffs=None):
+    """
+    Construye Σ c·ZᵢZⱼ + Σ c·Xₖ directamente en forma simpléctica.
+    Las matrices z/x se rellenan con indexado vectorizado, sin un bucle
+    de Python por término ni etiquetas de n caracteres.
+    """
+    zz_pairs = np.asarray(zz_pairs, dtype=np.int64).reshape(-1, 2)
+    x_qubits = np.asarray([] if x_qubits is None else x_qubits, dtype=np.int64)
+    num_zz, num_x = len(zz_pairs), len(x_qubits)
+
+    z = np.zeros((num_zz + num_x, num_qubits), dtype=bool)
+    x = np.zeros_like(z)
+    rows = np.arange(num_zz)
+    z[rows, zz_pairs[:, 0]] = True
+    z[rows, zz_pairs[:, 1]] = True
+    x[num_zz + np.arange(num_x), x_qubits] = True
+
+    coeffs = np.concatenate([np.broadcast_to(np.asarray(zz_coeffs, dtype=float), (num_zz,)),
+                             np.broadcast_to(np.asarray(0.0 if x_coeffs is None else x_coeffs,
+                                                        dtype=float), (num_x,))])
+    return SparsePauliOp(PauliList.from_symplectic(z, x), coeffs)
+
+
+def chain_edges(num_sites, periodic=False):
+    """Aristas (i, i+1) de una cadena 1D como array (m, 2)"""
+    sites = np.arange(num_sites if periodic and num_sites > 2 else num_sites - 1)
+    return np.stack([sites, (sites + 1) % num_sites], axis=1)
+
+
+def lattice_edges_2d(rows, cols, periodic=False):
+    """Aristas entre vecinos de una red rectangular rows x cols (sitio = fila*cols + columna)"""
+    index = np.arange(rows * cols).reshape(rows, cols)
+    if periodic:
+        horizontal = np.stack([index, np.roll(index, -1, axis=1)], axis=-1)
+        vertical = np.stack([index, np.roll(index, -1, axis=0)], axis=-1)
+        if cols <= 2:
+            horizontal = horizontal[:, :cols - 1]
+        if rows <= 2:
+            vertical = vertical[:rows - 1]
+    else:
+        horizontal = np.stack([index[:, :-1], index[:, 1:]], axis=-1)
+        vertical = np.stack([index[:-1, :], index[1:, :]], axis=-1)
+    return np.concatenate([horizontal.reshape(-1, 2), vertical.reshape(-1, 2)])
+
+
+def ising_hamiltonian(edges, num_qubits, J=1.0, h=0.5):
+    """Modelo de Ising transverso H = -J Σ ZᵢZⱼ - h Σ Xᵢ sobre un array de aristas"""
+    return _pauli_operator(num_qubits, edges, -J, np.arange(num_qubits), -h)
+
+
+def ising_chain(num_qubits, J=1.0, h=0.5, periodic=False):
+    """Cadena de Ising 1D con acoplamiento J y campo transverso h"""
+    return ising_hamiltonian(chain_edges(num_qubits, periodic), num_qubits, J, h)
+
+
+def ising_lattice_2d(rows, cols, J=1.0, h=0.5, periodic=False):
+    """Red de Ising 2D rows x cols con acoplamiento J y campo transverso h"""
+    return ising_hamiltonian(lattice_edges_2d(rows, cols, periodic), rows * cols, J, h)
+
+
+def maxcut_hamiltonian(edges, num_nodes=None, weights=None):
+    """
+    Hamiltoniano de Max-Cut Σ (wᵢⱼ/2)·ZᵢZⱼ a partir de un array de aristas (m, 2).
+    El nodo i corresponde al qubit i; minimizarlo equivale a maximizar el corte.
+    """
+    edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+    if num_nodes is None:
+        num_nodes = int(edges.max()) + 1 if len(edges) else 0
+    weights = 1.0 if weights is None else np.asarray(weights, dtype=float)
+    return _pauli_operator(num_nodes, edges, 0.5 * weights)
@@ -0,0 +1,163 @@
+# Resolución por lotes de Max-Cut desde archivos de aristas (sin interfaz gráfica)
+#
+# Uso:
+#   python maxcut_batch.py grafos/*.txt --reps 2 --workers 4 --output resultados.parquet
+#
+# Cada archivo contiene una arista por línea: "u v" o "u v peso" (las líneas con # se ignoran).
+# También se aceptan arrays .npy de forma (m, 2) o (m, 3).
+import argparse
+import csv
+import glob
+import hashlib
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from qaoa_maxcut import cut_values, solve_maxcut_qaoa
+
+EDGE_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'edges')
+
+
+def load_edges(path, cache_dir=EDGE_CACHE_DIR):
+    """
+    Devuelve el array de aristas mapeado en memoria (np.load con mmap_mode='r').
+    Los archivos de texto se convierten una vez a .npy en la caché; las
+    siguientes lecturas no vuelven a parsear el texto.
+    """
+    if path.endswith('.npy'):
+        return np.load(path, mmap_mode='r')
+
+    stat = os.stat(path)
+    key = hashlib.sha1(f"{os.path.abspath(path)}|{stat.st_size}|{stat.st_mtime_ns}".encode())
+    cached = os.path.join(cache_dir, key.hexdigest()[:24] + '.npy')
+    if not os.path.exists(cached):
+        data = np.loadtxt(path, comments='#', ndmin=2)
+        os.makedirs(cache_dir, exist_ok=True)
+        # Escritura atómica: varios procesos pueden convertir el mismo archivo a la vez
+        partial = f"{cached}.{os.getpid()}.tmp.npy"
+        np.save(partial, data)
+        os.replace(partial, cached)
+    return np.load(cached, mmap_mode='r')
+
+
+def solve_graph_file(path, reps=1, mode='expectation', alpha=0.25, shots=None, max_nodes=22):
+    """Resuelve un grafo y devuelve una fila de resultados con tiempos"""
+    start = time.perf_counter()
+    data = load_edges(path)
+    edges = np.asarray(data[:, :2], dtype=np.int64)
+    weights = np.asarray(data[:, 2], dtype=float) if data.shape[1] > 2 else None
+    num_nodes = int(edges.max()) + 1 if len(edges) else 0
+    load_time = time.perf_counter() - start
+
+    row = {
+        'file': path,
+        'num_nodes': num_nodes,
+        'num_edges': len(edges),
+        'reps': reps,
+        'status': 'ok',
+        'expected_cut': np.nan,
+        'best_cut': np.nan,
+        'max_cut': np.nan,
+        'approximation_ratio': np.nan,
+        'bitstring': '',
+        'evals': 0,
+        'load_time': load_time,
+        'solve_time': 0.0,
+    }
+    if num_nodes > max_nodes:
+        row['status'] = f'skipped: {num_nodes} nodos > {max_nodes}'
+        return row
+
+    start = time.perf_counter()
+    cut = cut_values(edges, num_nodes, weights)
+    result = solve_maxcut_qaoa(edges, num_nodes, reps=reps, weights=weights, cut=cut,
+                               mode=mode, alpha=alpha, shots=shots)
+    row.update(
+        expected_cut=result['expected_cut'],
+        best_cut=result['best_cut'],
+        max_cut=result['max_cut'],
+        approximation_ratio=result['best_cut'] / result['max_cut'] if result['max_cut'] else 1.0,
+        bitstring=result['best_bitstring'],
+        evals=result['evals'],
+        solve_time=time.perf_counter() - start,
+    )
+    return row
+
+
+def resolve_output(output):
+    """
+    Ruta de salida efectiva: Parquet (columnar, necesita pandas y pyarrow) y,
+    si no están disponibles, CSV con el mismo nombre. Se decide antes de resolver nada.
+    """
+    if not output.endswith('.parquet'):
+        return output
+    try:
+        import pandas  # noqa: F401
+        import pyarrow  # noqa: F401
+    except ImportError as e:
+        fallback = output[:-len('.parquet')] + '.csv'
+        print(f"Parquet no disponible ({e}): se escribe CSV en {fallback}")
+        return fallback
+    return output
+
+
+def write_results(rows, output):
+    """Escribe la tabla en formato columnar (.parquet, requiere pandas y pyarrow) o CSV según la extensión"""
+    if output.endswith('.parquet'):
+        import pandas as pd
+        pd.DataFrame(rows).to_parquet(output, index=False)
+        return rows
+
+    # Columnas en orden de aparición (las filas con error solo tienen file y status)
+    columns = list(dict.fromkeys(key for row in rows for key in row))
+    with open(output, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=columns)
+        writer.writeheader()
+        writer.writerows(rows)
+    return rows
+
+
+def solve_batch(paths, workers=None, output='maxcut_results.parquet', **options):
+    """
+    Reparte los grafos entre procesos y escribe una fila por grafo.
+    Devuelve (filas, ruta escrita), que es CSV si no se puede escribir Parquet.
+    """
+    output = resolve_output(output)
+    rows = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(solve_graph_file, path, **options): path for path in paths}
+        for future in as_completed(futures):
+            try:
+                rows.append(future.result())
+            except Exception as e:
+                rows.append({'file': futures[future], 'status': f'error: {e}'})
+            print(f"[{len(rows)}/{len(paths)}] {futures[future]}: {rows[-1]['status']}")
+    rows.sort(key=lambda row: row['file'])
+    return write_results(rows, output), output
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Max-Cut con QAOA para muchos grafos en paralelo")
+    parser.add_argument('inputs', nargs='+', help="Archivos de aristas (.txt, .csv, .npy) o patrones glob")
+    parser.add_argument('--reps', type=int, default=1, help="Capas QAOA (p)")
+    parser.add_argument('--mode', choices=['expectation', 'cvar'], default='expectation')
+    parser.add_argument('--alpha', type=float, default=0.25, help="Fracción α del objetivo CVaR")
+    parser.add_argument('--shots', type=int, default=None, help="Muestras por evaluación (por defecto exacto)")
+    parser.add_argument('--max-nodes', type=int, default=22, help="Tamaño máximo simulable")
+    parser.add_argument('--workers', type=int, default=None, help="Procesos (por defecto, núcleos)")
+    parser.add_argument('--output', default='maxcut_results.parquet',
+                        help="Archivo de salida (.parquet, o .csv si falta pyarrow o se pide)")
+    args = parser.parse_args()
+
+    paths = sorted({path for pattern in args.inputs for path in (glob.glob(pattern) or [pattern])})
+    start = time.perf_counter()
+    rows, output = solve_batch(paths, workers=args.workers, output=args.output, reps=args.reps,
+                               mode=args.mode, alpha=args.alpha, shots=args.shots,
+                               max_nodes=args.max_nodes)
+    print(f"\n{len(rows)} grafos resueltos en {time.perf_counter() - start:.2f} s -> {output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,195 @@
+# Compilador de oráculos desde tablas de verdad (ESOP de Reed-Muller con polaridad mínima)
+import hashlib
+
+import numpy as np
+from qiskit import QuantumCircuit
+
+# Búsqueda exhaustiva de polaridad hasta este número de entradas (4ⁿ operaciones);
+# por encima se usa la forma normal algebraica (todas las variables positivas)
+MAX_POLARITY_SEARCH_INPUTS = 10
+
+# Estrategias de descomposición de las puertas multicontroladas (modo de mcx en Qiskit):
+# sin ancillas, cadena en V con ancillas limpias (|0⟩) o con ancillas sucias (estado arbitrario)
+MCX_STRATEGIES = {'noancilla': 'noancilla', 'v-chain': 'v-chain', 'dirty': 'v-chain-dirty'}
+
+# Oráculos ya compilados, por huella de (tabla, modo, estrategia)
+_ORACLE_CACHE = {}
+
+
+def truth_table(function, num_inputs):
+    """
+    Normaliza la función booleana a un array uint8 de forma (2ⁿ,) o (2ⁿ, m).
+    function: array de 0/1 indexado por x (bit i de x = qubit i), entero
+    usado como máscara de bits (bit x = f(x)) o callable f(x) -> bool/entero.
+    """
+    size = 2**num_inputs
+    if callable(function):
+        table = np.array([function(x) for x in range(size)])
+    elif isinstance(function, (int, np.integer)):
+        table = (int(function) >> np.arange(size, dtype=object)) & 1
+    else:
+        table = np.asarray(function)
+    table = np.asarray(table).astype(np.uint8)
+    if table.shape[0] != size:
+        raise ValueError(f"La tabla de verdad debe tener {size} filas, tiene {table.shape[0]}")
+    return table
+
+
+def marked_items_table(items, num_inputs):
+    """Tabla de verdad con f(x) = 1 exactamente en los elementos marcados"""
+    table = np.zeros(2**num_inputs, dtype=np.uint8)
+    table[np.asarray(items, dtype=np.int64)] = 1
+    return table
+
+
+def _term_cost(num_controls):
+    """Coste aproximado en CX de una puerta con k controles (X/CX cuentan 1, Toffoli 6)"""
+    num_controls = np.asarray(num_controls)
+    return np.where(num_controls <= 1, 1, 6 * (2 * num_controls - 3))
+
+
+def reed_muller_spectra(table, num_inputs):
+    """
+    Coeficientes de Reed-Muller de polaridad fija para todas las polaridades a la vez.
+    Fila p: coeficientes aₛ de f(x) = ⊕ₛ aₛ·Πᵢ∈ₛ (xᵢ ⊕ pᵢ), con S codificado como entero.
+    """
+    size = 2**num_inputs
+    polarities = np.arange(size)[:, None]
+    spectra = table[np.arange(size)[None, :] ^ polarities].astype(np.uint8)
+    # Transformada de Möbius (mariposa XOR) sobre cada variable
+    for i in range(num_inputs):
+        view = spectra.reshape(size, -1, 2, 2**i)
+        view[:, :, 1, :] ^= view[:, :, 0, :]
+    return spectra
+
+
+def minimal_esop(table, num_inputs):
+    """
+    ESOP de Reed-Muller con la polaridad de menor coste estimado en CX.
+    Devuelve (polaridad, lista de monomios como enteros, coste).
+    """
+    degrees = np.array([bin(s).count('1') for s in range(2**num_inputs)])
+    costs = _term_cost(degrees)
+    if num_inputs <= MAX_POLARITY_SEARCH_INPUTS:
+        spectra = reed_muller_spectra(table, num_inputs)
+        total = spectra @ costs
+        polarity = int(np.argmin(total))
+        coefficients = spectra[polarity]
+    else:
+        polarity = 0
+        coefficients = _anf(table, num_inputs)
+    terms = np.flatnonzero(coefficients).tolist()
+    return polarity, terms, int(costs[terms].sum())
+
+
+def _anf(table, num_inputs):
+    """Forma normal algebraica (polaridad positiva) de una sola tabla"""
+    coefficients = table.astype(np.uint8).copy()
+    for i in range(num_inputs):
+        view = coefficients.reshape(-1, 2, 2**i)
+        view[:, 1, :] ^= view[:, 0, :]
+    return coefficients
+
+
+def ancillas_required(num_controls, strategy='noancilla'):
+    """Ancillas que necesita una X con num_controls controles según la estrategia"""
+    if strategy not in MCX_STRATEGIES:
+        raise ValueError(f"Estrategia desconocida: {strategy} (opciones: {list(MCX_STRATEGIES)})")
+    return 0 if strategy == 'noancilla' else max(0, num_controls - 2)
+
+
+def append_mcx(circuit, controls, target, strategy='noancilla', ancillas=()):
+    """X multicontrolada con la descomposición elegida (las ancillas limpias vuelven a |0⟩)"""
+    needed = ancillas_required(len(controls), strategy)
+    if needed == 0:
+        circuit.mcx(controls, target)
+    else:
+        circuit.mcx(controls, target, list(ancillas)[:needed], mode=MCX_STRATEGIES[strategy])
+
+
+def append_mcz(circuit, qubits, strategy='noancilla', ancillas=()):
+    """Z multicontrolada simétrica sobre qubits: cambia el signo de |11...1⟩"""
+    if len(qubits) == 1:
+        circuit.z(qubits[0])
+    elif len(qubits) == 2:
+        circuit.cz(*qubits)
+    elif strategy == 'noancilla':
+        circuit.mcp(np.pi, qubits[:-1], qubits[-1])
+    else:
+        circuit.h(qubits[-1])
+        append_mcx(circuit, qubits[:-1], qubits[-1], strategy, ancillas)
+        circuit.h(qubits[-1])
+
+
+def _qubits(term):
+    return [i for i in range(term.bit_length()) if term >> i & 1]
+
+
+def _append_bit_terms(circuit, polarity, terms, target, strategy, ancillas):
+    """Cada monomio es una X multicontrolada sobre el qubit objetivo"""
+    flipped = _qubits(polarity)
+    if flipped and terms:
+        circuit.x(flipped)
+    for term in terms:
+        controls = _qubits(term)
+        if not controls:
+            circuit.x(target)
+        else:
+            append_mcx(circuit, controls, target, strategy, ancillas)
+    if flipped and terms:
+        circuit.x(flipped)
+
+
+def _append_phase_terms(circuit, polarity, terms, strategy, ancillas):
+    """Cada monomio es una Z multicontrolada (polinomio de fase (-1)^f(x))"""
+    flipped = _qubits(polarity)
+    if flipped and terms:
+        circuit.x(flipped)
+    for term in terms:
+        qubits = _qubits(term)
+        if not qubits:
+            circuit.global_phase += np.pi
+        else:
+            append_mcz(circuit, qubits, strategy, ancillas)
+    if flipped and terms:
+        circuit.x(flipped)
+
+
+def compile_oracle(function, num_inputs, mode='bit', strategy='noancilla'):
+    """
+    Sintetiza el oráculo de una función booleana.
+    mode='bit': |x⟩|y⟩ → |x⟩|y ⊕ f(x)⟩, con una salida por columna de la tabla
+                (qubits n..n+m-1).
+    mode='phase': |x⟩ → (-1)^f(x) |x⟩ sobre los n qubits de entrada.
+    strategy: descomposición de las puertas multicontroladas ('noancilla',
+    'v-chain' o 'dirty'); las ancillas que necesite van en los últimos qubits.
+    Los oráculos se guardan en caché por huella de la tabla; se devuelve una copia.
+    """
+    table = truth_table(function, num_inputs)
+    if mode == 'phase' and table.ndim != 1:
+        raise ValueError("El oráculo de fase necesita una función de una sola salida")
+    key = hashlib.sha1(table.tobytes() + repr((table.shape, mode, strategy)).encode()).hexdigest()
+    if key not in _ORACLE_CACHE:
+        _ORACLE_CACHE[key] = _synthesize(table, num_inputs, mode, strategy)
+    return _ORACLE_CACHE[key].copy()
+
+
+def _synthesize(table, num_inputs, mode, strategy):
+    if mode not in ('bit', 'phase'):
+        raise ValueError(f"Modo de oráculo desconocido: {mode}")
+    outputs = table.reshape(len(table), -1)
+    esops = [minimal_esop(outputs[:, j], num_inputs) for j in range(outputs.shape[1])]
+
+    # Controles de la puerta más grande: todo el monomio en bit, uno menos en fase
+    max_degree = max((bin(term).count('1') for _, terms, _ in esops for term in terms), default=0)
+    num_controls = max_degree - 1 if mode == 'phase' else max_degree
+    width = num_inputs if mode == 'phase' else num_inputs + outputs.shape[1]
+    ancillas = list(range(width, width + ancillas_required(num_controls, strategy)))
+
+    circuit = QuantumCircuit(width + len(ancillas), name='oracle')
+    for j, (polarity, terms, _) in enumerate(esops):
+        if mode == 'phase':
+            _append_phase_terms(circuit, polarity, terms, strategy, ancillas)
+        else:
+            _append_bit_terms(circuit, polarity, terms, num_inputs + j, strategy, ancillas)
+    return circuit
@@ -0,0 +1,117 @@
+# Agrupación de términos de Pauli que conmutan qubit a qubit para estimar energías con shots
+import numpy as np
+from qiskit import transpile
+
+from simulators import get_simulator
+
+
+def _qubit_wise_conflicts(paulis):
+    """
+    Matriz booleana (términos x términos): True si dos términos NO conmutan
+    qubit a qubit, es decir, si en algún qubit ambos actúan con Paulis distintos.
+    """
+    z, x = paulis.z, paulis.x
+    active = z | x
+    both_active = active[:, None, :] & active[None, :, :]
+    different = (z[:, None, :] != z[None, :, :]) | (x[:, None, :] != x[None, :, :])
+    return (both_active & different).any(axis=2)
+
+
+def qubit_wise_commuting_groups(hamiltonian):
+    """
+    Particiona los términos del Hamiltoniano en grupos que conmutan qubit a qubit.
+    Usa coloreado voraz (mayor grado primero) del grafo de conflictos.
+    El término identidad no necesita medición y se omite.
+    Devuelve una lista de arrays con los índices de los términos de cada grupo.
+    """
+    paulis = hamiltonian.paulis
+    terms = np.flatnonzero((paulis.z | paulis.x).any(axis=1))
+    if len(terms) == 0:
+        return []
+
+    conflicts = _qubit_wise_conflicts(paulis[terms])
+    degree = conflicts.sum(axis=1)
+    colors = np.full(len(terms), -1)
+
+    for term in np.argsort(-degree, kind='stable'):
+        used = set(colors[conflicts[term]].tolist())
+        color = 0
+        while color in used:
+            color += 1
+        colors[term] = color
+
+    return [terms[colors == color] for color in range(colors.max() + 1)]
+
+
+def measurement_basis(hamiltonian, group):
+    """Base de medición de un grupo: un carácter 'I', 'X', 'Y' o 'Z' por qubit (qubit 0 primero)"""
+    paulis = hamiltonian.paulis[group]
+    z, x = paulis.z.any(axis=0), paulis.x.any(axis=0)
+    basis = []
+    for q in range(hamiltonian.num_qubits):
+        if x[q] and z[q]:
+            basis.append('Y')
+        elif x[q]:
+            basis.append('X')
+        elif z[q]:
+            basis.append('Z')
+        else:
+            basis.append('I')
+    return basis
+
+
+def measurement_circuit(circuit, basis):
+    """Añade al circuito las rotaciones de base y la medición de todos los qubits"""
+    qc = circuit.remove_final_measurements(inplace=False)
+    for q, pauli in enumerate(basis):
+        if pauli == 'X':
+            qc.h(q)
+        elif pauli == 'Y':
+            qc.sdg(q)
+            qc.h(q)
+    qc.measure_all()
+    return qc
+
+
+def _parities(outcomes, masks, num_qubits):
+    """Paridad de outcome & mask para cada (término, resultado) en forma vectorizada"""
+    masked = masks[:, None] & outcomes[None, :]
+    parity = np.zeros_like(masked)
+    for q in range(num_qubits):
+        parity ^= (masked >> q) & 1
+    return parity
+
+
+def estimate_expectation(circuit, hamiltonian, shots=1000, backend=None, seed=None):
+    """
+    Estima <H> con shots midiendo un circuito por grupo de términos compatibles.
+    Todos los circuitos se ejecutan en un solo trabajo y cada término se
+    reconstruye a partir de los conteos compartidos de su grupo.
+    Devuelve (energía, valores_por_término, número_de_circuitos).
+    """
+    backend = backend or get_simulator()
+    groups = qubit_wise_commuting_groups(hamiltonian)
+    paulis = hamiltonian.paulis
+    coeffs = np.real(hamiltonian.coeffs)
+    n = hamiltonian.num_qubits
+
+    # Los términos identidad valen 1 en cualquier estado
+    term_values = np.ones(len(paulis))
+    if groups:
+        circuits = [measurement_circuit(circuit, measurement_basis(hamiltonian, group))
+                    for group in groups]
+        result = backend.run(transpile(circuits, backend), shots=shots, seed_simulator=seed).result()
+
+        # Máscara de soporte de cada término como entero (bit q = qubit q)
+        weights = 1 << np.arange(n, dtype=np.int64)
+        masks = ((paulis.z | paulis.x) * weights).sum(axis=1)
+
+        for i, group in enumerate(groups):
+            counts = result.get_counts(i)
+            outcomes = np.array([int(key.split()[0], 2) for key in counts], dtype=np.int64)
+            frequencies = np.array(list(counts.values()), dtype=float)
+            signs = 1 - 2 * _parities(outcomes, masks[group], n)
+            term_values[group] = signs @ frequencies / frequencies.sum()
+
+    energy = float(coeffs @ term_values)
+    return energy, term_values, len(groups)
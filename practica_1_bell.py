@@ -1,6 +1,6 @@
 # 1. Importar las herramientas necesarias
-from qiskit import QuantumCircuit, transpile
-from qiskit_aer import AerSimulator
+from qiskit import QuantumCircuit
+from simulators import run_circuit, select_method
 from qiskit.visualization import plot_histogram
 
 # 2. Crear un circuito cuántico con 2 qubits y 2 bits clásicos
@@ -16,18 +16,16 @@ qc.cx(0, 1)
 # 4. Mapear la medida de los qubits a los bits clásicos
 qc.measure([0,1], [0,1])
 
-# 5. Usar el simulador Aer de Qiskit
-simulator = AerSimulator()
+# 5. Elegir el método del simulador Aer: el estado de Bell solo usa puertas
+# de Clifford (H y CNOT), así que se simula con el método 'stabilizer'
+print(f"Método de simulación: {select_method(qc)}")
 
-# 6. Compilar el circuito para el simulador (un paso de optimización)
-compiled_circuit = transpile(qc, simulator)
-
-# 7. Ejecutar el circuito en el simulador 1024 veces (shots)
-job = simulator.run(compiled_circuit, shots=1024)
+# 6-7. Compilar el circuito para ese simulador y ejecutarlo 1024 veces (shots)
+job = run_circuit(qc, shots=1024)
 
 # 8. Obtener los resultados
 result = job.result()
-counts = result.get_counts(compiled_circuit)
+counts = result.get_counts(qc)
 
 # 9. Imprimir los resultados y el circuito
 print("\nResultados del conteo:")
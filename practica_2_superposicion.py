@@ -1,5 +1,5 @@
 from qiskit import QuantumCircuit, transpile
-from qiskit_aer import AerSimulator
+from simulators import get_simulator
 
 # Crear un circuito con 1 qubit y 1 bit clasico
 qc = QuantumCircuit(1, 1)
@@ -11,7 +11,7 @@ qc.h(0)
 qc.measure([0], [0])
 
 # Simular la ejecucion
-simulator = AerSimulator()
+simulator = get_simulator()
 compiled_circuit = transpile(qc, simulator)
 job = simulator.run(compiled_circuit, shots=1024)
 result = job.result()
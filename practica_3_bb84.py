@@ -1,7 +1,7 @@
 
 import numpy as np
-from qiskit import QuantumCircuit, transpile
-from qiskit_aer import AerSimulator
+from qiskit import QuantumCircuit
+from simulators import run_circuit
 
 def encode_message(bits, bases):
     """Codifica los bits en qubits usando las bases dadas."""
@@ -41,7 +41,6 @@ print(f"Qubits preparados para enviar a Bob ({len(message_qubits)}).")
 
 def measure_message(message, bases):
     """Mide los qubits usando las bases de Bob."""
-    backend = AerSimulator()
     measurements = []
     for i in range(len(bases)):
         qc = message[i]
@@ -49,9 +48,8 @@ def measure_message(message, bases):
             qc.h(0)
         qc.measure(0, 0)
         
-        # Compilar y ejecutar
-        t_qc = transpile(qc, backend)
-        result = backend.run(t_qc, shots=1, memory=True).result()
+        # Compilar y ejecutar (circuito de Clifford: método stabilizer)
+        result = run_circuit(qc, shots=1, memory=True).result()
         measured_bit = int(result.get_memory()[0])
         measurements.append(measured_bit)
     return measurements
@@ -2,11 +2,10 @@ import networkx as nx
 import matplotlib.pyplot as plt
 import numpy as np
 
-from qiskit_aer import AerSimulator
-from qiskit.quantum_info import SparsePauliOp
-from qiskit_algorithms import QAOA
-from qiskit_algorithms.optimizers import COBYLA
-from qiskit_aer.primitives import Sampler
+from exact_solver import exact_ground_energy
+from hamiltonians import maxcut_hamiltonian
+from qaoa_cache import QAOAParameterCache, solve_with_warm_start
+from qaoa_maxcut import cut_values, solve_maxcut_qaoa
 
 # --- 1. Definición del Problema (El Grafo) ---
 
@@ -28,43 +27,55 @@ print("Aristas:", G.edges())
 # Creamos un "qubit operator" a partir del grafo.
 
 # El objetivo es encontrar el estado |psi> que maximiza <psi|H|psi>
-pauli_list = []
-coeffs = []
+# Cada arista (i, j) aporta un término 0.5·ZᵢZⱼ; el nodo i corresponde al qubit i
+edges = np.array(G.edges())
+qubit_op = maxcut_hamiltonian(edges, num_nodes)
 
-for i, j in G.edges():
-    pauli_str = ['I'] * num_nodes
-    pauli_str[i] = 'Z'
-    pauli_str[j] = 'Z'
-    pauli_list.append("".join(pauli_str))
-    coeffs.append(0.5)  # Coeficiente para cada término
+# --- 3. Configuración del Algoritmo QAOA ---
 
-qubit_op = SparsePauliOp(pauli_list, coeffs)
+# El Hamiltoniano de Max-Cut es diagonal: el valor del corte de cada bitstring
+# se calcula una sola vez y cada capa QAOA se reduce a operaciones sobre arrays
+cut = cut_values(edges, num_nodes)
 
-# --- 3. Configuración del Algoritmo QAOA ---
+# --- 4. Ejecución y Obtención de Resultados ---
 
-# Usaremos un simulador cuántico de Qiskit Aer
-sampler = Sampler()
+print("\n--- Ejecutando QAOA (statevector con coste diagonal) ---")
+result = solve_maxcut_qaoa(edges, num_nodes, reps=1, cut=cut)
 
-# Creamos una instancia de QAOA
-# Le pasamos el operador del problema y un optimizador clásico
-qaoa = QAOA(sampler=sampler, optimizer=COBYLA(), reps=1)
+# Referencia exacta: mínimo de <H> sobre todas las asignaciones
+exact_energy = exact_ground_energy(qubit_op)
+print(f"Energía QAOA: {result['energy']:.6f}")
+print(f"Energía exacta (referencia): {exact_energy:.6f}")
+print(f"Error: {abs(result['energy'] - exact_energy):.6f}")
+print(f"Evaluaciones del optimizador: {result['evals']}")
 
-# --- 4. Ejecución y Obtención de Resultados ---
+# --- Objetivo CVaR con muestras ---
 
-print("\n--- Ejecutando QAOA en el simulador ---")
-result = qaoa.compute_minimum_eigenvalue(qubit_op)
+# En lugar de la media, optimizamos la media del 25% de mejores muestras (CVaR-α)
+# y nos quedamos con la mejor muestra vista (mejor de k)
+cvar_result = solve_maxcut_qaoa(edges, num_nodes, reps=1, cut=cut,
+                                mode='cvar', alpha=0.25, shots=512, seed=42)
+print(f"\nQAOA con CVaR (α = 0.25): CVaR {cvar_result['objective']:.4f}, "
+      f"mejor muestra {cvar_result['best_bitstring']} (corte {cvar_result['best_cut']:.0f}), "
+      f"{cvar_result['evals']} evaluaciones")
 
-# El resultado nos da la división de los nodos
-# Extraemos la solución más probable
-if hasattr(result, 'best_measurement'):
-    solution = result.best_measurement['bitstring']
-else:
-    # Fallback para versiones diferentes
-    solution = format(result.eigenstate.argmax(), f'0{num_nodes}b')
+# El resultado nos da la división de los nodos (el carácter i es el nodo i)
+solution = cvar_result['best_bitstring']
 
 print(f"\nSolución encontrada (string de bits): {solution}")
 print("Esto representa la asignación de cada nodo a uno de los dos equipos (0 o 1).")
 
+# --- Arranque en caliente: más capas y grafos similares ---
+
+# Los óptimos se guardan por rasgos del grafo (tamaño, secuencia de grados, capas);
+# p+1 arranca de la interpolación de p y un grafo parecido reutiliza los de otro.
+# Aquí la caché es solo en memoria (path=None) para que cada ejecución dé la misma
+# salida; con la ruta por defecto persiste en .cache/qaoa_params.json entre ejecuciones
+param_cache = QAOAParameterCache(path=None)
+warm = solve_with_warm_start(edges, num_nodes, reps=3, cache=param_cache)
+print(f"\nQAOA p=3 con arranque en caliente: corte esperado {warm['expected_cut']:.4f}, "
+      f"{warm['total_evals']} evaluaciones en total (p=1..3)")
+
 # --- 5. Visualización de la Solución ---
 
 # Asignamos colores a los nodos según la solución encontrada
@@ -74,9 +85,11 @@ colors = ['r' if solution[i] == '0' else 'g' for i in range(num_nodes)]
 pos = nx.spring_layout(G, seed=42)
 nx.draw(G, pos, with_labels=True, node_color=colors, font_color='w')
 
-# Calculamos y mostramos el número de aristas cortadas
-cut_edges = [(u, v) for u, v in G.edges() if solution[u] != solution[v]]
-uncut_edges = [(u, v) for u, v in G.edges() if solution[u] == solution[v]]
+# Calculamos y mostramos el número de aristas cortadas (todas a la vez con el array de aristas)
+assignment = np.array([int(bit) for bit in solution])
+is_cut = assignment[edges[:, 0]] != assignment[edges[:, 1]]
+cut_edges = [tuple(edge) for edge in edges[is_cut]]
+uncut_edges = [tuple(edge) for edge in edges[~is_cut]]
 
 nx.draw_networkx_edges(G, pos, edgelist=cut_edges, edge_color='y', width=2.0)
 nx.draw_networkx_edges(G, pos, edgelist=uncut_edges, edge_color='w', style='dashed')
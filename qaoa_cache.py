@@ -0,0 +1,120 @@
+# Caché de parámetros QAOA: arranque en caliente y transferencia entre grafos similares
+import hashlib
+import json
+import os
+
+import numpy as np
+
+from qaoa_maxcut import cut_values, solve_maxcut_qaoa
+
+CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'qaoa_params.json')
+
+
+def graph_features(edges, num_nodes):
+    """Rasgos del grafo que determinan en buena medida los parámetros óptimos"""
+    edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+    degrees = np.bincount(edges.ravel(), minlength=num_nodes)
+    degree_sequence = sorted(degrees.tolist(), reverse=True)
+    return {
+        'num_nodes': int(num_nodes),
+        'num_edges': int(len(edges)),
+        'mean_degree': float(degrees.mean()) if num_nodes else 0.0,
+        'std_degree': float(degrees.std()) if num_nodes else 0.0,
+        'degree_hash': hashlib.sha1(str(degree_sequence).encode()).hexdigest()[:16],
+    }
+
+
+def interpolate_schedule(params):
+    """
+    Pasa de p a p+1 capas interpolando linealmente γ y β (estrategia INTERP):
+    x'ᵢ = (i-1)/p · xᵢ₋₁ + (p-i+1)/p · xᵢ, con x₀ = xₚ₊₁ = 0.
+    """
+    params = np.asarray(params, dtype=float)
+    p = len(params) // 2
+    grown = []
+    for schedule in (params[:p], params[p:]):
+        padded = np.concatenate([[0.0], schedule, [0.0]])
+        i = np.arange(1, p + 2)
+        grown.append((i - 1) / p * padded[i - 1] + (p - i + 1) / p * padded[i])
+    return np.concatenate(grown)
+
+
+class QAOAParameterCache:
+    """Parámetros óptimos guardados en JSON, indexados por rasgos del grafo y número de capas"""
+
+    def __init__(self, path=CACHE_PATH, tolerance=0.5):
+        self.path = path
+        self.tolerance = tolerance
+        self.entries = {}
+        if path and os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f)
+
+    @staticmethod
+    def _key(features, reps):
+        return f"n{features['num_nodes']}-m{features['num_edges']}-{features['degree_hash']}-p{reps}"
+
+    def _nearest(self, features, reps):
+        """Entrada con el mismo número de capas cuyo grafo más se parece (o None)"""
+        best, best_distance = None, np.inf
+        for entry in self.entries.values():
+            if entry['reps'] != reps:
+                continue
+            distance = (abs(entry['mean_degree'] - features['mean_degree'])
+                        + abs(entry['std_degree'] - features['std_degree']))
+            if distance < best_distance:
+                best, best_distance = entry, distance
+        return best if best_distance <= self.tolerance else None
+
+    def lookup(self, edges, num_nodes, reps):
+        """
+        Punto inicial para (grafo, reps): el óptimo guardado del mismo grafo,
+        el de un grafo similar o, si solo existe con p-1 capas, su interpolación.
+        """
+        features = graph_features(edges, num_nodes)
+        entry = self.entries.get(self._key(features, reps)) or self._nearest(features, reps)
+        if entry is not None:
+            return np.array(entry['params'])
+        if reps > 1:
+            previous = self.lookup(edges, num_nodes, reps - 1)
+            if previous is not None:
+                return interpolate_schedule(previous)
+        return None
+
+    def store(self, edges, num_nodes, reps, params, expected_cut):
+        """Guarda un óptimo si mejora (o no existe) el registrado para ese grafo"""
+        features = graph_features(edges, num_nodes)
+        key = self._key(features, reps)
+        previous = self.entries.get(key)
+        if previous is not None and previous['expected_cut'] >= expected_cut:
+            return
+        self.entries[key] = dict(features, reps=int(reps), params=np.asarray(params).tolist(),
+                                 expected_cut=float(expected_cut))
+        if self.path:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(self.path, 'w', encoding='utf-8') as f:
+                json.dump(self.entries, f, indent=1)
+
+
+def solve_with_warm_start(edges, num_nodes, reps, cache, weights=None, maxiter=1000,
+                          warm_rhobeg=0.2):
+    """
+    Resuelve QAOA creciendo de p=1 a p=reps. Cada nivel arranca del óptimo
+    cacheado o de la interpolación del nivel anterior (con un paso inicial
+    de COBYLA más corto) y guarda su resultado.
+    """
+    cut = cut_values(edges, num_nodes, weights)
+    result = None
+    total_evals = 0
+    for p in range(1, reps + 1):
+        initial_point = cache.lookup(edges, num_nodes, p)
+        if initial_point is None and result is not None:
+            initial_point = interpolate_schedule(result['optimal_params'])
+        rhobeg = 1.0 if initial_point is None else warm_rhobeg
+        result = solve_maxcut_qaoa(edges, num_nodes, reps=p, weights=weights,
+                                   initial_point=initial_point, maxiter=maxiter, cut=cut,
+                                   rhobeg=rhobeg)
+        cache.store(edges, num_nodes, p, result['optimal_params'], result['expected_cut'])
+        total_evals += result['evals']
+    result['total_evals'] = total_evals
+    return result
@@ -0,0 +1,174 @@
+# Motor QAOA para Max-Cut con coste diagonal precalculado (statevector en NumPy)
+from functools import reduce
+
+import numpy as np
+from scipy.optimize import minimize
+
+
+def cut_values(edges, num_nodes, weights=None):
+    """
+    Valor del corte de cada bitstring (índice k: bit i = lado del nodo i).
+    Se calcula una sola vez por grafo; es la diagonal del Hamiltoniano de coste.
+    """
+    edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+    weights = np.ones(len(edges)) if weights is None else np.asarray(weights, dtype=float)
+    index = np.arange(2**num_nodes, dtype=np.int64)
+    bits = [((index >> i) & 1).astype(np.int8) for i in range(num_nodes)]
+
+    cut = np.zeros(2**num_nodes)
+    for (i, j), w in zip(edges, weights):
+        cut += w * (bits[i] ^ bits[j])
+    return cut
+
+
+def apply_mixer(state, beta, num_nodes, block=5):
+    """
+    Aplica RX(2β) a todos los qubits. Los qubits se agrupan en bloques de
+    `block` y cada bloque es una única multiplicación matricial (RX^⊗k),
+    así el estado se recorre n/k veces en lugar de n.
+    """
+    rx = np.array([[np.cos(beta), -1j * np.sin(beta)],
+                   [-1j * np.sin(beta), np.cos(beta)]])
+    q = 0
+    while q < num_nodes:
+        k = min(block, num_nodes - q)
+        matrix = reduce(np.kron, [rx] * k)
+        if q == 0:
+            state = state.reshape(-1, 2**k) @ matrix.T
+        else:
+            state = np.matmul(matrix, state.reshape(-1, 2**k, 2**q))
+        q += k
+    return state.reshape(-1)
+
+
+def cost_levels(cut):
+    """Valores distintos del corte y el índice de cada bitstring (para la fase por nivel)"""
+    return np.unique(cut, return_inverse=True)
+
+
+def qaoa_state(params, cut, num_nodes, levels=None):
+    """
+    Statevector QAOA para params = [γ₁..γₚ, β₁..βₚ].
+    Cada capa de coste es un producto elemento a elemento por exp(-iγ·C);
+    la exponencial se evalúa solo en los niveles distintos del corte.
+    """
+    values, index = cost_levels(cut) if levels is None else levels
+    p = len(params) // 2
+    gammas, betas = params[:p], params[p:]
+    state = np.full(2**num_nodes, 1 / np.sqrt(2**num_nodes), dtype=complex)
+    for gamma, beta in zip(gammas, betas):
+        state *= np.exp(-1j * gamma * values)[index]
+        state = apply_mixer(state, beta, num_nodes)
+    return state
+
+
+def expected_cut(params, cut, num_nodes, levels=None):
+    """Valor esperado del corte <C> en el estado QAOA"""
+    state = qaoa_state(params, cut, num_nodes, levels)
+    return float(np.abs(state)**2 @ cut)
+
+
+def index_to_bitstring(index, num_nodes):
+    """Bitstring en orden de nodos: el carácter i es el lado del nodo i"""
+    return format(int(index), f'0{num_nodes}b')[::-1]
+
+
+def sample_cut_values(samples, edges, weights=None):
+    """
+    Valor del corte de muchas muestras a la vez.
+    samples: índices enteros de bitstrings (bit i = nodo i) o matriz booleana (k, n).
+    Se evalúa con el array de aristas, sin recorrer el grafo en Python.
+    """
+    edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+    samples = np.asarray(samples)
+    if samples.ndim == 1:
+        num_nodes = int(edges.max()) + 1 if len(edges) else 0
+        samples = (samples[:, None] >> np.arange(num_nodes)) & 1
+    crossing = samples[:, edges[:, 0]] != samples[:, edges[:, 1]]
+    if weights is None:
+        return crossing.sum(axis=1).astype(float)
+    return crossing @ np.asarray(weights, dtype=float)
+
+
+def cvar(values, alpha, probabilities=None):
+    """
+    CVaR-α para maximizar: media de la fracción α de mejores valores.
+    Sin probabilidades, cada valor es una muestra con el mismo peso.
+    """
+    values = np.asarray(values, dtype=float)
+    if probabilities is None:
+        probabilities = np.full(len(values), 1 / len(values))
+    order = np.argsort(values)[::-1]
+    weights = probabilities[order]
+    before = np.cumsum(weights) - weights
+    # Cada valor aporta solo la parte de su peso que cabe dentro de la cola α
+    tail = np.clip(alpha - before, 0.0, weights)
+    return float(values[order] @ tail / alpha)
+
+
+def solve_maxcut_qaoa(edges, num_nodes, reps=1, weights=None, initial_point=None,
+                      maxiter=1000, cut=None, rhobeg=1.0, mode='expectation', alpha=0.25,
+                      shots=None, seed=None):
+    """
+    Optimiza QAOA para Max-Cut con COBYLA.
+    rhobeg es el paso inicial de COBYLA; conviene reducirlo al arrancar en caliente.
+
+    mode='expectation' maximiza <C>; mode='cvar' maximiza la media de la mejor
+    fracción α de la distribución. Con shots, el objetivo se estima a partir de
+    muestras y se conserva la mejor muestra vista (mejor de k).
+
+    Devuelve un diccionario con los parámetros óptimos, el corte esperado,
+    la energía equivalente de Σ (w/2)·ZᵢZⱼ y las asignaciones más probable y mejor muestreada.
+    """
+    if cut is None:
+        cut = cut_values(edges, num_nodes, weights)
+    total_weight = len(np.asarray(edges).reshape(-1, 2)) if weights is None else float(np.sum(weights))
+
+    if initial_point is None:
+        # Rampa lineal tipo "annealing": γ crece y β decrece capa a capa
+        layers = (np.arange(reps) + 0.5) / reps
+        initial_point = np.concatenate([0.8 * layers, 0.8 * (1 - layers)])
+
+    levels = cost_levels(cut)
+    rng = np.random.default_rng(seed)
+    best_sample = {'index': None, 'cut': -np.inf}
+    evals = 0
+
+    def objective(params):
+        nonlocal evals
+        evals += 1
+        probabilities = np.abs(qaoa_state(params, cut, num_nodes, levels))**2
+        if shots is None:
+            if mode == 'cvar':
+                return -cvar(cut, alpha, probabilities)
+            return -float(probabilities @ cut)
+
+        samples = rng.choice(len(probabilities), size=shots, p=probabilities / probabilities.sum())
+        values = sample_cut_values(samples, edges, weights)
+        best = int(np.argmax(values))
+        if values[best] > best_sample['cut']:
+            best_sample.update(index=int(samples[best]), cut=float(values[best]))
+        return -(cvar(values, alpha) if mode == 'cvar' else float(values.mean()))
+
+    result = minimize(objective, np.asarray(initial_point, dtype=float),
+                      method='COBYLA', options={'maxiter': maxiter, 'rhobeg': rhobeg})
+
+    probabilities = np.abs(qaoa_state(result.x, cut, num_nodes, levels))**2
+    most_likely = int(np.argmax(probabilities))
+    mean_cut = float(probabilities @ cut)
+    if best_sample['index'] is None:
+        best_sample.update(index=most_likely, cut=float(cut[most_likely]))
+
+    return {
+        'optimal_params': result.x,
+        'objective': -result.fun,
+        'expected_cut': mean_cut,
+        'energy': 0.5 * total_weight - mean_cut,
+        'bitstring': index_to_bitstring(most_likely, num_nodes),
+        'cut': float(cut[most_likely]),
+        'probability': float(probabilities[most_likely]),
+        'best_bitstring': index_to_bitstring(best_sample['index'], num_nodes),
+        'best_cut': best_sample['cut'],
+        'max_cut': float(cut.max()),
+        'evals': evals,
+    }
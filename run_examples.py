@@ -0,0 +1,150 @@
+# Ejecuta todos los ejemplos y prácticas sin interfaz gráfica y genera un informe de tiempos y memoria
+#
+# Uso:
+#   python run_examples.py                      # todos los ejemplo_*.py y practica_*.py
+#   python run_examples.py ejemplo_05_grover.py --workers 2 --timeout 300
+#
+# Cada script se lanza en su propio proceso con MPLBACKEND=Agg (plt.show() no bloquea).
+# El informe (JSON y Markdown) se puede comparar entre commits.
+import argparse
+import glob
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_PATTERNS = ['ejemplo_*.py', 'practica_*.py']
+DEFAULT_OUTPUT_DIR = os.path.join(ROOT, '.cache', 'run_examples')
+
+
+def _positive_int(value):
+    """Tipo de argparse: entero >= 1"""
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"debe ser un entero >= 1: {value}")
+    return number
+
+
+def _script_env(threads_per_script):
+    """Entorno sin interfaz gráfica; limita los hilos de Aer para no sobresuscribir la CPU"""
+    env = dict(os.environ, MPLBACKEND='Agg', PYTHONIOENCODING='utf-8', PYTHONUNBUFFERED='1')
+    env.setdefault('QSIM_MAX_PARALLEL_THREADS', str(threads_per_script))
+    return env
+
+
+def run_script(script, log_dir, timeout=600, env=None):
+    """
+    Ejecuta un script y mide tiempo de pared, tiempo de CPU (usuario + sistema)
+    y memoria máxima residente del proceso hijo (os.wait4, solo en Unix).
+    La salida completa se guarda en log_dir/<script>.log.
+    """
+    log_path = os.path.join(log_dir, os.path.basename(script) + '.log')
+    timed_out = threading.Event()
+    start = time.perf_counter()
+    with open(log_path, 'w', encoding='utf-8') as log:
+        process = subprocess.Popen([sys.executable, script], cwd=ROOT, env=env,
+                                   stdout=log, stderr=subprocess.STDOUT)
+
+        def kill():
+            timed_out.set()
+            process.kill()
+
+        timer = threading.Timer(timeout, kill)
+        timer.start()
+        try:
+            if hasattr(os, 'wait4'):
+                _, status, usage = os.wait4(process.pid, 0)
+                process.returncode = os.waitstatus_to_exitcode(status)
+                cpu_time = usage.ru_utime + usage.ru_stime
+                max_rss_mb = usage.ru_maxrss / 1024  # Linux: KiB
+                if sys.platform == 'darwin':
+                    max_rss_mb /= 1024  # macOS: bytes
+            else:
+                process.wait()
+                cpu_time = max_rss_mb = None
+        finally:
+            timer.cancel()
+    wall_time = time.perf_counter() - start
+
+    with open(log_path, 'r', encoding='utf-8', errors='replace') as log:
+        lines = log.read().splitlines()
+    if timed_out.is_set():
+        status = 'timeout'
+    else:
+        status = 'ok' if process.returncode == 0 else 'error'
+    return {
+        'script': os.path.basename(script),
+        'status': status,
+        'returncode': process.returncode,
+        'wall_time': round(wall_time, 3),
+        'cpu_time': None if cpu_time is None else round(cpu_time, 3),
+        'max_rss_mb': None if max_rss_mb is None else round(max_rss_mb, 1),
+        'output_lines': len(lines),
+        # Última línea de la salida (normalmente el mensaje de la excepción) si falló
+        'error': None if status == 'ok' else (lines[-1] if lines else ''),
+    }
+
+
+def write_report(results, output_dir):
+    """Escribe report.json y report.md ordenados por script (estables para diff)"""
+    results = sorted(results, key=lambda r: r['script'])
+    with open(os.path.join(output_dir, 'report.json'), 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2, ensure_ascii=False, sort_keys=True)
+        f.write('\n')
+
+    def cell(value, fmt):
+        return '-' if value is None else format(value, fmt)
+
+    lines = ['| Script | Estado | Tiempo (s) | CPU (s) | Memoria máx. (MB) |',
+             '|--------|--------|-----------:|--------:|------------------:|']
+    for r in results:
+        lines.append(f"| `{r['script']}` | {r['status']} | {r['wall_time']:.2f} | "
+                     f"{cell(r['cpu_time'], '.2f')} | {cell(r['max_rss_mb'], '.1f')} |")
+    failed = [r for r in results if r['status'] != 'ok']
+    lines.append('')
+    lines.append(f"{len(results) - len(failed)}/{len(results)} scripts correctos.")
+    for r in failed:
+        lines.append(f"- `{r['script']}` ({r['status']}): {r['error']}")
+    with open(os.path.join(output_dir, 'report.md'), 'w', encoding='utf-8') as f:
+        f.write('\n'.join(lines) + '\n')
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ejecuta los ejemplos sin interfaz gráfica y mide tiempo y memoria")
+    parser.add_argument('scripts', nargs='*', help="Scripts o patrones (por defecto ejemplo_*.py y practica_*.py)")
+    parser.add_argument('--workers', type=_positive_int, default=os.cpu_count() or 1, help="Scripts en paralelo")
+    parser.add_argument('--timeout', type=float, default=600, help="Segundos máximos por script")
+    parser.add_argument('--output-dir', default=DEFAULT_OUTPUT_DIR, help="Carpeta del informe y los logs")
+    args = parser.parse_args()
+
+    patterns = args.scripts or DEFAULT_PATTERNS
+    scripts = sorted({path for pattern in patterns
+                      for path in glob.glob(os.path.join(ROOT, pattern)) or [pattern]})
+    log_dir = os.path.join(args.output_dir, 'logs')
+    os.makedirs(log_dir, exist_ok=True)
+    env = _script_env(max(1, (os.cpu_count() or 1) // args.workers))
+
+    # Cada hilo solo espera a su proceso hijo: el trabajo real ocurre en los subprocesos
+    with ThreadPoolExecutor(max_workers=args.workers) as pool:
+        futures = [pool.submit(run_script, script, log_dir, args.timeout, env) for script in scripts]
+        results = []
+        for future in futures:
+            result = future.result()
+            results.append(result)
+            print(f"{result['script']:<35} {result['status']:<8} {result['wall_time']:>8.2f} s")
+
+    results = write_report(results, args.output_dir)
+    print(f"\nInforme: {os.path.join(args.output_dir, 'report.md')}")
+    sys.exit(0 if all(r['status'] == 'ok' for r in results) else 1)
+
+
+if __name__ == '__main__':
+    main()
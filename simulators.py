@@ -0,0 +1,254 @@
+# Simuladores Aer compartidos y configurados, con selección automática del método
+import os
+import re
+import threading
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+import numpy as np
+
+from qiskit import transpile
+from qiskit_aer import AerSimulator
+from qiskit_aer.jobs import aerjob, aerjobset
+from qiskit_aer.primitives import Estimator
+
+# Puertas de Clifford que el método 'stabilizer' de Aer simula en tiempo polinómico
+CLIFFORD_GATES = {'id', 'x', 'y', 'z', 'h', 's', 'sdg', 'sx', 'sxdg',
+                  'cx', 'cy', 'cz', 'swap', 'iswap', 'ecr', 'dcx', 'pauli'}
+
+# Instrucciones que no afectan a la clasificación (no son puertas unitarias)
+NON_GATE_INSTRUCTIONS = {'measure', 'barrier', 'reset', 'delay'}
+
+# A partir de aquí el statevector (16·2ⁿ bytes) deja de caber en un nodo típico
+STATEVECTOR_MAX_QUBITS = 28
+
+# Desde esta anchura, si las puertas de 2 qubits solo actúan entre vecinos
+# cercanos (distancia <= MPS_MAX_INTERACTION_SPAN), MPS es más barato que el statevector
+MPS_PREFERRED_QUBITS = 20
+MPS_MAX_INTERACTION_SPAN = 2
+
+
+def is_clifford(circuit):
+    """True si el circuito solo usa puertas de Clifford (se expanden las puertas compuestas)"""
+    for instruction in circuit.data:
+        op = instruction.operation
+        if op.name in CLIFFORD_GATES or op.name in NON_GATE_INSTRUCTIONS:
+            continue
+        if getattr(op, 'condition', None) is None and op.definition is not None \
+                and op.name not in ('unitary', 'initialize'):
+            if is_clifford(op.definition):
+                continue
+        return False
+    return True
+
+
+def describe_circuit(circuit):
+    """Rasgos que determinan el método: anchura, si es Clifford y alcance de las puertas de 2 qubits"""
+    span = 0
+    for instruction in circuit.data:
+        # Las barreras (la de measure_all abarca todo el registro) no entrelazan
+        if instruction.operation.name in NON_GATE_INSTRUCTIONS:
+            continue
+        if len(instruction.qubits) >= 2:
+            indices = [circuit.find_bit(q).index for q in instruction.qubits]
+            span = max(span, max(indices) - min(indices))
+    return {
+        'num_qubits': circuit.num_qubits,
+        'clifford': is_clifford(circuit),
+        'interaction_span': span,
+    }
+
+
+def select_method(circuit):
+    """
+    Elige el método de Aer:
+    - 'stabilizer' para circuitos de Clifford (escala a miles de qubits)
+    - 'matrix_product_state' desde MPS_PREFERRED_QUBITS qubits si las puertas
+      son entre vecinos cercanos (el entrelazamiento crece despacio)
+    - 'statevector' mientras el estado completo quepa en memoria
+    - 'matrix_product_state' para circuitos más anchos, con un aviso si tienen
+      puertas de largo alcance (la dimensión de enlace puede dispararse)
+    """
+    features = describe_circuit(circuit)
+    if features['clifford']:
+        return 'stabilizer'
+    local = features['interaction_span'] <= MPS_MAX_INTERACTION_SPAN
+    if features['num_qubits'] >= MPS_PREFERRED_QUBITS and local:
+        return 'matrix_product_state'
+    if features['num_qubits'] <= STATEVECTOR_MAX_QUBITS:
+        return 'statevector'
+    if not local:
+        warnings.warn(f"Circuito de {features['num_qubits']} qubits con puertas a distancia "
+                      f"{features['interaction_span']}: MPS puede necesitar una dimensión de "
+                      f"enlace muy grande o truncar mucho", RuntimeWarning, stacklevel=2)
+    return 'matrix_product_state'
+
+
+def simulator_options():
+    """
+    Opciones de Aer leídas del entorno (se aplican a todos los simuladores compartidos):
+    QSIM_MAX_PARALLEL_THREADS (0 = todos los núcleos), QSIM_MAX_PARALLEL_EXPERIMENTS,
+    QSIM_MAX_PARALLEL_SHOTS, QSIM_FUSION_ENABLE (1/0), QSIM_FUSION_THRESHOLD,
+    QSIM_PRECISION ('double' o 'single') y QSIM_SHOTS (shots por defecto).
+    """
+    env = os.environ.get
+    return {
+        'max_parallel_threads': int(env('QSIM_MAX_PARALLEL_THREADS', 0)),
+        'max_parallel_experiments': int(env('QSIM_MAX_PARALLEL_EXPERIMENTS', 1)),
+        'max_parallel_shots': int(env('QSIM_MAX_PARALLEL_SHOTS', 0)),
+        'fusion_enable': env('QSIM_FUSION_ENABLE', '1').lower() not in ('0', 'false', 'no'),
+        'fusion_threshold': int(env('QSIM_FUSION_THRESHOLD', 14)),
+        'precision': env('QSIM_PRECISION', 'double'),
+        'shots': int(env('QSIM_SHOTS', 1024)),
+    }
+
+
+@lru_cache(maxsize=None)
+def _cached_simulator(method, options):
+    return AerSimulator(method=method, **dict(options))
+
+
+def reset_job_executor():
+    """
+    Aer lanza los jobs (AerJob y AerJobSet) en un ThreadPoolExecutor global de
+    un hilo. Si el proceso ya había ejecutado algún job antes de un fork
+    (servidor pre-calentado, ProcessPoolExecutor), el hijo hereda el executor
+    sin su hilo y los jobs se quedan esperando para siempre: se crea uno nuevo
+    en cada proceso hijo.
+    """
+    aerjob.DEFAULT_EXECUTOR = ThreadPoolExecutor(max_workers=1)
+    aerjobset.DEFAULT_EXECUTOR = aerjob.DEFAULT_EXECUTOR
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=reset_job_executor)
+
+
+def get_simulator(method='automatic', **overrides):
+    """
+    Simulador compartido: se crea una sola vez por proceso para cada
+    combinación de método y configuración (entorno + overrides).
+    """
+    options = dict(simulator_options(), **overrides)
+    return _cached_simulator(method, tuple(sorted(options.items())))
+
+
+def get_estimator(**overrides):
+    """Estimator de Aer con la misma configuración que los simuladores compartidos (entorno + overrides)"""
+    return Estimator(backend_options=dict(simulator_options(), **overrides))
+
+
+def prepare_circuit(circuit, method=None, max_bond_dimension=None,
+                    truncation_threshold=None, **run_options):
+    """
+    Elige el simulador y transpila el circuito una sola vez.
+    Devuelve (simulador, circuito transpilado, opciones de ejecución) para
+    lanzar después run_compiled(simulator, compiled, **run_options) tantas veces como
+    haga falta (por ejemplo, con parameter_binds distintos).
+    """
+    if max_bond_dimension is not None or truncation_threshold is not None:
+        method = 'matrix_product_state'
+    method = method or select_method(circuit)
+    if method == 'matrix_product_state':
+        run_options['mps_log_data'] = True
+        if max_bond_dimension is not None:
+            run_options['matrix_product_state_max_bond_dimension'] = int(max_bond_dimension)
+        if truncation_threshold is not None:
+            run_options['matrix_product_state_truncation_threshold'] = float(truncation_threshold)
+
+    simulator = get_simulator(method)
+    configuration = simulator.configuration()
+    if circuit.num_qubits > configuration.n_qubits:
+        # El target de Aer declara 63 qubits para MPS aunque el método admite más:
+        # se transpila solo a las puertas base, sin comprobar la anchura
+        compiled = transpile(circuit, basis_gates=configuration.basis_gates)
+    else:
+        compiled = transpile(circuit, simulator)
+    return simulator, compiled, run_options
+
+
+def run_circuit(circuit, shots=None, method=None, max_bond_dimension=None,
+                truncation_threshold=None, **run_options):
+    """
+    Transpila y ejecuta el circuito en el simulador adecuado (sin shots se
+    usan los configurados en QSIM_SHOTS).
+    Devuelve el job, igual que backend.run; el método elegido queda en
+    job.result().results[0].metadata['method'].
+
+    Modo MPS (opcional): con method='matrix_product_state', o indicando
+    max_bond_dimension / truncation_threshold, se limita la dimensión de
+    enlace y se registra el peso descartado (ver mps_truncation_report).
+    """
+    simulator, compiled, run_options = prepare_circuit(
+        circuit, method, max_bond_dimension, truncation_threshold, **run_options)
+    if shots is not None:
+        run_options['shots'] = shots
+    return run_compiled(simulator, compiled, **run_options)
+
+
+# Aer acumula MPS_log_data de todas las ejecuciones del proceso (y lo hereda
+# el hijo tras un fork) en un único registro; se recuerda lo ya leído para
+# quedarse con la parte de cada ejecución
+_mps_log_seen = ''
+_mps_log_lock = threading.Lock()
+
+
+def _reset_mps_log_lock():
+    """El cerrojo puede heredarse tomado por un hilo que no existe en el hijo"""
+    global _mps_log_lock
+    _mps_log_lock = threading.Lock()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_mps_log_lock)
+
+
+def run_compiled(simulator, compiled, **run_options):
+    """
+    simulator.run(compiled, **run_options). Las ejecuciones con mps_log_data se
+    serializan y su truncamiento se lee antes de soltar el cerrojo, para que
+    cada una se quede exactamente con su parte del registro aunque haya
+    peticiones MPS concurrentes.
+    """
+    if not run_options.get('mps_log_data'):
+        return simulator.run(compiled, **run_options)
+    with _mps_log_lock:
+        job = simulator.run(compiled, **run_options)
+        result = job.result()
+        for experiment in range(len(result.results)):
+            _record_truncation(result, experiment)
+    return job
+
+
+def _record_truncation(result, experiment):
+    """Guarda en la metadata el resumen del tramo nuevo del registro (con el cerrojo tomado)"""
+    global _mps_log_seen
+    metadata = result.results[experiment].metadata
+    log = metadata.get('MPS_log_data')
+    if not log:
+        return
+    # El registro es "{I0:..., I1:..., }": sin la llave final, lo anterior es un prefijo
+    full_log = log.rstrip(' }')
+    if full_log.startswith(_mps_log_seen):
+        log = full_log[len(_mps_log_seen):]
+    _mps_log_seen = full_log
+
+    discarded = np.array([float(v) for v in re.findall(r'discarded_value=([-+0-9.eE]+)', log)])
+    bond_dims = [int(d) for dims in re.findall(r'BD=\[([0-9 ]+)\]', log) for d in dims.split()]
+    metadata['mps_truncation'] = {
+        'max_bond_dimension': max(bond_dims, default=1),
+        'truncations': int(len(discarded)),
+        'discarded_weight': float(discarded.sum()),
+        'fidelity_estimate': float(np.prod(1 - discarded)),
+    }
+
+
+def mps_truncation_report(result, experiment=0):
+    """
+    Resumen del truncamiento de una ejecución MPS a partir de MPS_log_data:
+    dimensión de enlace máxima alcanzada, número de truncamientos, peso total
+    descartado y una estimación de la fidelidad Π(1 - pesoᵢ).
+    Devuelve None si la ejecución no fue MPS o no se lanzó con run_compiled / run_circuit.
+    """
+    return result.results[experiment].metadata.get('mps_truncation')
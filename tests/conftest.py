@@ -0,0 +1,8 @@
+# Los módulos viven en la raíz del repositorio y en el backend de ejemplo (sin paquete instalable)
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for path in (ROOT, os.path.join(ROOT, 'QuantumDocs', 'backend-example')):
+    if path not in sys.path:
+        sys.path.insert(0, path)
@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+from qiskit import QuantumCircuit
+
+from adaptive_sampling import adaptive_sample, clopper_pearson_interval, wilson_interval
+
+
+def test_wilson_interval_known_value():
+    lower, upper = wilson_interval(5, 10)
+    assert (float(lower), float(upper)) == pytest.approx((0.2366, 0.7634), abs=1e-4)
+
+
+def test_wilson_interval_edges_and_vectorization():
+    lower, upper = wilson_interval([0, 3, 20], [20, 20, 20])
+    assert lower.shape == upper.shape == (3,)
+    assert lower[0] == 0.0 and upper[2] == 1.0
+    assert np.all(lower < upper)
+    assert lower[1] < 3 / 20 < upper[1]
+
+
+def test_wilson_interval_narrows_with_trials():
+    widths = [np.diff(wilson_interval(n // 4, n))[0] for n in (100, 1000, 10000)]
+    assert widths[0] > widths[1] > widths[2]
+
+
+def test_clopper_pearson_interval_known_values():
+    lower, upper = clopper_pearson_interval([0, 10], [10, 10])
+    assert upper[0] == pytest.approx(1 - 0.025 ** (1 / 10))
+    assert lower[1] == pytest.approx(0.025 ** (1 / 10))
+    assert lower[0] == 0.0 and upper[1] == 1.0
+
+
+def test_adaptive_sample_reaches_precision():
+    qc = QuantumCircuit(1, 1)
+    qc.h(0)
+    qc.measure(0, 0)
+    result = adaptive_sample(qc, ['1'], precision=0.03, initial_shots=50)
+    assert result.converged
+    assert result.counts.shots == result.shots
+    assert np.all(np.diff(result.intervals, axis=-1) / 2 <= 0.03)
+    assert result.estimates[0] == pytest.approx(0.5, abs=0.1)
+
+
+def test_adaptive_sample_stops_early_with_threshold():
+    qc = QuantumCircuit(1, 1)
+    qc.x(0)
+    qc.measure(0, 0)
+    result = adaptive_sample(qc, ['1'], precision=1e-4, threshold=0.5, initial_shots=50)
+    assert result.converged and result.batches == 1
+
+
+def test_adaptive_sample_rejects_unknown_interval():
+    with pytest.raises(ValueError):
+        adaptive_sample(QuantumCircuit(1, 1), ['1'], interval='normal')
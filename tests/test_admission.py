@@ -0,0 +1,94 @@
+import threading
+import time
+
+import pytest
+from qiskit import QuantumCircuit
+
+from admission import (DEFAULT_MPS_BOND_DIMENSION, AdmissionError, MemoryBudget, estimate_memory_mb,
+                       plan_simulation)
+
+
+def _circuit(num_qubits, clifford=False):
+    qc = QuantumCircuit(num_qubits)
+    qc.h(0)
+    for i in range(num_qubits - 1):
+        qc.cx(i, i + 1)
+    if not clifford:
+        qc.t(0)
+    qc.measure_all()
+    return qc
+
+
+def test_estimates_grow_with_the_state_size():
+    assert estimate_memory_mb(21, 'statevector') - estimate_memory_mb(20, 'statevector') == pytest.approx(16)
+    assert estimate_memory_mb(20, 'statevector', 'single') < estimate_memory_mb(20, 'statevector')
+    assert estimate_memory_mb(1000, 'stabilizer') < estimate_memory_mb(30, 'statevector')
+
+
+def test_plan_keeps_requested_method_when_it_fits():
+    plan = plan_simulation(_circuit(10), method='statevector')
+    assert (plan['method'], plan['precision'], plan['downgrades']) == ('statevector', 'double', [])
+
+
+def test_plan_downgrades_precision_then_method():
+    budget = estimate_memory_mb(26, 'statevector', 'single') + 1
+    plan = plan_simulation(_circuit(26), method='statevector', budget_mb=budget)
+    assert (plan['method'], plan['precision'], plan['downgrades']) == ('statevector', 'single', ['precision: single'])
+    plan = plan_simulation(_circuit(26), method='statevector', budget_mb=64)
+    assert plan['method'] == 'matrix_product_state'
+
+
+def test_plan_reports_default_bond_dimension_cap():
+    plan = plan_simulation(_circuit(40), method='matrix_product_state')
+    assert plan['max_bond_dimension'] == DEFAULT_MPS_BOND_DIMENSION
+    assert f'max_bond_dimension={DEFAULT_MPS_BOND_DIMENSION}' in plan['downgrades']
+    explicit = plan_simulation(_circuit(40), method='matrix_product_state', max_bond_dimension=8)
+    assert explicit['downgrades'] == []
+
+
+def test_plan_rejects_what_does_not_fit():
+    with pytest.raises(AdmissionError) as error:
+        plan_simulation(_circuit(40), method='statevector', precision='double', budget_mb=1)
+    assert error.value.status_code == 413
+    with pytest.raises(AdmissionError):
+        plan_simulation(_circuit(3), method='stabilizer')
+
+
+def test_memory_budget_reserve_and_release():
+    budget = MemoryBudget(budget_mb=100, timeout=5)
+    with budget.reserve(60):
+        assert budget.in_use_mb == 60
+        with budget.reserve(40):
+            assert budget.in_use_mb == 100
+    assert budget.in_use_mb == 0
+    with pytest.raises(AdmissionError):
+        with budget.reserve(101):
+            pass
+
+
+def test_memory_budget_without_waiting():
+    budget = MemoryBudget(budget_mb=100, timeout=5)
+    with budget.reserve(90):
+        start = time.perf_counter()
+        with pytest.raises(AdmissionError) as error:
+            with budget.reserve(20, timeout=0):
+                pass
+        assert error.value.status_code == 503
+        assert time.perf_counter() - start < 0.5
+    assert budget.in_use_mb == 0
+
+
+def test_memory_budget_queues_until_memory_is_released():
+    budget = MemoryBudget(budget_mb=100, timeout=5)
+    acquired = threading.Event()
+
+    def waiter():
+        with budget.reserve(50):
+            acquired.set()
+
+    with budget.reserve(80):
+        thread = threading.Thread(target=waiter)
+        thread.start()
+        assert not acquired.wait(0.1)
+    thread.join(2)
+    assert acquired.is_set() and budget.in_use_mb == 0
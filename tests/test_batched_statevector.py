@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+from qiskit import QuantumCircuit
+from qiskit.circuit import Parameter, ParameterVector
+from qiskit.circuit.library import TwoLocal
+from qiskit.quantum_info import SparsePauliOp, Statevector
+
+from batched_statevector import expectation_values, simulate_batch
+
+
+def _reference(circuit, values):
+    return np.array([Statevector(circuit.assign_parameters(v)).data for v in values])
+
+
+@pytest.mark.parametrize('reps', [1, 2])
+def test_simulate_batch_matches_statevector(reps):
+    ansatz = TwoLocal(3, ['ry', 'rz'], 'cx', entanglement='linear', reps=reps)
+    values = np.random.default_rng(1).uniform(-np.pi, np.pi, (5, ansatz.num_parameters))
+    np.testing.assert_allclose(simulate_batch(ansatz, values), _reference(ansatz, values), atol=1e-10)
+
+
+def test_simulate_batch_parameter_expressions_and_two_qubit_rotations():
+    theta = ParameterVector('θ', 2)
+    qc = QuantumCircuit(3)
+    qc.h(0)
+    qc.rzz(2 * theta[0], 0, 2)
+    qc.rxx(theta[0] - theta[1], 1, 2)
+    qc.p(theta[1] / 3, 1)
+    qc.cx(2, 0)
+    values = [[0.3, -1.2], [np.pi, 0.5]]
+    np.testing.assert_allclose(simulate_batch(qc, values), _reference(qc, values), atol=1e-10)
+
+
+def test_simulate_batch_parameterized_global_phase():
+    theta = Parameter('θ')
+    qc = QuantumCircuit(2, global_phase=theta / 2)
+    qc.h(0)
+    qc.crz(theta, 0, 1)  # su descomposición también añade fase global
+    values = [[0.0], [0.7], [-2.1]]
+    np.testing.assert_allclose(simulate_batch(qc, values), _reference(qc, values), atol=1e-10)
+
+
+def test_simulate_batch_rejects_wrong_parameter_count():
+    qc = QuantumCircuit(1)
+    qc.ry(Parameter('a'), 0)
+    with pytest.raises(ValueError):
+        simulate_batch(qc, [[0.1, 0.2]])
+
+
+def test_expectation_values_match_statevector():
+    ansatz = TwoLocal(2, 'ry', 'cx', reps=1)
+    hamiltonian = SparsePauliOp(['ZZ', 'XI', 'IY'], [1.0, -0.5, 0.25])
+    values = np.random.default_rng(2).uniform(-np.pi, np.pi, (4, ansatz.num_parameters))
+    expected = [Statevector(ansatz.assign_parameters(v)).expectation_value(hamiltonian).real
+                for v in values]
+    np.testing.assert_allclose(expectation_values(simulate_batch(ansatz, values), hamiltonian),
+                               expected, atol=1e-10)
@@ -0,0 +1,124 @@
+import math
+import time
+
+import pytest
+from qiskit import ClassicalRegister, QuantumCircuit, QuantumRegister
+from qiskit.circuit import Parameter
+
+from circuit_spec import (MAX_CLBITS, MAX_QUBITS, CircuitSpecError, ResultCache, circuit_from_json,
+                          circuit_from_qasm, parse_parameter, structural_hash)
+
+BELL_JSON = {'num_qubits': 2, 'num_clbits': 2,
+             'gates': [{'name': 'h', 'qubits': [0]},
+                       {'name': 'rz', 'qubits': [1], 'params': ['pi/4']},
+                       {'name': 'cx', 'qubits': [0, 1]},
+                       {'name': 'measure', 'qubits': [0, 1], 'clbits': [0, 1]}]}
+
+BELL_QASM = """OPENQASM 2.0;
+include "qelib1.inc";
+qreg q[2];
+creg c[2];
+h q[0];
+rz(0.25 * pi) q[1];
+cx q[0], q[1];
+measure q -> c;
+"""
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('pi/2', math.pi / 2),
+    ('-3*pi/4', -3 * math.pi / 4),
+    ('2*tau', 4 * math.pi),
+    ('pi**2', math.pi**2),
+    ('1e-3', 1e-3),
+    (0.5, 0.5),
+])
+def test_parse_parameter_numeric(text, expected):
+    assert parse_parameter(text) == pytest.approx(expected)
+
+
+def test_parse_parameter_symbols_are_shared():
+    symbols = {}
+    first = parse_parameter('2*theta', symbols)
+    second = parse_parameter('theta + phi', symbols)
+    assert isinstance(symbols['theta'], Parameter)
+    assert first.parameters & second.parameters == {symbols['theta']}
+
+
+@pytest.mark.parametrize('text', [
+    '__import__("os")', 'pi.real', 'abs(1)', '1/0', '1e308*10', '(-1)**0.5', '2**theta', '[1]',
+])
+def test_parse_parameter_rejects(text):
+    with pytest.raises(CircuitSpecError):
+        parse_parameter(text, {})
+
+
+def test_parse_parameter_rejects_huge_powers_quickly():
+    start = time.perf_counter()
+    for text in ('9**9**9**9', '2**1000', '10**-400'):
+        with pytest.raises(CircuitSpecError):
+            parse_parameter(text)
+    assert time.perf_counter() - start < 1
+
+
+def test_structural_hash_json_and_qasm_agree():
+    assert structural_hash(circuit_from_json(BELL_JSON)) == structural_hash(circuit_from_qasm(BELL_QASM))
+
+
+def test_structural_hash_distinguishes_parameters_and_qubits():
+    base = structural_hash(circuit_from_json(BELL_JSON))
+    changed_param = dict(BELL_JSON, gates=[dict(g) for g in BELL_JSON['gates']])
+    changed_param['gates'][1]['params'] = ['pi/3']
+    changed_qubits = dict(BELL_JSON, gates=[dict(g) for g in BELL_JSON['gates']])
+    changed_qubits['gates'][2]['qubits'] = [1, 0]
+    assert structural_hash(circuit_from_json(changed_param)) != base
+    assert structural_hash(circuit_from_json(changed_qubits)) != base
+
+
+def test_structural_hash_includes_classical_conditions():
+    plain = QuantumCircuit(2, 1)
+    plain.x(1)
+    conditioned = QuantumCircuit(2, 1)
+    conditioned.x(1).c_if(conditioned.clbits[0], 1)
+    assert structural_hash(plain) != structural_hash(conditioned)
+
+
+def test_structural_hash_includes_register_layout():
+    split = QuantumCircuit(QuantumRegister(1, 'q'), ClassicalRegister(1, 'a'), ClassicalRegister(1, 'b'))
+    joined = QuantumCircuit(QuantumRegister(1, 'q'), ClassicalRegister(2, 'a'))
+    assert structural_hash(split) != structural_hash(joined)
+
+
+@pytest.mark.parametrize('spec', [
+    {'num_qubits': 10**9},
+    {'num_qubits': MAX_QUBITS + 1},
+    {'num_qubits': 2, 'num_clbits': MAX_CLBITS + 1},
+])
+def test_circuit_from_json_rejects_wide_circuits(spec):
+    with pytest.raises(CircuitSpecError):
+        circuit_from_json(spec)
+
+
+@pytest.mark.parametrize('text', [
+    'OPENQASM 2.0; include "qelib1.inc"; qreg q[1000000000];',
+    f'OPENQASM 2.0; include "qelib1.inc"; qreg a[{MAX_QUBITS}]; qreg b[1];',
+    f'OPENQASM 2.0; include "qelib1.inc"; qreg q[1]; creg c[{MAX_CLBITS + 1}];',
+    'OPENQASM 3.0; include "stdgates.inc"; qubit[99999999999999999999] q;',
+    f'OPENQASM 3.0; include "stdgates.inc"; qubit[2] q; bit[{MAX_CLBITS + 1}] c;',
+])
+def test_circuit_from_qasm_rejects_wide_registers(text):
+    with pytest.raises(CircuitSpecError):
+        circuit_from_qasm(text)
+
+
+def test_circuit_at_the_width_limit_is_accepted():
+    assert circuit_from_json({'num_qubits': MAX_QUBITS}).num_qubits == MAX_QUBITS
+
+
+def test_result_cache_evicts_least_recently_used():
+    cache = ResultCache(size=2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    cache.get('a')
+    cache.put('c', 3)
+    assert (cache.get('a'), cache.get('b'), cache.get('c')) == (1, None, 3)
@@ -0,0 +1,66 @@
+import pytest
+from qiskit import ClassicalRegister, QuantumCircuit, QuantumRegister
+from qiskit.result import marginal_counts
+
+from counts import CountsArray
+from simulators import run_circuit
+
+
+def _two_register_result():
+    qr = QuantumRegister(4)
+    qc = QuantumCircuit(qr, ClassicalRegister(3, 'a'), ClassicalRegister(1, 'b'))
+    qc.h([0, 1, 2])
+    qc.cx(0, 3)
+    qc.measure(qr, qc.clbits)
+    return run_circuit(qc, shots=2000, seed_simulator=11).result()
+
+
+@pytest.fixture(scope='module')
+def result():
+    return _two_register_result()
+
+
+def test_to_dict_matches_get_counts(result):
+    counts = CountsArray.from_result(result)
+    assert counts.to_dict() == result.get_counts()
+    assert counts.shots == 2000
+
+
+def test_lookup_and_probabilities(result):
+    expected = result.get_counts()
+    counts = CountsArray.from_result(result)
+    for bitstring, value in expected.items():
+        assert counts[bitstring] == value
+        assert counts.get(bitstring.replace(' ', '')) == value
+    assert counts.get('1 000', default=-1) == expected.get('1 000', -1)
+    assert sum(counts.probabilities_dict().values()) == pytest.approx(1.0)
+
+
+def test_marginal_matches_qiskit(result):
+    counts = CountsArray.from_result(result)
+    for bits in ([0], [1, 3], [0, 2, 3]):
+        assert counts.marginal(bits).to_dict() == marginal_counts(result.get_counts(), bits)
+
+
+def test_top_k_is_sorted_by_count(result):
+    top = CountsArray.from_result(result).top_k(3)
+    expected = sorted(result.get_counts().items(), key=lambda item: -item[1])[:3]
+    assert [count for _, count in top] == [count for _, count in expected]
+
+
+def test_from_dict_and_addition_round_trip(result):
+    counts = CountsArray.from_result(result)
+    rebuilt = CountsArray.from_dict(result.get_counts())
+    assert rebuilt.to_dict() == counts.to_dict()
+    doubled = (counts + rebuilt).to_dict()
+    assert doubled == {key: 2 * value for key, value in counts.to_dict().items()}
+
+
+def test_wide_registers_use_python_integers():
+    qc = QuantumCircuit(70, 70)
+    qc.x([0, 65, 69])
+    qc.measure(range(70), range(70))
+    result = run_circuit(qc, shots=10).result()
+    counts = CountsArray.from_result(result)
+    assert counts.to_dict() == result.get_counts()
+    assert counts.marginal([65, 69, 1]).to_dict() == {'011': 10}
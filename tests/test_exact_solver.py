@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+from qiskit.quantum_info import SparsePauliOp
+
+from exact_solver import DENSE_LIMIT, exact_eigenpairs, exact_ground_energy, hamiltonian_hash
+from hamiltonians import ising_chain, maxcut_hamiltonian
+
+
+def _dense_spectrum(hamiltonian):
+    return np.linalg.eigvalsh(hamiltonian.to_matrix())
+
+
+@pytest.mark.parametrize('num_qubits', [4, DENSE_LIMIT + 1])
+def test_ground_energy_matches_dense_diagonalization(num_qubits, tmp_path):
+    hamiltonian = ising_chain(num_qubits, J=1.0, h=0.7)
+    expected = _dense_spectrum(hamiltonian)[:3]
+    values, vectors = exact_eigenpairs(hamiltonian, k=3, return_vectors=True, cache_dir=tmp_path)
+    np.testing.assert_allclose(values, expected, atol=1e-8)
+    # Los autovectores lo son de verdad: H v = λ v
+    matrix = hamiltonian.to_matrix(sparse=True)
+    np.testing.assert_allclose(matrix @ vectors, vectors * values, atol=1e-6)
+
+
+def test_diagonal_hamiltonian_shortcut(tmp_path):
+    hamiltonian = maxcut_hamiltonian(np.array([[0, 1], [1, 2], [2, 0], [2, 3]]), 4)
+    values, vectors = exact_eigenpairs(hamiltonian, k=2, return_vectors=True, cache_dir=tmp_path)
+    np.testing.assert_allclose(values, _dense_spectrum(hamiltonian)[:2])
+    assert np.count_nonzero(vectors[:, 0]) == 1
+
+
+def test_results_are_cached_on_disk(tmp_path):
+    hamiltonian = SparsePauliOp(['XX', 'ZI'], [0.5, -1.0])
+    first = exact_ground_energy(hamiltonian, cache_dir=tmp_path)
+    assert len(list(tmp_path.iterdir())) == 1
+    assert exact_ground_energy(hamiltonian, cache_dir=tmp_path) == first
+    assert first == pytest.approx(_dense_spectrum(hamiltonian)[0])
+
+
+def test_hash_ignores_term_order_and_duplicates():
+    a = SparsePauliOp(['XX', 'ZI'], [0.5, -1.0])
+    b = SparsePauliOp(['ZI', 'XX', 'XX'], [-1.0, 0.25, 0.25])
+    assert hamiltonian_hash(a) == hamiltonian_hash(b)
+    assert hamiltonian_hash(a) != hamiltonian_hash(SparsePauliOp(['XX', 'ZI'], [0.5, 1.0]))
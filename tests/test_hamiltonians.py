@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+from qiskit.quantum_info import SparsePauliOp
+
+from hamiltonians import (chain_edges, ising_chain, ising_hamiltonian, ising_lattice_2d, lattice_edges_2d,
+                          maxcut_hamiltonian)
+
+
+def _label(num_qubits, paulis):
+    """Etiqueta de Qiskit (qubit n-1 a la izquierda) con los Paulis {qubit: 'Z'} indicados"""
+    chars = ['I'] * num_qubits
+    for qubit, pauli in paulis.items():
+        chars[num_qubits - 1 - qubit] = pauli
+    return ''.join(chars)
+
+
+def _ising_reference(edges, num_qubits, J, h):
+    terms = [(_label(num_qubits, {int(i): 'Z', int(j): 'Z'}), -J) for i, j in edges]
+    terms += [(_label(num_qubits, {q: 'X'}), -h) for q in range(num_qubits)]
+    return SparsePauliOp.from_list(terms)
+
+
+def _equivalent(a, b):
+    return (a - b).simplify(atol=1e-12) == SparsePauliOp(['I' * a.num_qubits], [0.0])
+
+
+@pytest.mark.parametrize('periodic', [False, True])
+def test_ising_chain_matches_from_list(periodic):
+    edges = chain_edges(5, periodic)
+    assert len(edges) == (5 if periodic else 4)
+    assert _equivalent(ising_chain(5, J=0.8, h=0.3, periodic=periodic),
+                       _ising_reference(edges, 5, 0.8, 0.3))
+
+
+@pytest.mark.parametrize('rows, cols, periodic, num_edges', [
+    (2, 3, False, 7),
+    (3, 3, True, 18),
+    (2, 2, True, 4),  # sin aristas duplicadas al cerrar una red de lado 2
+])
+def test_lattice_edges(rows, cols, periodic, num_edges):
+    edges = lattice_edges_2d(rows, cols, periodic)
+    assert len(edges) == num_edges
+    assert len({tuple(sorted(edge)) for edge in edges.tolist()}) == num_edges
+
+
+def test_ising_lattice_matches_from_list():
+    edges = lattice_edges_2d(2, 3)
+    assert _equivalent(ising_lattice_2d(2, 3, J=1.0, h=0.5), _ising_reference(edges, 6, 1.0, 0.5))
+    assert _equivalent(ising_hamiltonian(edges, 6), ising_lattice_2d(2, 3))
+
+
+def test_maxcut_hamiltonian_matches_from_list_and_cut_values():
+    edges = np.array([[0, 1], [1, 2], [2, 3], [3, 0], [0, 2]])
+    weights = np.array([1.0, 2.0, 0.5, 1.0, 3.0])
+    expected = SparsePauliOp.from_list([(_label(4, {int(i): 'Z', int(j): 'Z'}), w / 2)
+                                        for (i, j), w in zip(edges, weights)])
+    hamiltonian = maxcut_hamiltonian(edges, weights=weights)
+    assert hamiltonian.num_qubits == 4
+    assert _equivalent(hamiltonian, expected)
+    # <z|H|z> = W/2 - corte(z): minimizar H maximiza el corte
+    diagonal = np.real(hamiltonian.to_matrix().diagonal())
+    for z in range(16):
+        bits = (z >> np.arange(4)) & 1
+        cut = weights[bits[edges[:, 0]] != bits[edges[:, 1]]].sum()
+        assert diagonal[z] == pytest.approx(weights.sum() / 2 - cut)
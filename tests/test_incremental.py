@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+from qiskit import QuantumCircuit
+from qiskit.quantum_info import Statevector
+
+from circuit_spec import CircuitSpecError, standard_gate
+from incremental import IncrementalState, handle_message
+
+GATES = [
+    {'name': 'h', 'qubits': [0]},
+    {'name': 'cx', 'qubits': [0, 2]},
+    {'name': 'ry', 'qubits': [1], 'params': ['pi/3']},
+    {'name': 'barrier', 'qubits': [0, 1, 2]},
+    {'name': 'ccx', 'qubits': [2, 1, 0]},
+    {'name': 'rzz', 'qubits': [1, 2], 'params': ['0.7']},
+    {'name': 'swap', 'qubits': [0, 1]},
+    {'name': 't', 'qubits': [2]},
+]
+
+
+def _reference(gates, num_qubits=3):
+    qc = QuantumCircuit(num_qubits)
+    for gate in gates:
+        if gate['name'] != 'barrier':
+            qc.append(standard_gate(gate['name'], gate.get('params', []), len(gate['qubits'])), gate['qubits'])
+    return Statevector(qc).data
+
+
+@pytest.mark.parametrize('checkpoint_interval', [1, 3, 16])
+def test_state_matches_statevector_after_each_gate_and_undo(checkpoint_interval):
+    session = IncrementalState(3, checkpoint_interval=checkpoint_interval)
+    for position, gate in enumerate(GATES, start=1):
+        session.append(gate)
+        np.testing.assert_allclose(session.state, _reference(GATES[:position]), atol=1e-12)
+    for remaining in (6, 5, 1):
+        session.undo(len(session.gates) - remaining)
+        np.testing.assert_allclose(session.state, _reference(GATES[:remaining]), atol=1e-12)
+    # Editar: deshacer y añadir otra puerta en su lugar
+    session.append({'name': 'x', 'qubits': [1]})
+    np.testing.assert_allclose(session.state, _reference(GATES[:1] + [{'name': 'x', 'qubits': [1]}]),
+                               atol=1e-12)
+
+
+def test_only_changed_probabilities_are_sent():
+    session = IncrementalState(2)
+    assert session.append({'name': 'h', 'qubits': [0]}) == {'00': pytest.approx(0.5), '01': pytest.approx(0.5)}
+    assert session.append({'name': 'z', 'qubits': [0]}) == {}
+    assert session.undo(5) == {'00': 1.0, '01': 0.0}
+
+
+def test_handle_message_protocol():
+    session, reply = handle_message(None, {'type': 'init', 'num_qubits': 2, 'gates': [{'name': 'x', 'qubits': [1]}]})
+    assert reply == {'type': 'state', 'depth': 1, 'probabilities': {'10': 1.0}}
+    session, reply = handle_message(session, {'type': 'append', 'gate': {'name': 'cx', 'qubits': [1, 0]}})
+    assert reply['depth'] == 2 and reply['changed'] == {'10': 0.0, '11': 1.0}
+    with pytest.raises(CircuitSpecError):
+        handle_message(None, {'type': 'undo'})
+    with pytest.raises(CircuitSpecError):
+        handle_message(session, {'type': 'redo'})
+
+
+@pytest.mark.parametrize('gate', [{'name': 'h', 'qubits': [5]}, {'name': 'cx', 'qubits': [0, 0]},
+                                  {'name': 'nope', 'qubits': [0]}])
+def test_invalid_gates_are_rejected(gate):
+    session = IncrementalState(2)
+    with pytest.raises(CircuitSpecError):
+        session.append(gate)
+    assert session.gates == []
@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+from qiskit import QuantumCircuit
+from qiskit.quantum_info import DensityMatrix, Pauli, Statevector, partial_trace
+
+from observables import bloch_vectors, marginal_probabilities, probabilities_dict
+
+
+def _state():
+    qc = QuantumCircuit(4)
+    qc.h(0)
+    qc.ry(0.7, 1)
+    qc.cx(0, 2)
+    qc.rx(1.3, 3)
+    qc.s(0)
+    qc.cz(1, 3)
+    return Statevector(qc)
+
+
+def test_bloch_vectors_match_reduced_density_matrices():
+    state = _state()
+    vectors = bloch_vectors(state.data, 4)
+    assert vectors.shape == (4, 3)
+    for qubit in range(4):
+        others = [q for q in range(4) if q != qubit]
+        reduced = DensityMatrix(partial_trace(state, others))
+        expected = [reduced.expectation_value(Pauli(p)).real for p in 'XYZ']
+        np.testing.assert_allclose(vectors[qubit], expected, atol=1e-12)
+
+
+def test_bloch_vectors_of_basis_and_plus_states():
+    qc = QuantumCircuit(2)
+    qc.x(1)
+    qc.h(0)
+    vectors = bloch_vectors(Statevector(qc).data, 2)
+    np.testing.assert_allclose(vectors, [[1, 0, 0], [0, 0, -1]], atol=1e-12)
+
+
+@pytest.mark.parametrize('qubits', [[0], [2], [0, 1], [1, 0], [3, 0, 2], [0, 1, 2, 3]])
+def test_marginal_matches_statevector(qubits):
+    state = _state()
+    marginal = marginal_probabilities(state.probabilities(), 4, qubits)
+    np.testing.assert_allclose(marginal, state.probabilities(qubits), atol=1e-12)
+
+
+@pytest.mark.parametrize('qubits', [[4], [-1], [1, 1]])
+def test_marginal_rejects_invalid_qubits(qubits):
+    with pytest.raises(ValueError):
+        marginal_probabilities(np.full(16, 1 / 16), 4, qubits)
+
+
+def test_probabilities_dict_keeps_nonzero_entries():
+    values = np.array([0.5, 0.0, 1e-15, 0.5])
+    assert probabilities_dict(values, 2) == {'00': 0.5, '11': 0.5}
+    assert probabilities_dict(_state().probabilities(), 4) == pytest.approx(
+        _state().probabilities_dict())
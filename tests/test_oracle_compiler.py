@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+from qiskit.quantum_info import Statevector
+
+from oracle_compiler import compile_oracle, marked_items_table, minimal_esop, truth_table
+
+FUNCTIONS = [
+    (lambda x: x in (3, 5, 6), 3),        # mayoría "exacta" de 3 bits
+    (lambda x: bin(x).count('1') % 2, 4),  # paridad
+    (0b1000000000000001, 4),               # máscara: f(0) = f(15) = 1
+    (lambda x: 0, 2),                      # constante
+]
+
+
+def _output(oracle, x):
+    """Índice de la base resultante de aplicar el oráculo a |x⟩ (debe ser un estado de la base)"""
+    probabilities = Statevector.from_int(x, 2**oracle.num_qubits).evolve(oracle).probabilities()
+    index = int(np.argmax(probabilities))
+    assert probabilities[index] == pytest.approx(1.0)
+    return index
+
+
+@pytest.mark.parametrize('function, num_inputs', FUNCTIONS)
+@pytest.mark.parametrize('strategy', ['noancilla', 'v-chain'])
+def test_bit_oracle_matches_truth_table(function, num_inputs, strategy):
+    table = truth_table(function, num_inputs)
+    oracle = compile_oracle(function, num_inputs, mode='bit', strategy=strategy)
+    for x in range(2**num_inputs):
+        for y in (0, 1):
+            # Las ancillas (si las hay) empiezan y terminan en |0⟩
+            assert _output(oracle, x | y << num_inputs) == x | (y ^ int(table[x])) << num_inputs
+
+
+@pytest.mark.parametrize('function, num_inputs', FUNCTIONS)
+def test_phase_oracle_matches_truth_table(function, num_inputs):
+    table = truth_table(function, num_inputs)
+    oracle = compile_oracle(function, num_inputs, mode='phase')
+    uniform = Statevector.from_label('+' * num_inputs)
+    phases = uniform.evolve(oracle).data / uniform.data
+    np.testing.assert_allclose(phases, (-1.0) ** table, atol=1e-10)
+
+
+def test_multi_output_oracle():
+    table = np.array([[x & 1, (x >> 1) ^ (x & 1)] for x in range(4)])
+    oracle = compile_oracle(table, 2)
+    for x in range(4):
+        assert _output(oracle, x) == x | int(table[x, 0]) << 2 | int(table[x, 1]) << 3
+
+
+def test_minimal_esop_reproduces_table():
+    table = marked_items_table([1, 6, 7], 3)
+    polarity, terms, _ = minimal_esop(table, 3)
+    for x in range(8):
+        literals = x ^ polarity
+        assert sum((literals & term) == term for term in terms) % 2 == table[x]
+
+
+def test_cached_oracle_is_a_copy():
+    first = compile_oracle(lambda x: x == 2, 2)
+    first.x(0)
+    assert compile_oracle(lambda x: x == 2, 2) != first
@@ -0,0 +1,54 @@
+import itertools
+
+import numpy as np
+import pytest
+from qiskit.circuit.library import TwoLocal
+from qiskit.quantum_info import SparsePauliOp, Statevector
+
+from pauli_grouping import estimate_expectation, measurement_basis, qubit_wise_commuting_groups
+
+HAMILTONIAN = SparsePauliOp(['III', 'ZZI', 'IZZ', 'XXI', 'IXX', 'YIY', 'ZIZ', 'XIX', 'IIY'],
+                            [-1.0, 0.5, 0.5, 0.3, 0.3, -0.2, 0.1, 0.4, 0.25])
+
+
+def _qubit_wise_commute(a, b):
+    return all(p == 'I' or q == 'I' or p == q for p, q in zip(a, b))
+
+
+def test_groups_partition_the_non_identity_terms():
+    groups = qubit_wise_commuting_groups(HAMILTONIAN)
+    indices = sorted(int(i) for group in groups for i in group)
+    assert indices == list(range(1, len(HAMILTONIAN)))
+
+
+def test_every_group_commutes_qubit_wise():
+    labels = HAMILTONIAN.paulis.to_labels()
+    for group in qubit_wise_commuting_groups(HAMILTONIAN):
+        for a, b in itertools.combinations(group, 2):
+            assert _qubit_wise_commute(labels[a], labels[b])
+            # Conmutar qubit a qubit implica conmutar como operadores
+            pa, pb = HAMILTONIAN.paulis[int(a)], HAMILTONIAN.paulis[int(b)]
+            assert pa.commutes(pb)
+
+
+def test_measurement_basis_covers_each_term():
+    labels = HAMILTONIAN.paulis.to_labels()
+    for group in qubit_wise_commuting_groups(HAMILTONIAN):
+        basis = measurement_basis(HAMILTONIAN, group)
+        for term in group:
+            # Las etiquetas de Qiskit van del qubit n-1 al 0
+            for q, pauli in enumerate(reversed(labels[term])):
+                assert pauli in ('I', basis[q])
+
+
+def test_identity_only_hamiltonian_needs_no_circuits():
+    assert qubit_wise_commuting_groups(SparsePauliOp(['II'], [2.0])) == []
+
+
+def test_estimate_matches_exact_expectation():
+    ansatz = TwoLocal(3, 'ry', 'cx', reps=1)
+    circuit = ansatz.assign_parameters(np.random.default_rng(3).uniform(-np.pi, np.pi, ansatz.num_parameters))
+    exact = Statevector(circuit).expectation_value(HAMILTONIAN).real
+    energy, _, num_circuits = estimate_expectation(circuit, HAMILTONIAN, shots=20000, seed=5)
+    assert num_circuits == len(qubit_wise_commuting_groups(HAMILTONIAN))
+    assert energy == pytest.approx(exact, abs=0.05)
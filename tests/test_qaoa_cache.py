@@ -0,0 +1,57 @@
+import json
+
+import numpy as np
+import pytest
+
+from qaoa_cache import QAOAParameterCache, graph_features, interpolate_schedule, solve_with_warm_start
+
+SQUARE = np.array([[0, 1], [1, 2], [2, 3], [3, 0]])
+# Mismo número de nodos y secuencia de grados que SQUARE, con otras etiquetas
+RELABELED = np.array([[0, 2], [2, 1], [1, 3], [3, 0]])
+
+
+def test_graph_features_ignore_labels():
+    assert graph_features(SQUARE, 4) == graph_features(RELABELED, 4)
+    assert graph_features(SQUARE, 4) != graph_features(SQUARE[:3], 4)
+
+
+def test_interpolation_keeps_endpoints_and_grows_one_layer():
+    params = np.array([0.2, 0.6, 0.9, 0.4])  # γ₁ γ₂ | β₁ β₂
+    grown = interpolate_schedule(params)
+    assert len(grown) == 6
+    np.testing.assert_allclose(grown[[0, 3]], [0.2, 0.9])
+    np.testing.assert_allclose(grown[[2, 5]], [0.6, 0.4])
+    # p=1 -> 2 copia el único valor
+    np.testing.assert_allclose(interpolate_schedule([0.5, 0.3]), [0.5, 0.5, 0.3, 0.3])
+
+
+def test_lookup_same_similar_and_interpolated(tmp_path):
+    cache = QAOAParameterCache(path=str(tmp_path / 'params.json'))
+    assert cache.lookup(SQUARE, 4, 1) is None
+    cache.store(SQUARE, 4, 1, [0.4, 0.3], expected_cut=3.0)
+    np.testing.assert_allclose(cache.lookup(RELABELED, 4, 1), [0.4, 0.3])
+    np.testing.assert_allclose(cache.lookup(SQUARE, 4, 2), interpolate_schedule([0.4, 0.3]))
+    # Solo se sustituye un óptimo por otro mejor
+    cache.store(SQUARE, 4, 1, [9.0, 9.0], expected_cut=2.0)
+    np.testing.assert_allclose(cache.lookup(SQUARE, 4, 1), [0.4, 0.3])
+
+
+def test_persistence_and_in_memory_cache(tmp_path):
+    path = tmp_path / 'params.json'
+    QAOAParameterCache(path=str(path)).store(SQUARE, 4, 1, [0.4, 0.3], expected_cut=3.0)
+    assert len(json.loads(path.read_text())) == 1
+    np.testing.assert_allclose(QAOAParameterCache(path=str(path)).lookup(SQUARE, 4, 1), [0.4, 0.3])
+
+    memory = QAOAParameterCache(path=None)
+    memory.store(SQUARE, 4, 1, [0.4, 0.3], expected_cut=3.0)
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_warm_start_reuses_cached_levels():
+    cache = QAOAParameterCache(path=None)
+    cold = solve_with_warm_start(SQUARE, 4, reps=2, cache=cache)
+    warm = solve_with_warm_start(SQUARE, 4, reps=2, cache=cache)
+    assert len(cache.entries) == 2
+    assert warm['expected_cut'] >= cold['expected_cut'] - 1e-6
+    assert warm['total_evals'] < cold['total_evals']
+    assert cold['expected_cut'] == pytest.approx(4.0, abs=0.2)
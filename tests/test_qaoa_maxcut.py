@@ -0,0 +1,95 @@
+from functools import reduce
+
+import numpy as np
+import pytest
+from qiskit.quantum_info import Statevector
+
+from hamiltonians import maxcut_hamiltonian
+from qaoa_maxcut import (apply_mixer, cut_values, cvar, expected_cut, index_to_bitstring, qaoa_state,
+                         sample_cut_values, solve_maxcut_qaoa)
+
+EDGES = np.array([[0, 1], [1, 2], [2, 3], [3, 0], [0, 2]])
+WEIGHTS = np.array([1.0, 2.0, 0.5, 1.0, 1.5])
+
+
+def _brute_force_cuts(edges, num_nodes, weights):
+    cuts = []
+    for index in range(2**num_nodes):
+        side = [(index >> i) & 1 for i in range(num_nodes)]
+        cuts.append(sum(w for (i, j), w in zip(edges, weights) if side[i] != side[j]))
+    return np.array(cuts)
+
+
+def _dense_qaoa_state(params, cut, num_nodes):
+    p = len(params) // 2
+    state = np.full(2**num_nodes, 2**(-num_nodes / 2), dtype=complex)
+    for gamma, beta in zip(params[:p], params[p:]):
+        rx = np.array([[np.cos(beta), -1j * np.sin(beta)], [-1j * np.sin(beta), np.cos(beta)]])
+        state = reduce(np.kron, [rx] * num_nodes) @ (np.exp(-1j * gamma * cut) * state)
+    return state
+
+
+def test_cut_values_match_brute_force():
+    np.testing.assert_allclose(cut_values(EDGES, 4, WEIGHTS), _brute_force_cuts(EDGES, 4, WEIGHTS))
+    np.testing.assert_allclose(cut_values(EDGES, 4), _brute_force_cuts(EDGES, 4, np.ones(len(EDGES))))
+
+
+@pytest.mark.parametrize('num_nodes, block', [(4, 5), (7, 3), (7, 2)])
+def test_mixer_blocks_match_kronecker_product(num_nodes, block):
+    state = np.random.default_rng(num_nodes).normal(size=2**num_nodes) + 0j
+    rx = np.array([[np.cos(0.4), -1j * np.sin(0.4)], [-1j * np.sin(0.4), np.cos(0.4)]])
+    np.testing.assert_allclose(apply_mixer(state, 0.4, num_nodes, block=block),
+                               reduce(np.kron, [rx] * num_nodes) @ state, atol=1e-12)
+
+
+def test_qaoa_state_and_energy_match_dense_reference():
+    cut = cut_values(EDGES, 4, WEIGHTS)
+    params = np.array([0.3, 0.7, 0.5, 0.2])
+    state = qaoa_state(params, cut, 4)
+    np.testing.assert_allclose(state, _dense_qaoa_state(params, cut, 4), atol=1e-12)
+    brute = _brute_force_cuts(EDGES, 4, WEIGHTS)
+    assert expected_cut(params, cut, 4) == pytest.approx(np.abs(state)**2 @ brute)
+    # <H> con H = Σ (w/2)·ZᵢZⱼ equivale a W/2 - <C>
+    energy = Statevector(state).expectation_value(maxcut_hamiltonian(EDGES, 4, WEIGHTS)).real
+    assert energy == pytest.approx(WEIGHTS.sum() / 2 - expected_cut(params, cut, 4))
+
+
+def test_solver_finds_the_maximum_cut():
+    result = solve_maxcut_qaoa(EDGES, 4, reps=3, weights=WEIGHTS)
+    brute = _brute_force_cuts(EDGES, 4, WEIGHTS)
+    assert result['max_cut'] == brute.max()
+    assert result['cut'] == brute.max()
+    assert result['energy'] == pytest.approx(WEIGHTS.sum() / 2 - result['expected_cut'])
+    side = [int(bit) for bit in result['bitstring']]
+    assert sum(w for (i, j), w in zip(EDGES, WEIGHTS) if side[i] != side[j]) == result['cut']
+
+
+def test_index_to_bitstring_is_in_node_order():
+    assert index_to_bitstring(0b0011, 4) == '1100'
+    assert [index_to_bitstring(i, 2) for i in range(4)] == ['00', '10', '01', '11']
+
+
+def test_sample_cut_values_accepts_indices_and_bit_matrices():
+    samples = np.arange(16)
+    expected = _brute_force_cuts(EDGES, 4, WEIGHTS)
+    np.testing.assert_allclose(sample_cut_values(samples, EDGES, WEIGHTS), expected)
+    bits = (samples[:, None] >> np.arange(4)) & 1
+    np.testing.assert_allclose(sample_cut_values(bits, EDGES), _brute_force_cuts(EDGES, 4, np.ones(5)))
+
+
+def test_cvar_averages_the_best_fraction():
+    values = np.array([1.0, 4.0, 2.0, 3.0])
+    assert cvar(values, 0.5) == pytest.approx(3.5)
+    assert cvar(values, 1.0) == pytest.approx(values.mean())
+    # Con probabilidades, el último valor de la cola solo aporta la parte que cabe en α
+    assert cvar([5.0, 1.0], 0.5, np.array([0.25, 0.75])) == pytest.approx((5 * 0.25 + 1 * 0.25) / 0.5)
+
+
+def test_cvar_mode_with_shots_keeps_the_best_sample():
+    result = solve_maxcut_qaoa(EDGES, 4, reps=1, weights=WEIGHTS, mode='cvar', alpha=0.25,
+                               shots=256, seed=7)
+    brute = _brute_force_cuts(EDGES, 4, WEIGHTS)
+    assert result['best_cut'] == brute.max()
+    side = [int(bit) for bit in result['best_bitstring']]
+    assert sum(w for (i, j), w in zip(EDGES, WEIGHTS) if side[i] != side[j]) == result['best_cut']
+    assert result['objective'] <= brute.max()
@@ -0,0 +1,62 @@
+import pytest
+
+from admission import plan_simulation
+from circuit_spec import CircuitSpecError, circuit_from_json
+from sessions import CircuitSession, SessionNotFound, SessionStore
+
+
+def _session(gates, num_qubits=1):
+    circuit = circuit_from_json({'num_qubits': num_qubits, 'num_clbits': num_qubits,
+                                 'gates': gates + [{'name': 'measure', 'qubits': list(range(num_qubits)),
+                                                    'clbits': list(range(num_qubits))}]})
+    return CircuitSession(circuit, plan_simulation(circuit))
+
+
+RY = [{'name': 'ry', 'qubits': [0], 'params': ['theta']}]
+
+
+def test_single_run_and_sweep():
+    session = _session(RY)
+    assert session.parameters == ['theta']
+    counts, batch = session.run({'theta': 'pi'}, shots=50)
+    assert not batch and counts[0].to_dict() == {'1': 50}
+    counts, batch = session.run({'theta': [0, 'pi', 'pi/2']}, shots=200)
+    assert batch and len(counts) == 3
+    assert counts[0].to_dict() == {'0': 200} and counts[1].to_dict() == {'1': 200}
+    assert 0 < counts[2]['1'] < 200
+
+
+@pytest.mark.parametrize('values', [{}, {'theta': 1, 'phi': 2}, None])
+def test_missing_or_unknown_parameters(values):
+    with pytest.raises(CircuitSpecError):
+        _session(RY).run(values, shots=10)
+
+
+def test_sweep_lists_must_have_the_same_length():
+    session = _session([{'name': 'ry', 'qubits': [0], 'params': ['a']},
+                        {'name': 'rx', 'qubits': [1], 'params': ['b']}], num_qubits=2)
+    with pytest.raises(CircuitSpecError):
+        session.run({'a': [0, 1], 'b': [0, 1, 2]}, shots=10)
+    counts, _ = session.run({'a': [0, 'pi'], 'b': [0, 0]}, shots=10)
+    assert len(counts) == 2
+
+
+def test_sweep_keeps_one_result_per_entry_when_parameters_are_dropped():
+    # rz justo antes de medir no cambia las probabilidades y la transpilación lo elimina
+    session = _session([{'name': 'rz', 'qubits': [0], 'params': ['theta']}])
+    counts, batch = session.run({'theta': [0, 1, 2]}, shots=20)
+    assert batch and [c.to_dict() for c in counts] == [{'0': 20}] * 3
+
+
+def test_store_expiry_limit_and_removal():
+    store = SessionStore(ttl=60, max_sessions=2)
+    first, second, third = (store.add(_session(RY)) for _ in range(3))
+    with pytest.raises(SessionNotFound):
+        store.get(first.id)
+    assert store.get(second.id) is second
+    store.remove(second.id)
+    with pytest.raises(SessionNotFound):
+        store.remove(second.id)
+    third.last_used -= 120
+    with pytest.raises(SessionNotFound):
+        store.get(third.id)
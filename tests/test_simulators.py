@@ -0,0 +1,103 @@
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from qiskit import QuantumCircuit
+
+from simulators import (describe_circuit, get_estimator, get_simulator, mps_truncation_report, run_circuit,
+                        select_method, simulator_options)
+
+
+def _chain(num_qubits, long_range=False, measure=True):
+    qc = QuantumCircuit(num_qubits)
+    qc.h(0)
+    for i in range(num_qubits - 1):
+        qc.cx(i, i + 1)
+    qc.t(0)
+    if long_range:
+        qc.cx(0, num_qubits - 1)
+    if measure:
+        qc.measure_all()
+    return qc
+
+
+def test_barriers_and_measurements_do_not_count_as_interactions():
+    assert describe_circuit(_chain(24))['interaction_span'] == 1
+
+
+def test_small_circuits_use_statevector():
+    assert select_method(_chain(5)) == 'statevector'
+
+
+def test_clifford_circuits_use_stabilizer():
+    qc = QuantumCircuit(50)
+    qc.h(0)
+    qc.cx(0, 49)
+    qc.measure_all()
+    assert select_method(qc) == 'stabilizer'
+
+
+@pytest.mark.parametrize('num_qubits', [24, 40])
+def test_measured_linear_chain_uses_mps_without_warning(num_qubits):
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        assert select_method(_chain(num_qubits)) == 'matrix_product_state'
+
+
+def test_wide_long_range_circuit_warns():
+    assert select_method(_chain(24, long_range=True)) == 'statevector'
+    with pytest.warns(RuntimeWarning):
+        assert select_method(_chain(40, long_range=True)) == 'matrix_product_state'
+
+
+def _entangling_layers(num_qubits, layers=4):
+    qc = QuantumCircuit(num_qubits)
+    for layer in range(layers):
+        for q in range(num_qubits):
+            qc.ry(0.3 + q, q)
+        for q in range(layer % 2, num_qubits - 1, 2):
+            qc.cx(q, q + 1)
+    qc.measure_all()
+    return qc
+
+
+def _truncations(circuit):
+    result = run_circuit(circuit, shots=10, max_bond_dimension=2).result()
+    return mps_truncation_report(result)['truncations']
+
+
+def test_mps_truncation_report():
+    assert _truncations(_chain(8)) == 0
+    assert _truncations(_entangling_layers(8)) > 0
+    assert mps_truncation_report(run_circuit(_chain(3), shots=10, method='statevector').result()) is None
+
+
+def test_concurrent_mps_runs_keep_their_own_truncations():
+    expected = {'chain': _truncations(_chain(8)), 'layers': _truncations(_entangling_layers(8))}
+    circuits = {'chain': _chain(8), 'layers': _entangling_layers(8)}
+    names = ['chain', 'layers'] * 10
+    with ThreadPoolExecutor(8) as pool:
+        observed = list(pool.map(lambda name: _truncations(circuits[name]), names))
+    assert observed == [expected[name] for name in names]
+
+
+def test_simulator_options_read_the_environment(monkeypatch):
+    monkeypatch.setenv('QSIM_MAX_PARALLEL_THREADS', '3')
+    monkeypatch.setenv('QSIM_FUSION_ENABLE', 'no')
+    monkeypatch.setenv('QSIM_PRECISION', 'single')
+    options = simulator_options()
+    assert (options['max_parallel_threads'], options['fusion_enable'], options['precision']) == (3, False, 'single')
+
+
+def test_shared_simulators_are_reused_per_configuration():
+    assert get_simulator('statevector') is get_simulator('statevector')
+    assert get_simulator('statevector') is not get_simulator('statevector', max_parallel_threads=1)
+
+
+# approximation=False (el valor por defecto) está obsoleto en Aer 0.13+
+@pytest.mark.filterwarnings('ignore::DeprecationWarning')
+def test_estimator_uses_the_shared_options(monkeypatch):
+    monkeypatch.setenv('QSIM_FUSION_THRESHOLD', '9')
+    estimator = get_estimator(max_parallel_threads=1)
+    options = estimator._backend.options
+    assert (options.fusion_threshold, options.max_parallel_threads) == (9, 1)
@@ -0,0 +1,31 @@
+import pytest
+from qiskit.circuit.library import TwoLocal
+from qiskit.quantum_info import SparsePauliOp
+from qiskit_algorithms.optimizers import COBYLA
+
+from vqe_runner import run_multistart
+
+HAMILTONIAN = SparsePauliOp(['ZZ', 'XX'], [1.0, 0.5])
+SMALL = TwoLocal(2, 'ry', 'cx', reps=1)  # 4 parámetros
+LARGE = TwoLocal(2, 'ry', 'cx', reps=2)  # 6 parámetros
+
+
+def test_rejects_points_of_the_wrong_length():
+    with pytest.raises(ValueError):
+        run_multistart(HAMILTONIAN, [('small', SMALL), ('large', LARGE)], [('COBYLA', COBYLA(maxiter=5))],
+                       initial_points=[[0.1] * 4])
+
+
+def test_rejects_missing_ansatz_in_mapping():
+    with pytest.raises(ValueError):
+        run_multistart(HAMILTONIAN, [('small', SMALL), ('large', LARGE)], [('COBYLA', COBYLA(maxiter=5))],
+                       initial_points={'small': [[0.1] * 4]})
+
+
+def test_per_ansatz_points():
+    runs, traces = run_multistart(HAMILTONIAN, [('small', SMALL), ('large', LARGE)],
+                                  [('COBYLA', COBYLA(maxiter=10))], max_workers=2,
+                                  initial_points={'small': [[0.1] * 4], 'large': [[0.2] * 6, [0.3] * 6]})
+    assert sorted(run['ansatz'] for run in runs) == ['large', 'large', 'small']
+    assert all(run['status'] == 'finished' for run in runs)
+    assert traces
@@ -0,0 +1,50 @@
+# Barrido vectorizado del paisaje de energía de un ansatz variacional
+import numpy as np
+
+from batched_statevector import compile_circuit, simulate_batch, expectation_values
+
+
+def parameter_grid(*axes):
+    """
+    Construye una malla de parámetros a partir de un eje por parámetro.
+    Devuelve un array (puntos, num_parámetros); para graficar basta con
+    energies.reshape(len(eje_0), len(eje_1), ...).
+    """
+    mesh = np.meshgrid(*axes, indexing='ij')
+    return np.stack([m.ravel() for m in mesh], axis=-1)
+
+
+def scan_energy_landscape(ansatz, hamiltonian, parameter_values, method='statevector',
+                          estimator=None, batch_size=1024):
+    """
+    Evalúa la energía <H> para miles de vectores de parámetros.
+
+    method='statevector': compila el ansatz una vez y simula lotes completos
+                          con NumPy (exacto, sin ruido de muestreo)
+    method='estimator':   agrupa los puntos en llamadas por lotes al primitivo
+                          Estimator (útil con shots o ruido)
+
+    Devuelve un array de NumPy con una energía por vector de parámetros.
+    """
+    parameter_values = np.atleast_2d(np.asarray(parameter_values, dtype=float))
+    energies = np.empty(len(parameter_values))
+
+    if method == 'statevector':
+        compiled = compile_circuit(ansatz)
+        for start in range(0, len(parameter_values), batch_size):
+            chunk = parameter_values[start:start + batch_size]
+            states = simulate_batch(compiled, chunk)
+            energies[start:start + batch_size] = expectation_values(states, hamiltonian)
+    elif method == 'estimator':
+        if estimator is None:
+            from simulators import get_estimator
+            estimator = get_estimator()
+        for start in range(0, len(parameter_values), batch_size):
+            chunk = parameter_values[start:start + batch_size]
+            # Mismo objeto circuito en cada entrada: el primitivo lo transpila una sola vez
+            job = estimator.run([ansatz] * len(chunk), [hamiltonian] * len(chunk), chunk)
+            energies[start:start + batch_size] = job.result().values
+    else:
+        raise ValueError(f"Método desconocido: {method}")
+
+    return energies
@@ -0,0 +1,167 @@
+# Ejecución paralela de VQE con múltiples puntos iniciales, optimizadores y ansatz
+import itertools
+import multiprocessing
+import queue
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+import numpy as np
+
+
+class _RunStopped(Exception):
+    """Se lanza desde el callback del VQE para detener la optimización"""
+
+
+def _init_worker():
+    """El executor global de Aer hereda un hilo muerto tras fork(): se reemplaza"""
+    from simulators import reset_job_executor
+    reset_job_executor()
+
+
+def _run_vqe_task(task, trace_queue, stop_event):
+    """Ejecuta una combinación (optimizador, punto inicial, ansatz) en un proceso hijo"""
+    from qiskit_algorithms import VQE
+
+    from simulators import get_estimator
+
+    run_id = task['run']
+    best = {'energy': np.inf, 'evals': 0}
+
+    def callback(eval_count, parameters, mean, metadata):
+        energy = float(np.real(mean))
+        best['evals'] = eval_count
+        best['energy'] = min(best['energy'], energy)
+        # Enviar la traza de convergencia al proceso principal en tiempo real
+        trace_queue.put((run_id, eval_count, energy))
+        if task['target_energy'] is not None and energy <= task['target_energy']:
+            best['status'] = 'target'
+            raise _RunStopped()
+        if stop_event.is_set():
+            best['status'] = 'cancelled'
+            raise _RunStopped()
+
+    # Un hilo por proceso: el paralelismo viene del pool, no de OpenMP
+    estimator = get_estimator(max_parallel_threads=1)
+    vqe = VQE(estimator=estimator, ansatz=task['ansatz'], optimizer=task['optimizer'],
+              initial_point=task['initial_point'], callback=callback)
+
+    start = time.perf_counter()
+    try:
+        result = vqe.compute_minimum_eigenvalue(task['hamiltonian'])
+        status = 'finished'
+        energy = float(np.real(result.eigenvalue))
+        evals = result.cost_function_evals
+    except _RunStopped:
+        status = best['status']
+        energy = best['energy']
+        evals = best['evals']
+
+    return {
+        'run': run_id,
+        'optimizer': task['optimizer_name'],
+        'ansatz': task['ansatz_name'],
+        'start': task['start'],
+        'status': status,
+        'energy': energy,
+        'evals': evals,
+        'time': time.perf_counter() - start,
+    }
+
+
+def run_multistart(hamiltonian, ansatzes, optimizers, initial_points=4, target_energy=None,
+                   max_workers=None, seed=None):
+    """
+    Lanza todas las combinaciones (optimizador, punto inicial, ansatz) en un pool de procesos.
+
+    ansatzes:       lista de (nombre, circuito) o un único circuito
+    optimizers:     lista de (nombre, optimizador), como en la comparación de optimizadores
+    initial_points: número de puntos aleatorios en [-π, π], lista explícita de puntos
+                    (común a todos los ansatz) o dict {nombre del ansatz: lista de puntos};
+                    cada punto debe tener ansatz.num_parameters valores
+    target_energy:  cuando una ejecución la alcanza, se cancelan las rezagadas
+
+    Con el método 'spawn' (Windows, macOS) el script que llama debe proteger
+    esta llamada con `if __name__ == '__main__':`.
+
+    Devuelve (runs, traces): un resumen por ejecución y la tabla de convergencia
+    con filas {'run', 'eval', 'energy'} en el orden en que llegaron.
+    """
+    if not isinstance(ansatzes, (list, tuple)):
+        ansatzes = [('ansatz', ansatzes)]
+
+    rng = np.random.default_rng(seed)
+    tasks = []
+    for (ansatz_name, ansatz), (optimizer_name, optimizer) in itertools.product(ansatzes, optimizers):
+        if isinstance(initial_points, int):
+            points = rng.uniform(-np.pi, np.pi, (initial_points, ansatz.num_parameters))
+        elif isinstance(initial_points, dict):
+            if ansatz_name not in initial_points:
+                raise ValueError(f"Faltan los puntos iniciales del ansatz {ansatz_name!r}")
+            points = initial_points[ansatz_name]
+        else:
+            points = initial_points
+        for point in points:
+            if len(point) != ansatz.num_parameters:
+                raise ValueError(f"El ansatz {ansatz_name!r} tiene {ansatz.num_parameters} parámetros "
+                                 f"y el punto inicial {len(point)} valores")
+        for start, point in enumerate(points):
+            tasks.append({
+                'run': len(tasks),
+                'ansatz_name': ansatz_name,
+                'ansatz': ansatz,
+                'optimizer_name': optimizer_name,
+                'optimizer': optimizer,
+                'initial_point': np.asarray(point, dtype=float),
+                'start': start,
+                'hamiltonian': hamiltonian,
+                'target_energy': target_energy,
+            })
+
+    runs = []
+    traces = []
+    with multiprocessing.Manager() as manager:
+        trace_queue = manager.Queue()
+        stop_event = manager.Event()
+
+        def drain():
+            while True:
+                try:
+                    run_id, eval_count, energy = trace_queue.get_nowait()
+                except queue.Empty:
+                    return
+                traces.append({'run': run_id, 'eval': eval_count, 'energy': energy})
+                if target_energy is not None and energy <= target_energy:
+                    stop_event.set()
+
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker) as pool:
+            pending = {pool.submit(_run_vqe_task, task, trace_queue, stop_event)
+                       for task in tasks}
+            while pending:
+                done, pending = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+                drain()
+                for future in done:
+                    if not future.cancelled():
+                        runs.append(future.result())
+                if stop_event.is_set():
+                    # Las tareas que aún no empezaron ni siquiera se lanzan
+                    for future in list(pending):
+                        if future.cancel():
+                            pending.discard(future)
+        drain()
+
+    reported_ids = {run['run'] for run in runs}
+    for task in tasks:
+        if task['run'] not in reported_ids:
+            runs.append({
+                'run': task['run'],
+                'optimizer': task['optimizer_name'],
+                'ansatz': task['ansatz_name'],
+                'start': task['start'],
+                'status': 'skipped',
+                'energy': np.nan,
+                'evals': 0,
+                'time': 0.0,
+            })
+
+    runs.sort(key=lambda run: run['run'])
+    return runs, traces